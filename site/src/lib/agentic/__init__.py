@@ -29,14 +29,19 @@ from .agents.pipeline import (
     process_article,
     process_article_sync,
     process_intents,
+    render_selections,
     select_template_for_intent,
+    timed_out_selection,
 )
 
 # Models
 from .models import Intent, ArticleSegmentation, TemplateSelection, TemplateInput
 
 # Config
-from .config import TEMPLATE_CATEGORIES, get_sub_categories, get_templates
+from .config import TEMPLATE_CATEGORIES, get_sub_categories, get_template_spec, get_templates
+
+# Usage
+from .utils import ArticleUsage, Deadline, get_usage_stats
 
 __all__ = [
     # Segmentation
@@ -56,7 +61,9 @@ __all__ = [
     "process_article",
     "process_article_sync",
     "process_intents",
+    "render_selections",
     "select_template_for_intent",
+    "timed_out_selection",
     # Models
     "Intent",
     "ArticleSegmentation",
@@ -65,5 +72,10 @@ __all__ = [
     # Config
     "TEMPLATE_CATEGORIES",
     "get_sub_categories",
+    "get_template_spec",
     "get_templates",
+    # Usage
+    "ArticleUsage",
+    "Deadline",
+    "get_usage_stats",
 ]
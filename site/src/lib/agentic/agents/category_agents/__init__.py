@@ -1,6 +1,6 @@
 """
 [INPUT]: 各 category agent 模块
-[OUTPUT]: 所有 category sub-agents (包括 skip_agent)
+[OUTPUT]: 所有 category sub-agents (包括 skip_agent)；AGENT_CATEGORIES（agent 名 → category）
 [POS]: agents/category_agents 包的入口
 
 [PROTOCOL]:
@@ -17,7 +17,20 @@ from .relation_agent import relation_agent
 from .sequence_agent import sequence_agent
 from .skip_agent import skip_agent
 
+# agent 名 → category（handoff 后据此确定 intent 已路由到的 category）
+AGENT_CATEGORIES = {
+    chart_agent.name: "chart",
+    comparison_agent.name: "comparison",
+    hierarchy_agent.name: "hierarchy",
+    list_agent.name: "list",
+    quadrant_agent.name: "quadrant",
+    relation_agent.name: "relation",
+    sequence_agent.name: "sequence",
+    skip_agent.name: "skip",
+}
+
 __all__ = [
+    "AGENT_CATEGORIES",
     "chart_agent",
     "comparison_agent",
     "hierarchy_agent",
@@ -1,6 +1,6 @@
 """
 [INPUT]: intent, paragraphs 从 Template Selector 传入
-[OUTPUT]: TemplateSelection - 通过调用 chart tools 返回（单次调用）
+[OUTPUT]: TemplateSelection - 通过调用 chart tools 返回（data_json 校验失败时按 ToolDataError 修正后重试）
 [POS]: agents/category_agents 的 chart 分类 agent
 
 [PROTOCOL]:
@@ -19,18 +19,23 @@ from ...tools.chart_tools import (
     chart_wordcloud,
     chart_combo,
 )
-from ...tools.common import skip_chart
-from ...utils import get_default_model, load_prompt
+from ...tools.common import skip_chart, stop_on_selection
+from ...tools.compact import apply_tool_schema_mode
+from ...utils import get_default_model, load_prompt, with_prompt_cache_key
 
 
 CHART_AGENT_INSTRUCTIONS = load_prompt("chart_agent")
 
-chart_agent = Agent(
-    name="Chart Agent",
-    handoff_description="处理数据图表类内容，如占比、趋势、数值对比、双指标组合等",
-    instructions=CHART_AGENT_INSTRUCTIONS,
-    tools=[chart_pie, chart_bar, chart_line, chart_column, chart_wordcloud, chart_combo, skip_chart],
-    tool_use_behavior="stop_on_first_tool",
-    output_type=AgentOutputSchema(TemplateSelection, strict_json_schema=False),
-    model=get_default_model(),
+chart_agent = with_prompt_cache_key(
+    Agent(
+        name="Chart Agent",
+        handoff_description="处理数据图表类内容，如占比、趋势、数值对比、双指标组合等",
+        instructions=CHART_AGENT_INSTRUCTIONS,
+        tools=apply_tool_schema_mode(
+            [chart_pie, chart_bar, chart_line, chart_column, chart_wordcloud, chart_combo, skip_chart]
+        ),
+        tool_use_behavior=stop_on_selection,
+        output_type=AgentOutputSchema(TemplateSelection, strict_json_schema=False),
+        model=get_default_model(),
+    )
 )
@@ -1,6 +1,6 @@
 """
 [INPUT]: intent, paragraphs 从 Template Selector 传入
-[OUTPUT]: TemplateSelection - 通过调用 comparison tools 返回
+[OUTPUT]: TemplateSelection - 通过调用 comparison tools 返回（data_json 校验失败时按 ToolDataError 修正后重试）
 [POS]: agents/category_agents 的 comparison 分类 agent
 
 [PROTOCOL]:
@@ -8,16 +8,18 @@
 2. 更新后必须上浮检查 category_agents/.folder.md 的描述是否仍然准确。
 """
 
-from agents import Agent
+from agents import Agent, AgentOutputSchema
 
+from ...models import TemplateSelection
 from ...tools.comparison_tools import (
     compare_binary,
     compare_hierarchy,
     compare_swot,
     compare_quadrant,
 )
-from ...tools.common import skip_comparison
-from ...utils import get_default_model
+from ...tools.common import skip_comparison, stop_on_selection
+from ...tools.compact import apply_tool_schema_mode
+from ...utils import get_default_model, with_prompt_cache_key
 
 COMPARISON_AGENT_INSTRUCTIONS = """你是对比分析专家。根据用户提供的意图和段落内容，选择最合适的对比模板类型并提取数据。
 
@@ -42,14 +44,19 @@ COMPARISON_AGENT_INSTRUCTIONS = """你是对比分析专家。根据用户提供
 
 ## 输出
 
-调用一个工具，传入 template、data、rationale。
+调用一个工具，传入 template、data_json、rationale。
 """
 
-comparison_agent = Agent(
-    name="Comparison Agent",
-    handoff_description="处理对比分析类内容，如两方对比、优劣分析、SWOT 分析等",
-    instructions=COMPARISON_AGENT_INSTRUCTIONS,
-    tools=[compare_binary, compare_hierarchy, compare_swot, compare_quadrant, skip_comparison],
-    tool_use_behavior="stop_on_first_tool",
-    model=get_default_model(),
+comparison_agent = with_prompt_cache_key(
+    Agent(
+        name="Comparison Agent",
+        handoff_description="处理对比分析类内容，如两方对比、优劣分析、SWOT 分析等",
+        instructions=COMPARISON_AGENT_INSTRUCTIONS,
+        tools=apply_tool_schema_mode(
+            [compare_binary, compare_hierarchy, compare_swot, compare_quadrant, skip_comparison]
+        ),
+        tool_use_behavior=stop_on_selection,
+        output_type=AgentOutputSchema(TemplateSelection, strict_json_schema=False),
+        model=get_default_model(),
+    )
 )
@@ -1,6 +1,6 @@
 """
 [INPUT]: intent, paragraphs 从 Template Selector 传入
-[OUTPUT]: TemplateSelection - 通过调用 hierarchy tools 返回
+[OUTPUT]: TemplateSelection - 通过调用 hierarchy tools 返回（data_json 校验失败时按 ToolDataError 修正后重试）
 [POS]: agents/category_agents 的 hierarchy 分类 agent
 
 [PROTOCOL]:
@@ -8,15 +8,17 @@
 2. 更新后必须上浮检查 category_agents/.folder.md 的描述是否仍然准确。
 """
 
-from agents import Agent
+from agents import Agent, AgentOutputSchema
 
+from ...models import TemplateSelection
 from ...tools.hierarchy_tools import (
     hierarchy_tree,
     hierarchy_mindmap,
     hierarchy_structure,
 )
-from ...tools.common import skip_hierarchy
-from ...utils import get_default_model
+from ...tools.common import skip_hierarchy, stop_on_selection
+from ...tools.compact import apply_tool_schema_mode
+from ...utils import get_default_model, with_prompt_cache_key
 
 HIERARCHY_AGENT_INSTRUCTIONS = """你是层级结构专家。根据用户提供的意图和段落内容，选择最合适的层级模板类型并提取数据。
 
@@ -48,14 +50,19 @@ HIERARCHY_AGENT_INSTRUCTIONS = """你是层级结构专家。根据用户提供
 
 ## 输出
 
-调用一个工具，传入 template、data、rationale。
+调用一个工具，传入 template、data_json、rationale。
 """
 
-hierarchy_agent = Agent(
-    name="Hierarchy Agent",
-    handoff_description="处理层级结构类内容，如组织架构、分类体系、树状关系、思维导图等",
-    instructions=HIERARCHY_AGENT_INSTRUCTIONS,
-    tools=[hierarchy_tree, hierarchy_mindmap, hierarchy_structure, skip_hierarchy],
-    tool_use_behavior="stop_on_first_tool",
-    model=get_default_model(),
+hierarchy_agent = with_prompt_cache_key(
+    Agent(
+        name="Hierarchy Agent",
+        handoff_description="处理层级结构类内容，如组织架构、分类体系、树状关系、思维导图等",
+        instructions=HIERARCHY_AGENT_INSTRUCTIONS,
+        tools=apply_tool_schema_mode(
+            [hierarchy_tree, hierarchy_mindmap, hierarchy_structure, skip_hierarchy]
+        ),
+        tool_use_behavior=stop_on_selection,
+        output_type=AgentOutputSchema(TemplateSelection, strict_json_schema=False),
+        model=get_default_model(),
+    )
 )
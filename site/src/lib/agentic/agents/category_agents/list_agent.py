@@ -1,6 +1,6 @@
 """
 [INPUT]: intent, paragraphs 从 Template Selector 传入
-[OUTPUT]: TemplateSelection - 通过调用 list tools 返回
+[OUTPUT]: TemplateSelection - 通过调用 list tools 返回（data_json 校验失败时按 ToolDataError 修正后重试）
 [POS]: agents/category_agents 的 list 分类 agent
 
 [PROTOCOL]:
@@ -8,8 +8,9 @@
 2. 更新后必须上浮检查 category_agents/.folder.md 的描述是否仍然准确。
 """
 
-from agents import Agent
+from agents import Agent, AgentOutputSchema
 
+from ...models import TemplateSelection
 from ...tools.list_tools import (
     list_column,
     list_grid,
@@ -18,8 +19,9 @@ from ...tools.list_tools import (
     list_sector,
     list_zigzag,
 )
-from ...tools.common import skip_list
-from ...utils import get_default_model
+from ...tools.common import skip_list, stop_on_selection
+from ...tools.compact import apply_tool_schema_mode
+from ...utils import get_default_model, with_prompt_cache_key
 
 LIST_AGENT_INSTRUCTIONS = """你是列表图表专家。根据用户提供的意图和段落内容，选择最合适的列表模板类型并提取数据。
 
@@ -42,11 +44,11 @@ LIST_AGENT_INSTRUCTIONS = """你是列表图表专家。根据用户提供的意
 
 ## 数据提取
 
-从段落中提取结构化数据，格式通常为：
+从段落中提取结构化数据，data_json 必须使用 lists 字段，每项必须有 label：
 ```json
 {
-  "items": [
-    {"title": "标题", "description": "描述"},
+  "lists": [
+    {"label": "标题", "desc": "描述"},
     ...
   ]
 }
@@ -56,15 +58,20 @@ LIST_AGENT_INSTRUCTIONS = """你是列表图表专家。根据用户提供的意
 
 调用一个工具，传入：
 - template: 具体模板名（从工具描述中选择）
-- data: 提取的结构化数据
+- data_json: 提取的结构化数据（JSON 字符串）
 - rationale: 选择理由
 """
 
-list_agent = Agent(
-    name="List Agent",
-    handoff_description="处理列表类内容，如步骤清单、特征列表、分类项目、并列要点等",
-    instructions=LIST_AGENT_INSTRUCTIONS,
-    tools=[list_column, list_grid, list_pyramid, list_row, list_sector, list_zigzag, skip_list],
-    tool_use_behavior="stop_on_first_tool",
-    model=get_default_model(),
+list_agent = with_prompt_cache_key(
+    Agent(
+        name="List Agent",
+        handoff_description="处理列表类内容，如步骤清单、特征列表、分类项目、并列要点等",
+        instructions=LIST_AGENT_INSTRUCTIONS,
+        tools=apply_tool_schema_mode(
+            [list_column, list_grid, list_pyramid, list_row, list_sector, list_zigzag, skip_list]
+        ),
+        tool_use_behavior=stop_on_selection,
+        output_type=AgentOutputSchema(TemplateSelection, strict_json_schema=False),
+        model=get_default_model(),
+    )
 )
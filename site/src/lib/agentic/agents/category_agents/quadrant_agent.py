@@ -1,6 +1,6 @@
 """
 [INPUT]: intent, paragraphs 从 Template Selector 传入
-[OUTPUT]: TemplateSelection - 通过调用 quadrant tools 返回
+[OUTPUT]: TemplateSelection - 通过调用 quadrant tools 返回（data_json 校验失败时按 ToolDataError 修正后重试）
 [POS]: agents/category_agents 的 quadrant 分类 agent
 
 [PROTOCOL]:
@@ -8,14 +8,16 @@
 2. 更新后必须上浮检查 category_agents/.folder.md 的描述是否仍然准确。
 """
 
-from agents import Agent
+from agents import Agent, AgentOutputSchema
 
+from ...models import TemplateSelection
 from ...tools.quadrant_tools import (
     quadrant_quarter,
     quadrant_simple,
 )
-from ...tools.common import skip_quadrant
-from ...utils import get_default_model
+from ...tools.common import skip_quadrant, stop_on_selection
+from ...tools.compact import apply_tool_schema_mode
+from ...utils import get_default_model, with_prompt_cache_key
 
 QUADRANT_AGENT_INSTRUCTIONS = """你是象限图专家。根据用户提供的意图和段落内容，选择最合适的象限模板类型并提取数据。
 
@@ -46,14 +48,17 @@ QUADRANT_AGENT_INSTRUCTIONS = """你是象限图专家。根据用户提供的
 
 ## 输出
 
-调用一个工具，传入 template、data、rationale。
+调用一个工具，传入 template、data_json、rationale。
 """
 
-quadrant_agent = Agent(
-    name="Quadrant Agent",
-    handoff_description="处理象限图类内容，如四象限分析、二维分类、矩阵定位等",
-    instructions=QUADRANT_AGENT_INSTRUCTIONS,
-    tools=[quadrant_quarter, quadrant_simple, skip_quadrant],
-    tool_use_behavior="stop_on_first_tool",
-    model=get_default_model(),
+quadrant_agent = with_prompt_cache_key(
+    Agent(
+        name="Quadrant Agent",
+        handoff_description="处理象限图类内容，如四象限分析、二维分类、矩阵定位等",
+        instructions=QUADRANT_AGENT_INSTRUCTIONS,
+        tools=apply_tool_schema_mode([quadrant_quarter, quadrant_simple, skip_quadrant]),
+        tool_use_behavior=stop_on_selection,
+        output_type=AgentOutputSchema(TemplateSelection, strict_json_schema=False),
+        model=get_default_model(),
+    )
 )
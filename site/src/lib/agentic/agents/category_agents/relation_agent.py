@@ -1,6 +1,6 @@
 """
 [INPUT]: intent, paragraphs 从 Template Selector 传入
-[OUTPUT]: TemplateSelection - 通过调用 relation tools 返回
+[OUTPUT]: TemplateSelection - 通过调用 relation tools 返回（data_json 校验失败时按 ToolDataError 修正后重试）
 [POS]: agents/category_agents 的 relation 分类 agent
 
 [PROTOCOL]:
@@ -8,14 +8,16 @@
 2. 更新后必须上浮检查 category_agents/.folder.md 的描述是否仍然准确。
 """
 
-from agents import Agent
+from agents import Agent, AgentOutputSchema
 
+from ...models import TemplateSelection
 from ...tools.relation_tools import (
     relation_dagre_flow,
     relation_circle,
 )
-from ...tools.common import skip_relation
-from ...utils import get_default_model
+from ...tools.common import skip_relation, stop_on_selection
+from ...tools.compact import apply_tool_schema_mode
+from ...utils import get_default_model, with_prompt_cache_key
 
 RELATION_AGENT_INSTRUCTIONS = """你是关系图专家。根据用户提供的意图和段落内容，选择最合适的关系模板类型并提取数据。
 
@@ -35,20 +37,23 @@ RELATION_AGENT_INSTRUCTIONS = """你是关系图专家。根据用户提供的
 ```json
 {
   "nodes": [{"id": "1", "label": "节点1"}, ...],
-  "edges": [{"source": "1", "target": "2", "label": "关系"}, ...]
+  "relations": [{"from": "1", "to": "2", "label": "关系"}, ...]
 }
 ```
 
 ## 输出
 
-调用一个工具，传入 template、data、rationale。
+调用一个工具，传入 template、data_json、rationale。
 """
 
-relation_agent = Agent(
-    name="Relation Agent",
-    handoff_description="处理关系图类内容，如流程依赖、网络关系、循环系统等",
-    instructions=RELATION_AGENT_INSTRUCTIONS,
-    tools=[relation_dagre_flow, relation_circle, skip_relation],
-    tool_use_behavior="stop_on_first_tool",
-    model=get_default_model(),
+relation_agent = with_prompt_cache_key(
+    Agent(
+        name="Relation Agent",
+        handoff_description="处理关系图类内容，如流程依赖、网络关系、循环系统等",
+        instructions=RELATION_AGENT_INSTRUCTIONS,
+        tools=apply_tool_schema_mode([relation_dagre_flow, relation_circle, skip_relation]),
+        tool_use_behavior=stop_on_selection,
+        output_type=AgentOutputSchema(TemplateSelection, strict_json_schema=False),
+        model=get_default_model(),
+    )
 )
@@ -1,6 +1,6 @@
 """
 [INPUT]: intent, paragraphs 从 Template Selector 传入
-[OUTPUT]: TemplateSelection - 通过调用 sequence tools 返回
+[OUTPUT]: TemplateSelection - 通过调用 sequence tools 返回（data_json 校验失败时按 ToolDataError 修正后重试）
 [POS]: agents/category_agents 的 sequence 分类 agent
 
 [PROTOCOL]:
@@ -8,8 +8,9 @@
 2. 更新后必须上浮检查 category_agents/.folder.md 的描述是否仍然准确。
 """
 
-from agents import Agent
+from agents import Agent, AgentOutputSchema
 
+from ...models import TemplateSelection
 from ...tools.sequence_tools import (
     sequence_stairs,
     sequence_timeline,
@@ -20,8 +21,9 @@ from ...tools.sequence_tools import (
     sequence_roadmap,
     sequence_zigzag,
 )
-from ...tools.common import skip_sequence
-from ...utils import get_default_model
+from ...tools.common import skip_sequence, stop_on_selection
+from ...tools.compact import apply_tool_schema_mode
+from ...utils import get_default_model, with_prompt_cache_key
 
 SEQUENCE_AGENT_INSTRUCTIONS = """你是时序流程专家。根据用户提供的意图和段落内容，选择最合适的时序模板类型并提取数据。
 
@@ -48,35 +50,41 @@ SEQUENCE_AGENT_INSTRUCTIONS = """你是时序流程专家。根据用户提供
 
 ## 数据格式
 
+data_json 必须使用 sequences 字段，每项必须有 label（timeline / roadmap 可加 time，funnel 的每项必须有数值 value）：
 ```json
 {
-  "steps": [
-    {"title": "步骤1", "description": "描述"},
-    {"title": "步骤2", "description": "描述"}
+  "sequences": [
+    {"label": "步骤1", "desc": "描述"},
+    {"label": "步骤2", "desc": "描述"}
   ]
 }
 ```
 
 ## 输出
 
-调用一个工具，传入 template、data、rationale。
+调用一个工具，传入 template、data_json、rationale。
 """
 
-sequence_agent = Agent(
-    name="Sequence Agent",
-    handoff_description="处理时序流程类内容，如步骤、阶段、时间线、里程碑、漏斗等",
-    instructions=SEQUENCE_AGENT_INSTRUCTIONS,
-    tools=[
-        sequence_stairs,
-        sequence_timeline,
-        sequence_steps,
-        sequence_snake,
-        sequence_circular,
-        sequence_funnel,
-        sequence_roadmap,
-        sequence_zigzag,
-        skip_sequence,
-    ],
-    tool_use_behavior="stop_on_first_tool",
-    model=get_default_model(),
+sequence_agent = with_prompt_cache_key(
+    Agent(
+        name="Sequence Agent",
+        handoff_description="处理时序流程类内容，如步骤、阶段、时间线、里程碑、漏斗等",
+        instructions=SEQUENCE_AGENT_INSTRUCTIONS,
+        tools=apply_tool_schema_mode(
+            [
+                sequence_stairs,
+                sequence_timeline,
+                sequence_steps,
+                sequence_snake,
+                sequence_circular,
+                sequence_funnel,
+                sequence_roadmap,
+                sequence_zigzag,
+                skip_sequence,
+            ]
+        ),
+        tool_use_behavior=stop_on_selection,
+        output_type=AgentOutputSchema(TemplateSelection, strict_json_schema=False),
+        model=get_default_model(),
+    )
 )
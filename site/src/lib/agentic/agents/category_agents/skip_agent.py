@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from agents import Agent, function_tool
 
-from ...utils import get_default_model
+from ...utils import get_default_model, with_prompt_cache_key
 
 
 @function_tool
@@ -51,11 +51,13 @@ SKIP_AGENT_INSTRUCTIONS = """你是内容可视化评估专家。你的任务是
 确认内容不适合可视化后，调用 skip_visualization 工具，并提供清晰的跳过原因。
 """
 
-skip_agent = Agent(
-    name="Skip Agent",
-    handoff_description="当内容不适合任何可视化方案时使用，如纯叙述性文字、引言、过渡段落等",
-    instructions=SKIP_AGENT_INSTRUCTIONS,
-    tools=[skip_visualization],
-    tool_use_behavior="stop_on_first_tool",
-    model=get_default_model(),
+skip_agent = with_prompt_cache_key(
+    Agent(
+        name="Skip Agent",
+        handoff_description="当内容不适合任何可视化方案时使用，如纯叙述性文字、引言、过渡段落等",
+        instructions=SKIP_AGENT_INSTRUCTIONS,
+        tools=[skip_visualization],
+        tool_use_behavior="stop_on_first_tool",
+        model=get_default_model(),
+    )
 )
@@ -1,7 +1,9 @@
 """
 [INPUT]: ArticleSegmentation (从 segmentation_agent 输出)
-[OUTPUT]: List[TemplateSelection] - 每个 intent 对应一个模板选择结果
-[POS]: agents/ 的流水线入口，协调整个处理流程
+[OUTPUT]: List[TemplateSelection] - 每个 intent 对应一个模板选择结果（截止时间到达时未完成的标记为 timed_out；tool 参数校验失败时模型在 MAX_SELECTION_TURNS 内修正）；ArticleUsage 记录各 agent 的 token 与延迟；format_intent_input 构造 selector 输入；render_selections 渲染 SVG（数据先经 fit_selection 按模板上限规整，生成的 DSL 再经 validate_dsl 预检，结构错误的不进入 Node.js）
+[POS]: agents/ 的流水线入口，协调整个处理流程；简单数值 chart 内容由本地规则提取（tools/chart_extractor）跳过 LLM；
+    启用 TimelineRecorder（或设置 AGENTIC_TRACE_DIR）时各阶段写入时间线，每个 intent 一条轨道；
+    AGENTIC_PROFILE=cpu|alloc 时 process_article / render_selections 输出剖析报告
 
 [PROTOCOL]:
 1. 一旦本文件逻辑变更，必须同步更新此 Header。
@@ -11,19 +13,189 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import time
-from typing import List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
 
-from agents import Runner
+from agents import RunHooks, Runner
 
+from .category_agents import AGENT_CATEGORIES
 from .template_selector import template_selector
 from .segmentation_agent import segment_article, segment_article_sync
 from ..models import ArticleSegmentation, Intent, TemplateSelection
-from ..utils import pipeline_logger
+from ..renderers import fit_selection, generate_dsl, render_to_svg_async, save_svg, validate_dsl
+from ..renderers.node_bridge import RENDER_TIMEOUT
+from ..tools.chart_extractor import extract_chart_selection
+from ..utils import (
+    ArticleUsage,
+    Deadline,
+    TimelineRecorder,
+    UsageHooks,
+    combine_hooks,
+    get_local_extractor_enabled,
+    get_recorder,
+    get_run_config,
+    get_trace_dir,
+    intent_track,
+    metrics,
+    pipeline_logger,
+    profile_stage,
+    profiled,
+    record_span,
+    run_with_deadline,
+    set_track,
+    timeline_hooks,
+    trace_span,
+    usage_stats,
+)
+
+# 截止时间前未完成的 intent 使用的 category
+TIMED_OUT_CATEGORY = "timed_out"
+
+# selector handoff + category tool 调用 + data_json 校验失败后的修正重试，超出后按 intent 错误处理
+MAX_SELECTION_TURNS = 4
+
+
+def timed_out_selection(elapsed: float) -> TemplateSelection:
+    """截止时间到达时尚未完成的 intent 的占位结果"""
+    return TemplateSelection(
+        category=TIMED_OUT_CATEGORY,
+        sub_category=None,
+        template=None,
+        data=None,
+        rationale=f"Deadline exceeded after {elapsed:.2f}s",
+    )
+
+
+def _coerce_selection(final_output: Any) -> Optional[TemplateSelection]:
+    """将 Runner 的 final_output 转换为 TemplateSelection，无法识别时返回 None"""
+    # 由于使用了 handoff + stop_on_selection，最终输出应该是 tool 返回的 TemplateSelection
+    if isinstance(final_output, TemplateSelection):
+        return final_output
+    if isinstance(final_output, dict):
+        return TemplateSelection(**final_output)
+    # 尝试从字符串解析
+    if isinstance(final_output, str):
+        # 检查是否是 skip 格式的字符串输出
+        if "category='skip'" in final_output or "sub_category=None" in final_output:
+            return TemplateSelection(
+                category="skip",
+                sub_category=None,
+                template=None,
+                data=None,
+                rationale=final_output,
+            )
+        try:
+            return TemplateSelection(**json.loads(final_output))
+        except (json.JSONDecodeError, TypeError):
+            pass
+    return None
+
+
+def _parse_final_output(
+    final_output: Any,
+    index: int,
+    duration: float,
+    tokens: Optional[Dict[str, int]] = None,
+    route: Optional["_RouteHooks"] = None,
+) -> Optional[TemplateSelection]:
+    """将 Runner 的 final_output 转换为 TemplateSelection 并记录日志"""
+    selection = _coerce_selection(final_output)
+    if selection is None:
+        pipeline_logger.intent_error(
+            index,
+            f"Unexpected output type: {type(final_output)}",
+            duration=duration,
+            tokens=tokens,
+            category=route.category if route else None,
+            template=route.template if route else None,
+        )
+    elif selection.template is None:
+        # skip 情况
+        pipeline_logger.intent_skipped(
+            index,
+            selection.rationale,
+            category=selection.category,
+            duration=duration,
+            tokens=tokens,
+        )
+    else:
+        pipeline_logger.intent_processing_complete(
+            index, selection.category, selection.template, duration, tokens=tokens
+        )
+    return selection
+
+
+def _record_selection_metrics(
+    selection: Optional[TemplateSelection], duration: float, source: str
+) -> None:
+    """按 category / template / outcome 记录 intent 的计数与延迟"""
+    if selection is None:
+        category, template, outcome = "unknown", "", "error"
+    elif selection.category == TIMED_OUT_CATEGORY:
+        category, template, outcome = TIMED_OUT_CATEGORY, "", "timed_out"
+    elif selection.template is None:
+        category, template, outcome = selection.category, "", "skipped"
+    else:
+        category, template, outcome = selection.category, selection.template, "success"
+    metrics.intents.inc(category=category, template=template, outcome=outcome)
+    metrics.selection_seconds.observe(
+        duration, category=category, template=template, outcome=outcome, source=source
+    )
+
+
+def _intent_tokens(usage: Optional[ArticleUsage], index: int) -> Optional[Dict[str, int]]:
+    """该 intent 已发生的模型调用 token 合计（用于结构化日志）"""
+    if usage is None:
+        return None
+    totals = usage.for_intent(index)
+    return {
+        "input": totals.input_tokens,
+        "output": totals.output_tokens,
+        "cached": totals.cached_tokens,
+    }
+
+
+class _RouteHooks(RunHooks):
+    """记录 intent 已路由到的 category 与最近一次 tool 调用的模板，供错误 / 超时日志归类"""
+
+    def __init__(self) -> None:
+        self.category: Optional[str] = None
+        self.template: Optional[str] = None
+
+    async def on_handoff(self, context, from_agent, to_agent) -> None:
+        self.category = AGENT_CATEGORIES.get(to_agent.name, self.category)
+
+    async def on_tool_start(self, context, agent, tool) -> None:
+        arguments = getattr(context, "tool_arguments", None)
+        if not arguments:
+            return
+        try:
+            template = json.loads(arguments).get("template")
+        except (json.JSONDecodeError, AttributeError):
+            return
+        if isinstance(template, str) and template:
+            self.template = template
+
+
+def format_intent_input(intent: Intent) -> str:
+    """
+    构造 template_selector 的输入
+
+    输入只包含本次请求的可变内容；格式说明写在 agent 的 instructions 中，
+    使 instructions + tools 构成稳定的静态前缀，可被 provider 的 prompt cache 命中。
+    """
+    paragraphs = "\n".join(p.strip() for p in intent.paragraphs if p.strip())
+    return f"## 意图\n{intent.intent.strip()}\n\n## 段落内容\n{paragraphs}"
 
 
 async def select_template_for_intent(
-    intent: Intent, index: int
+    intent: Intent,
+    index: int,
+    usage: Optional[ArticleUsage] = None,
+    deadline: Union[Deadline, float, None] = None,
+    scheduled_at: Optional[float] = None,
 ) -> Optional[TemplateSelection]:
     """
     为单个 intent 选择模板
@@ -31,95 +203,106 @@ async def select_template_for_intent(
     Args:
         intent: 意图块
         index: 意图索引
+        usage: 可选，记录 template_selector 与 category agent 每次模型调用的用量
+        deadline: 可选，Deadline 或剩余秒数；到期时取消进行中的模型请求
+        scheduled_at: 可选，任务被调度的 time.time()，用于统计排队等待时间
 
     Returns:
-        TemplateSelection 或 None（如果处理失败）
+        TemplateSelection；超时为 category="timed_out"；处理失败为 None
     """
+    deadline = Deadline.coerce(deadline)
     start_time = time.time()
+    # 每个 intent 在 process_intents 中是独立的 asyncio 任务，轨道设置只影响本任务
+    set_track(intent_track(index), f"intent {index}")
+    if scheduled_at is not None:
+        metrics.queue_wait_seconds.observe(start_time - scheduled_at, stage="selection")
+        record_span("queued", scheduled_at, start_time, cat="queue")
     pipeline_logger.intent_processing_start(index, intent.intent)
 
-    # 构造输入文本
-    input_text = f"""## 意图
-{intent.intent}
-
-## 段落内容
-{chr(10).join(intent.paragraphs)}
-"""
-
+    # 简单数值内容由本地规则直接生成 chart 数据，跳过 LLM 往返
+    if get_local_extractor_enabled():
+        with trace_span("local_extract", cat="selection") as span:
+            local = extract_chart_selection(intent)
+            span["hit"] = local is not None
+        metrics.cache_requests.inc(
+            cache="local_extractor", result="hit" if local is not None else "miss"
+        )
+        if local is not None:
+            duration = time.time() - start_time
+            pipeline_logger.intent_extracted_locally(
+                index, local.sub_category, local.template, duration
+            )
+            _record_selection_metrics(local, duration, source="local")
+            if usage is not None:
+                usage.assign_category(index, local.category)
+            return local
+
+    input_text = format_intent_input(intent)
+
+    usage_hooks = UsageHooks(usage, stage="selection", index=index) if usage is not None else None
+    route = _RouteHooks()
+    hooks = combine_hooks(usage_hooks, timeline_hooks(), route)
+    selection: Optional[TemplateSelection] = None
     try:
-        result = await Runner.run(template_selector, input_text)
-
-        # 从结果中提取 TemplateSelection
-        # 由于使用了 handoff + stop_on_first_tool，最终输出应该是 tool 的返回值
-        final_output = result.final_output
-
+        with trace_span("Runner.run", cat="selection", agent=template_selector.name):
+            result = await run_with_deadline(
+                Runner.run(
+                    template_selector,
+                    input_text,
+                    hooks=hooks,
+                    run_config=get_run_config(),
+                    max_turns=MAX_SELECTION_TURNS,
+                ),
+                deadline,
+            )
         duration = time.time() - start_time
-
-        if isinstance(final_output, TemplateSelection):
-            if final_output.template is None:
-                # skip 情况
-                pipeline_logger.intent_skipped(index, final_output.rationale)
-            else:
-                pipeline_logger.intent_processing_complete(
-                    index, final_output.category, final_output.template or "N/A", duration
-                )
-            return final_output
-        elif isinstance(final_output, dict):
-            selection = TemplateSelection(**final_output)
-            if selection.template is None:
-                pipeline_logger.intent_skipped(index, selection.rationale)
-            else:
-                pipeline_logger.intent_processing_complete(
-                    index, selection.category, selection.template or "N/A", duration
-                )
-            return selection
-        else:
-            # 尝试从字符串解析
-            import json
-
-            if isinstance(final_output, str):
-                # 检查是否是 skip 格式的字符串输出
-                if "category='skip'" in final_output or "sub_category=None" in final_output:
-                    # 解析 skip 输出
-                    pipeline_logger.intent_skipped(index, str(final_output))
-                    return TemplateSelection(
-                        category="skip",
-                        sub_category=None,
-                        template=None,
-                        data=None,
-                        rationale=str(final_output),
-                    )
-                try:
-                    data = json.loads(final_output)
-                    selection = TemplateSelection(**data)
-                    pipeline_logger.intent_processing_complete(
-                        index, selection.category, selection.template or "N/A", duration
-                    )
-                    return selection
-                except (json.JSONDecodeError, TypeError):
-                    pass
-            pipeline_logger.intent_error(index, f"Unexpected output type: {type(final_output)}")
-            return None
+        selection = _parse_final_output(
+            result.final_output, index, duration, tokens=_intent_tokens(usage, index), route=route
+        )
+    except asyncio.TimeoutError:
+        elapsed = time.time() - start_time
+        pipeline_logger.intent_timed_out(
+            index, elapsed, category=route.category, template=route.template
+        )
+        selection = timed_out_selection(elapsed)
     except Exception as e:
-        duration = time.time() - start_time
-        pipeline_logger.intent_error(index, str(e))
-        return None
+        pipeline_logger.intent_error(
+            index,
+            str(e),
+            duration=time.time() - start_time,
+            tokens=_intent_tokens(usage, index),
+            category=route.category,
+            template=route.template,
+        )
+
+    _record_selection_metrics(selection, time.time() - start_time, source="llm")
+    if usage is not None:
+        usage.assign_category(index, selection.category if selection else "error")
+    return selection
 
 
 async def process_intents(
     segmentation: ArticleSegmentation,
+    usage: Optional[ArticleUsage] = None,
+    deadline: Union[Deadline, float, None] = None,
 ) -> List[Optional[TemplateSelection]]:
     """
     并发处理所有 intent blocks
 
     Args:
         segmentation: 文章切分结果
+        usage: 可选，记录每个 intent 的模型调用用量
+        deadline: 可选，Deadline 或剩余秒数，所有 intent 共享同一截止时刻
 
     Returns:
-        每个 intent 对应的 TemplateSelection 列表（失败的为 None）
+        每个 intent 对应的 TemplateSelection 列表（失败的为 None，超时的为 timed_out）
     """
+    deadline = Deadline.coerce(deadline)
+    scheduled_at = time.time()
     tasks = [
-        select_template_for_intent(intent, i)
+        select_template_for_intent(
+            intent, i, usage=usage, deadline=deadline, scheduled_at=scheduled_at
+        )
         for i, intent in enumerate(segmentation.intents)
     ]
     results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -136,78 +319,230 @@ async def process_intents(
     return processed_results
 
 
-async def process_article(article_text: str) -> List[Optional[TemplateSelection]]:
+async def process_article(
+    article_text: str,
+    usage: Optional[ArticleUsage] = None,
+    deadline: Union[Deadline, float, None] = None,
+) -> List[Optional[TemplateSelection]]:
     """
     完整流程：切分文章 -> 并发选择模板
 
     Args:
         article_text: 文章原文
+        usage: 可选，传入后可读取本篇文章按 agent / category 聚合的用量
+        deadline: 可选，Deadline 或总时限（秒）
 
     Returns:
         每个 intent 对应的 TemplateSelection 列表
     """
-    pipeline_start = time.time()
-    pipeline_logger.start_pipeline(len(article_text))
-
-    # Step 1: 切分文章
-    seg_start = time.time()
-    pipeline_logger.segmentation_start()
-    segmentation = await segment_article(article_text)
-    seg_duration = time.time() - seg_start
-    pipeline_logger.segmentation_complete(len(segmentation.intents), seg_duration)
-
-    # Step 2: 并发处理每个 intent
-    results = await process_intents(segmentation)
-
-    # 统计结果
-    success_count = sum(1 for r in results if r is not None)
-    pipeline_duration = time.time() - pipeline_start
-    pipeline_logger.end_pipeline(len(segmentation.intents), success_count, pipeline_duration)
-
+    _, results = await process_article_with_segmentation(
+        article_text, usage=usage, deadline=deadline
+    )
     return results
 
 
-def process_article_sync(article_text: str) -> List[Optional[TemplateSelection]]:
+def process_article_sync(
+    article_text: str,
+    deadline: Optional[float] = None,
+) -> List[Optional[TemplateSelection]]:
     """
     同步版本：完整流程
 
     Args:
         article_text: 文章原文
+        deadline: 可选，总时限（秒）
 
     Returns:
         每个 intent 对应的 TemplateSelection 列表
     """
-    return asyncio.run(process_article(article_text))
+    return asyncio.run(process_article(article_text, deadline=deadline))
 
 
+@profiled("process_article")
 async def process_article_with_segmentation(
     article_text: str,
+    usage: Optional[ArticleUsage] = None,
+    deadline: Union[Deadline, float, None] = None,
 ) -> tuple[ArticleSegmentation, List[Optional[TemplateSelection]]]:
     """
     完整流程，同时返回切分结果和模板选择结果
 
+    deadline 在切分与各 intent 的模板选择之间共享：到期时取消仍在进行的模型请求，
+    已完成的 intent 正常返回，未完成的标记为 category="timed_out"。
+    切分阶段超时则没有可处理的 intent，返回空切分结果与空列表。
+
     Args:
         article_text: 文章原文
+        usage: 可选，传入后可读取本篇文章按 agent / category 聚合的用量
+        deadline: 可选，Deadline 或总时限（秒）；可继续传给 render_selections
 
     Returns:
         (切分结果, 模板选择列表)
     """
+    # 设置 AGENTIC_TRACE_DIR 且调用方未启用记录器时，为本篇文章单独记录一份时间线
+    trace_dir = get_trace_dir() if get_recorder() is None else None
+    if trace_dir is None:
+        return await _process_article_with_segmentation(article_text, usage, deadline)
+
+    recorder = TimelineRecorder()
+    with recorder:
+        try:
+            return await _process_article_with_segmentation(article_text, usage, deadline)
+        finally:
+            trace_path = recorder.save(trace_dir / f"trace-{time.time_ns()}.json")
+            pipeline_logger.trace_saved(str(trace_path))
+
+
+async def _process_article_with_segmentation(
+    article_text: str,
+    usage: Optional[ArticleUsage],
+    deadline: Union[Deadline, float, None],
+) -> tuple[ArticleSegmentation, List[Optional[TemplateSelection]]]:
+    if usage is None:
+        usage = ArticleUsage()
+    deadline = Deadline.coerce(deadline)
+
     pipeline_start = time.time()
     pipeline_logger.start_pipeline(len(article_text))
 
     # Step 1: 切分文章
     seg_start = time.time()
     pipeline_logger.segmentation_start()
-    segmentation = await segment_article(article_text)
-    seg_duration = time.time() - seg_start
-    pipeline_logger.segmentation_complete(len(segmentation.intents), seg_duration)
+    try:
+        with trace_span("segmentation", chars=len(article_text)), profile_stage("segmentation"):
+            segmentation = await run_with_deadline(
+                segment_article(article_text, usage=usage), deadline
+            )
+        seg_duration = time.time() - seg_start
+        pipeline_logger.segmentation_complete(len(segmentation.intents), seg_duration)
+        metrics.segmentation_seconds.observe(seg_duration, outcome="success")
+    except asyncio.TimeoutError:
+        seg_duration = time.time() - seg_start
+        pipeline_logger.segmentation_timed_out(seg_duration)
+        metrics.segmentation_seconds.observe(seg_duration, outcome="timed_out")
+        segmentation = ArticleSegmentation(intents=[])
+    except Exception:
+        metrics.segmentation_seconds.observe(time.time() - seg_start, outcome="error")
+        raise
 
     # Step 2: 并发处理每个 intent
-    results = await process_intents(segmentation)
+    with profile_stage("selection"):
+        results = await process_intents(segmentation, usage=usage, deadline=deadline)
 
     # 统计结果
-    success_count = sum(1 for r in results if r is not None)
+    success_count = sum(
+        1 for r in results if r is not None and r.category != TIMED_OUT_CATEGORY
+    )
     pipeline_duration = time.time() - pipeline_start
     pipeline_logger.end_pipeline(len(segmentation.intents), success_count, pipeline_duration)
+    record_span(
+        "process_article",
+        pipeline_start,
+        pipeline_start + pipeline_duration,
+        intents=len(segmentation.intents),
+        success=success_count,
+    )
+
+    # 用量汇总：写日志并累计到进程级统计
+    pipeline_logger.usage_summary(usage.summary())
+    pipeline_logger.prompt_cache_summary(
+        {name: totals.to_dict() for name, totals in usage.by_agent().items()}
+    )
+    usage_stats.record_article(usage)
 
     return segmentation, results
+
+
+@profiled("render_selections", output_dir_arg="output_dir")
+async def render_selections(
+    selections: List[Optional[TemplateSelection]],
+    output_dir: Path,
+    deadline: Union[Deadline, float, None] = None,
+) -> List[Optional[Path]]:
+    """
+    渲染模板选择结果到 SVG
+
+    Args:
+        selections: TemplateSelection 列表
+        output_dir: 输出目录
+        deadline: 可选，Deadline 或剩余秒数；到期后剩余的渲染直接跳过，
+            进行中的 Node.js 进程会被终止
+
+    Returns:
+        每个 selection 对应的 SVG 路径（跳过或失败的为 None）
+    """
+    deadline = Deadline.coerce(deadline)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    outputs: List[Optional[Path]] = []
+    scheduled_at = time.time()
+
+    for i, selection in enumerate(selections):
+        if selection is None or selection.template is None:
+            pipeline_logger.render_skipped(i, "No template selected")
+            outputs.append(None)
+            continue
+        if deadline.expired():
+            pipeline_logger.render_skipped(i, "Deadline exceeded")
+            outputs.append(None)
+            continue
+
+        render_start = time.time()
+        # 渲染串行执行，后面的 selection 需等待前面的完成
+        metrics.queue_wait_seconds.observe(render_start - scheduled_at, stage="render")
+        pipeline_logger.render_start(i, selection.template)
+        # 超出模板容量的数据先截断或换用容量更大的模板
+        selection, fit_notes = fit_selection(selection)
+        if fit_notes:
+            pipeline_logger.render_fitted(i, selection.template, fit_notes)
+        track = intent_track(i)
+        try:
+            with trace_span(
+                "generate_dsl", cat="render", track=track, template=selection.template
+            ), profile_stage(f"generate_dsl[{i}]"):
+                dsl = generate_dsl(
+                    template=selection.template,
+                    category=selection.category,
+                    data=selection.data or {},
+                )
+                # 预检：结构错误不进入 Node.js 渲染队列
+                dsl_errors = validate_dsl(dsl)
+            if dsl_errors:
+                pipeline_logger.render_error(
+                    i, f"Invalid DSL: {dsl_errors[0]}", template=selection.template
+                )
+                metrics.render_seconds.observe(
+                    time.time() - render_start, template=selection.template, outcome="invalid"
+                )
+                outputs.append(None)
+                continue
+            with trace_span("render_svg", cat="render", track=track) as span, profile_stage(
+                f"render_svg[{i}]"
+            ):
+                result = await render_to_svg_async(dsl, timeout=deadline.cap(RENDER_TIMEOUT))
+                span["success"] = result["success"]
+        except Exception as e:
+            pipeline_logger.render_error(i, str(e), template=selection.template)
+            metrics.render_seconds.observe(
+                time.time() - render_start, template=selection.template, outcome="error"
+            )
+            outputs.append(None)
+            continue
+
+        metrics.render_seconds.observe(
+            time.time() - render_start,
+            template=selection.template,
+            outcome="success" if result["success"] else "error",
+        )
+        if result["success"]:
+            svg_path = save_svg(result["svg"], output_dir / f"infographic-{i}.svg")
+            pipeline_logger.render_complete(
+                i, str(svg_path), time.time() - render_start, template=selection.template
+            )
+            outputs.append(svg_path)
+        else:
+            pipeline_logger.render_error(
+                i, result.get("error") or "Unknown error", template=selection.template
+            )
+            outputs.append(None)
+
+    return outputs
@@ -8,10 +8,22 @@
 2. 更新后必须上浮检查 agents/.folder.md 的描述是否仍然准确。
 """
 
+from __future__ import annotations
+
+from typing import Optional
+
 from agents import Agent, Runner
 
 from ..models import ArticleSegmentation
-from ..utils import get_default_model
+from ..utils import (
+    ArticleUsage,
+    UsageHooks,
+    combine_hooks,
+    get_default_model,
+    get_run_config,
+    timeline_hooks,
+    with_prompt_cache_key,
+)
 
 SEGMENTATION_INSTRUCTIONS = """你是一个文章分析专家。你的任务是将文章按照"意图"进行切分。
 
@@ -47,37 +59,54 @@ SEGMENTATION_INSTRUCTIONS = """你是一个文章分析专家。你的任务是
 
 
 # 创建 Agent 实例
-segmentation_agent = Agent(
-    name="Article Segmenter",
-    instructions=SEGMENTATION_INSTRUCTIONS,
-    output_type=ArticleSegmentation,
-    model=get_default_model(),
+segmentation_agent = with_prompt_cache_key(
+    Agent(
+        name="Article Segmenter",
+        instructions=SEGMENTATION_INSTRUCTIONS,
+        output_type=ArticleSegmentation,
+        model=get_default_model(),
+    )
 )
 
 
-async def segment_article(article_text: str) -> ArticleSegmentation:
+async def segment_article(
+    article_text: str,
+    usage: Optional[ArticleUsage] = None,
+) -> ArticleSegmentation:
     """
     将文章按意图切分
 
     Args:
         article_text: 文章原文
+        usage: 可选，记录本次模型调用的 token 与延迟
 
     Returns:
         ArticleSegmentation: 切分后的意图结构
     """
-    result = await Runner.run(segmentation_agent, article_text)
+    usage_hooks = UsageHooks(usage, stage="segmentation") if usage is not None else None
+    hooks = combine_hooks(usage_hooks, timeline_hooks())
+    result = await Runner.run(
+        segmentation_agent, article_text, hooks=hooks, run_config=get_run_config()
+    )
     return result.final_output_as(ArticleSegmentation)
 
 
-def segment_article_sync(article_text: str) -> ArticleSegmentation:
+def segment_article_sync(
+    article_text: str,
+    usage: Optional[ArticleUsage] = None,
+) -> ArticleSegmentation:
     """
     同步版本：将文章按意图切分
 
     Args:
         article_text: 文章原文
+        usage: 可选，记录本次模型调用的 token 与延迟
 
     Returns:
         ArticleSegmentation: 切分后的意图结构
     """
-    result = Runner.run_sync(segmentation_agent, article_text)
+    hooks = UsageHooks(usage, stage="segmentation") if usage is not None else None
+    result = Runner.run_sync(
+        segmentation_agent, article_text, hooks=hooks, run_config=get_run_config()
+    )
     return result.final_output_as(ArticleSegmentation)
@@ -20,7 +20,7 @@ from .category_agents import (
     sequence_agent,
     skip_agent,
 )
-from ..utils import get_default_model
+from ..utils import get_default_model, with_prompt_cache_key
 
 TEMPLATE_SELECTOR_INSTRUCTIONS = """你是图表类型选择专家。根据用户提供的意图和段落内容，决定应该使用哪种类型的图表。
 
@@ -28,6 +28,18 @@ TEMPLATE_SELECTOR_INSTRUCTIONS = """你是图表类型选择专家。根据用
 
 分析输入的意图（intent）和段落内容（paragraphs），判断最适合用哪种图表类型来可视化这些内容，然后转交给对应的专家处理。
 
+## 输入格式
+
+每次请求的用户消息只包含两部分：
+
+```
+## 意图
+<一句话描述这组段落想表达什么>
+
+## 段落内容
+<原文段落，每段一行>
+```
+
 ## 可用的图表类型
 
 1. **Chart Agent** - 数据图表
@@ -74,18 +86,20 @@ TEMPLATE_SELECTOR_INSTRUCTIONS = """你是图表类型选择专家。根据用
 转交给最合适的 Agent 处理。如果内容不适合可视化，转交给 Skip Agent。
 """
 
-template_selector = Agent(
-    name="Template Selector",
-    instructions=TEMPLATE_SELECTOR_INSTRUCTIONS,
-    handoffs=[
-        chart_agent,
-        comparison_agent,
-        hierarchy_agent,
-        list_agent,
-        quadrant_agent,
-        relation_agent,
-        sequence_agent,
-        skip_agent,
-    ],
-    model=get_default_model(),
+template_selector = with_prompt_cache_key(
+    Agent(
+        name="Template Selector",
+        instructions=TEMPLATE_SELECTOR_INSTRUCTIONS,
+        handoffs=[
+            chart_agent,
+            comparison_agent,
+            hierarchy_agent,
+            list_agent,
+            quadrant_agent,
+            relation_agent,
+            sequence_agent,
+            skip_agent,
+        ],
+        model=get_default_model(),
+    )
 )
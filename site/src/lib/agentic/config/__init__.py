@@ -1,6 +1,7 @@
 """
 [INPUT]: templates 模块
-[OUTPUT]: TEMPLATE_CATEGORIES, get_sub_categories, get_templates
+[OUTPUT]: TEMPLATE_CATEGORIES, get_sub_categories, get_templates；模板能力目录 TemplateLimits, TemplateSpec,
+    TEMPLATE_INDEX, get_template_spec, get_template_limits, describe_limits
 [POS]: config 包的入口，导出模板配置
 
 [PROTOCOL]:
@@ -8,6 +9,26 @@
 2. 更新后必须上浮检查 config/.folder.md 的描述是否仍然准确。
 """
 
-from .templates import TEMPLATE_CATEGORIES, get_sub_categories, get_templates
+from .templates import (
+    TEMPLATE_CATEGORIES,
+    TEMPLATE_INDEX,
+    TemplateLimits,
+    TemplateSpec,
+    describe_limits,
+    get_sub_categories,
+    get_template_limits,
+    get_template_spec,
+    get_templates,
+)
 
-__all__ = ["TEMPLATE_CATEGORIES", "get_sub_categories", "get_templates"]
+__all__ = [
+    "TEMPLATE_CATEGORIES",
+    "TEMPLATE_INDEX",
+    "TemplateLimits",
+    "TemplateSpec",
+    "describe_limits",
+    "get_sub_categories",
+    "get_template_limits",
+    "get_template_spec",
+    "get_templates",
+]
@@ -1,7 +1,9 @@
 """
 [INPUT]: (无外部依赖)
-[OUTPUT]: TEMPLATE_CATEGORIES - 模板分类元数据配置
-[POS]: agentic/config 的核心配置，定义所有模板分类、子分类及其描述
+[OUTPUT]: TEMPLATE_CATEGORIES - 模板分类元数据配置；TemplateLimits, TemplateSpec, TEMPLATE_LIMITS, SUB_CATEGORY_LIMITS,
+    FALLBACK_SUB_CATEGORIES, CATEGORY_ITEM_KEYS - 机器可读的模板能力目录；get_template_spec, get_template_limits,
+    describe_limits（tool 描述中的容量提示）
+[POS]: agentic/config 的核心配置，定义所有模板分类、子分类及其描述，以及每个模板的容量上限
 
 [PROTOCOL]:
 1. 一旦本文件逻辑变更，必须同步更新此 Header。
@@ -10,7 +12,8 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Any
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional, Tuple
 
 # 模板分类元数据配置
 # 结构: Category -> Sub-category -> Templates
@@ -45,6 +48,10 @@ TEMPLATE_CATEGORIES: Dict[str, Dict[str, Any]] = {
                 "description": "词云图，展示关键词频率和重要性",
                 "templates": ["chart-wordcloud", "chart-wordcloud-rotate"],
             },
+            "chart-combo": {
+                "description": "双轴组合图，柱状图+折线图展示两个不同单位的指标",
+                "templates": ["chart-combo"],
+            },
         },
     },
     "comparison": {
@@ -306,3 +313,233 @@ def get_sub_category_description(category: str, sub_category: str) -> str:
     if sub_category not in sub_cats:
         return ""
     return sub_cats[sub_category].get("description", "")
+
+
+# ============================================================
+# 模板能力目录（容量上限）
+# ============================================================
+
+
+@dataclass(frozen=True)
+class TemplateLimits:
+    """
+    模板的容量上限（None 表示不限制）
+
+    max_items 的作用对象取决于子分类 / category（见 CATEGORY_ITEM_KEYS）:
+        list / sequence / chart   顶层条目数（lists / sequences / values）
+        comparison                每个对比组的 children 数
+        quadrant                  每个象限的 items 数（compare-quadrant 同样是 quadrants[].items）
+    """
+
+    max_items: Optional[int] = None
+    max_label_length: Optional[int] = None
+    max_depth: Optional[int] = None       # hierarchy: 根节点为第 1 层
+    max_children: Optional[int] = None    # hierarchy: 每个节点的子节点数
+    max_branches: Optional[int] = None    # hierarchy: 根节点的子节点数（mindmap 分支）
+    max_nodes: Optional[int] = None       # relation: 节点数
+
+    def merged(self, base: "TemplateLimits") -> "TemplateLimits":
+        """以 base 为默认值，本对象中非 None 的字段优先"""
+        return TemplateLimits(
+            **{
+                f.name: getattr(self, f.name) if getattr(self, f.name) is not None else getattr(base, f.name)
+                for f in fields(self)
+            }
+        )
+
+
+@dataclass(frozen=True)
+class TemplateSpec:
+    """目录中的一个模板"""
+
+    name: str
+    category: str
+    sub_category: str
+    limits: TemplateLimits
+
+
+_NO_LIMITS = TemplateLimits()
+
+# 子分类级默认上限（模板未声明的字段沿用此处）
+SUB_CATEGORY_LIMITS: Dict[str, TemplateLimits] = {
+    "chart-pie": TemplateLimits(max_label_length=10),
+    "chart-bar": TemplateLimits(max_label_length=15),
+    "chart-line": TemplateLimits(max_label_length=8),
+    "chart-column": TemplateLimits(max_label_length=8),
+    "chart-wordcloud": TemplateLimits(max_label_length=10),
+    "list-grid": TemplateLimits(max_items=9),
+    "list-row": TemplateLimits(max_items=5),
+}
+
+# 模板级上限（与 tools/*_tools.py 中各模板说明一致）
+TEMPLATE_LIMITS: Dict[str, TemplateLimits] = {
+    # comparison: 每个对比组的子项数
+    "compare-binary-horizontal-arrow-simple": TemplateLimits(max_items=5),
+    "compare-binary-horizontal-arrow-underline-text": TemplateLimits(max_items=4),
+    "compare-binary-horizontal-arrow-badge-card": TemplateLimits(max_items=4),
+    "compare-binary-horizontal-arrow-compact-card": TemplateLimits(max_items=4),
+    "compare-binary-horizontal-fold-simple": TemplateLimits(max_items=5),
+    "compare-binary-horizontal-fold-underline-text": TemplateLimits(max_items=4),
+    "compare-binary-horizontal-fold-badge-card": TemplateLimits(max_items=4),
+    "compare-binary-horizontal-fold-compact-card": TemplateLimits(max_items=4),
+    "compare-binary-horizontal-vs-simple": TemplateLimits(max_items=5),
+    "compare-binary-horizontal-vs-underline-text": TemplateLimits(max_items=4),
+    "compare-binary-horizontal-vs-badge-card": TemplateLimits(max_items=4),
+    "compare-binary-horizontal-vs-compact-card": TemplateLimits(max_items=4),
+    "compare-hierarchy-left-right-simple": TemplateLimits(max_items=4),
+    "compare-hierarchy-left-right-compact-card": TemplateLimits(max_items=3),
+    "compare-hierarchy-row-simple": TemplateLimits(max_items=5),
+    "compare-hierarchy-row-compact-card": TemplateLimits(max_items=4),
+    "compare-swot": TemplateLimits(max_items=5),
+    "compare-quadrant-quarter-simple-card": TemplateLimits(max_items=4),
+    "compare-quadrant-quarter-circular": TemplateLimits(max_items=3),
+    "compare-quadrant-simple-illus": TemplateLimits(max_items=4),
+    # hierarchy
+    "hierarchy-tree-tech-style-capsule-item": TemplateLimits(max_depth=3, max_children=4),
+    "hierarchy-tree-dashed-line-rounded-rect-node": TemplateLimits(max_depth=3, max_children=4),
+    "hierarchy-tree-curved-line-compact-card": TemplateLimits(max_depth=3, max_children=3),
+    "hierarchy-tree-dashed-arrow-badge-card": TemplateLimits(max_depth=3, max_children=3),
+    "hierarchy-mindmap-branch-gradient-capsule-item": TemplateLimits(max_depth=3, max_branches=6),
+    "hierarchy-mindmap-level-gradient-rounded-rect-node": TemplateLimits(max_depth=3, max_branches=5),
+    "hierarchy-mindmap-branch-gradient-compact-card": TemplateLimits(max_depth=3, max_branches=4),
+    "hierarchy-structure": TemplateLimits(max_depth=4, max_children=5),
+    "hierarchy-structure-mirror": TemplateLimits(max_depth=4, max_children=4),
+    # list
+    "list-column-done-list": TemplateLimits(max_items=10, max_label_length=30),
+    "list-column-vertical-icon-arrow": TemplateLimits(max_items=6, max_label_length=20),
+    "list-column-simple-vertical-arrow": TemplateLimits(max_items=8, max_label_length=25),
+    "list-grid-badge-card": TemplateLimits(max_items=9, max_label_length=12),
+    "list-grid-candy-card-lite": TemplateLimits(max_items=6, max_label_length=10),
+    "list-grid-ribbon-card": TemplateLimits(max_items=6, max_label_length=12),
+    "list-row-horizontal-icon-arrow": TemplateLimits(max_items=5, max_label_length=10),
+    "list-sector-simple": TemplateLimits(max_items=6, max_label_length=15),
+    "list-zigzag-up-compact-card": TemplateLimits(max_items=6, max_label_length=15),
+    "list-zigzag-up-simple": TemplateLimits(max_items=6, max_label_length=20),
+    # quadrant: 每个象限的项数
+    "quadrant-quarter-simple-card": TemplateLimits(max_items=4),
+    "quadrant-quarter-circular": TemplateLimits(max_items=3),
+    "quadrant-simple-illus": TemplateLimits(max_items=4),
+    # relation
+    "relation-dagre-flow-tb-simple-circle-node": TemplateLimits(max_nodes=10),
+    "relation-dagre-flow-lr-simple-circle-node": TemplateLimits(max_nodes=10),
+    "relation-dagre-flow-tb-badge-card": TemplateLimits(max_nodes=8),
+    "relation-dagre-flow-lr-badge-card": TemplateLimits(max_nodes=8),
+    "relation-dagre-flow-tb-compact-card": TemplateLimits(max_nodes=8),
+    "relation-dagre-flow-lr-compact-card": TemplateLimits(max_nodes=8),
+    "relation-circle-circular-progress": TemplateLimits(max_nodes=8),
+    "relation-circle-icon-badge": TemplateLimits(max_nodes=6),
+    # sequence
+    "sequence-stairs-front-compact-card": TemplateLimits(max_items=5),
+    "sequence-stairs-front-badge-card": TemplateLimits(max_items=4),
+    "sequence-stairs-front-simple": TemplateLimits(max_items=6),
+    "sequence-timeline-simple": TemplateLimits(max_items=8),
+    "sequence-timeline-badge-card": TemplateLimits(max_items=6),
+    "sequence-timeline-compact-card": TemplateLimits(max_items=6),
+    "sequence-timeline-circular-progress": TemplateLimits(max_items=4),
+    "sequence-timeline-horizontal-icon-arrow": TemplateLimits(max_items=5),
+    "sequence-steps-simple": TemplateLimits(max_items=8),
+    "sequence-steps-compact-card": TemplateLimits(max_items=6),
+    "sequence-snake-steps-simple": TemplateLimits(max_items=10),
+    "sequence-snake-steps-badge-card": TemplateLimits(max_items=8),
+    "sequence-snake-steps-compact-card": TemplateLimits(max_items=8),
+    "sequence-circular-simple": TemplateLimits(max_items=6),
+    "sequence-circular-compact-card": TemplateLimits(max_items=5),
+    "sequence-funnel": TemplateLimits(max_items=6),
+    "sequence-roadmap-vertical-simple": TemplateLimits(max_items=8),
+    "sequence-roadmap-vertical-badge-card": TemplateLimits(max_items=6),
+    "sequence-roadmap-vertical-compact-card": TemplateLimits(max_items=6),
+    "sequence-zigzag-steps-simple": TemplateLimits(max_items=8),
+    "sequence-horizontal-zigzag-simple": TemplateLimits(max_items=6),
+    "sequence-horizontal-zigzag-compact-card": TemplateLimits(max_items=5),
+}
+
+# 超出上限时可改用的子分类（数据格式相同，容量更大）
+FALLBACK_SUB_CATEGORIES: Dict[str, str] = {
+    "list-column": "list-grid",
+    "list-row": "list-grid",
+    "list-sector": "list-grid",
+    "list-zigzag": "list-grid",
+    "list-pyramid": "list-grid",
+    "sequence-stairs": "sequence-snake",
+    "sequence-steps": "sequence-snake",
+    "sequence-circular": "sequence-snake",
+    "sequence-zigzag": "sequence-snake",
+    "relation-circle": "relation-dagre-flow",
+}
+
+# max_items 作用的数据字段: 子分类或 category -> (顶层字段, 分组内子项字段)，先按子分类查
+CATEGORY_ITEM_KEYS: Dict[str, Tuple[str, Optional[str]]] = {
+    "list": ("lists", None),
+    "sequence": ("sequences", None),
+    "chart": ("values", None),
+    "comparison": ("compares", "children"),
+    "quadrant": ("quadrants", "items"),
+    # comparison 下的四象限模板，数据与 quadrant 相同
+    "compare-quadrant": ("quadrants", "items"),
+}
+
+
+def _build_index() -> Dict[str, TemplateSpec]:
+    index: Dict[str, TemplateSpec] = {}
+    for category, meta in TEMPLATE_CATEGORIES.items():
+        for sub_category, sub_meta in meta["sub_categories"].items():
+            base = SUB_CATEGORY_LIMITS.get(sub_category, _NO_LIMITS)
+            for name in sub_meta["templates"]:
+                limits = TEMPLATE_LIMITS.get(name, _NO_LIMITS).merged(base)
+                index[name] = TemplateSpec(name, category, sub_category, limits)
+    return index
+
+
+# 模板名 → TemplateSpec（O(1) 查找 category / sub_category / limits）
+TEMPLATE_INDEX: Dict[str, TemplateSpec] = _build_index()
+
+
+def get_template_spec(template: str) -> Optional[TemplateSpec]:
+    """按模板名查找目录项，未知模板返回 None"""
+    return TEMPLATE_INDEX.get(template)
+
+
+def get_template_limits(template: str) -> TemplateLimits:
+    """按模板名查找容量上限，未知模板不限制"""
+    spec = TEMPLATE_INDEX.get(template)
+    return spec.limits if spec is not None else _NO_LIMITS
+
+
+# TemplateLimits 字段 → 描述中的提示名
+_LIMIT_HINTS = (
+    ("max_items", "maxItems"),
+    ("max_label_length", "maxLabelLength"),
+    ("max_branches", "maxBranches"),
+    ("max_depth", "maxDepth"),
+    ("max_children", "maxChildren"),
+    ("max_nodes", "maxNodes"),
+)
+
+# max_items 不是顶层条目数的 category / 子分类（见 CATEGORY_ITEM_KEYS），子分类优先
+_ITEM_SCOPES = {
+    "comparison": "每组 ",
+    "quadrant": "每象限 ",
+    "compare-swot": "每维度 ",
+    "compare-quadrant": "每象限 ",
+}
+
+
+def describe_limits(template: str) -> str:
+    """模板容量上限的提示文本（如 "每组 maxItems=4"），未知模板或不限制时返回空字符串
+
+    verbose 与 compact 两种 tool 描述都由此生成，提示与 fit_selection 使用的上限不会分叉。
+    """
+    spec = TEMPLATE_INDEX.get(template)
+    if spec is None:
+        return ""
+    parts = []
+    for attr, hint in _LIMIT_HINTS:
+        value = getattr(spec.limits, attr)
+        if value is not None:
+            scope = (
+                _ITEM_SCOPES.get(spec.sub_category, _ITEM_SCOPES.get(spec.category, ""))
+                if attr == "max_items"
+                else ""
+            )
+            parts.append(f"{scope}{hint}={value}")
+    return ", ".join(parts)
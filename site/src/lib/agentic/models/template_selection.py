@@ -19,9 +19,10 @@ class TemplateSelection(BaseModel):
     """模板选择结果，包含选定的模板和填充数据
 
     当 category='skip' 时，sub_category/template/data 可以为 None
+    当 category='timed_out' 时，表示该 intent 在截止时间前未完成，同样不含模板
     """
 
-    category: str = Field(description="图表大类，如 chart, list, sequence, skip 等")
+    category: str = Field(description="图表大类，如 chart, list, sequence, skip, timed_out 等")
     sub_category: Optional[str] = Field(
         description="子分类，如 chart-pie, list-column 等。skip 时为 None",
         default=None,
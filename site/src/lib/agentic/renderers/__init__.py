@@ -1,6 +1,7 @@
 """
-[INPUT]: dsl_generator, node_bridge 模块
-[OUTPUT]: generate_dsl, render_to_svg 函数
+[INPUT]: dsl_generator, dsl_parser, data_fitter, graph_normalizer, node_bridge 模块
+[OUTPUT]: generate_dsl, generate_dsl_many, iter_dsl_lines, write_dsl, write_dsl_stream, read_dsl_stream, parse_dsl, validate_dsl, fit_selection, normalize_graph, render_to_svg, render_to_svg_async 函数；
+    ParsedDSL, DSLError, DSLParseError, GraphReport
 [POS]: renderers 包的入口，导出渲染相关函数
 
 [PROTOCOL]:
@@ -8,11 +9,35 @@
 2. 更新后必须上浮检查 renderers/.folder.md 的描述是否仍然准确。
 """
 
-from .dsl_generator import generate_dsl
-from .node_bridge import render_to_svg, save_svg
+from .data_fitter import fit_selection
+from .dsl_generator import (
+    generate_dsl,
+    generate_dsl_many,
+    iter_dsl_lines,
+    read_dsl_stream,
+    write_dsl,
+    write_dsl_stream,
+)
+from .dsl_parser import DSLError, DSLParseError, ParsedDSL, parse_dsl, validate_dsl
+from .graph_normalizer import GraphReport, normalize_graph
+from .node_bridge import render_to_svg, render_to_svg_async, save_svg
 
 __all__ = [
+    "fit_selection",
+    "normalize_graph",
+    "GraphReport",
     "generate_dsl",
+    "generate_dsl_many",
+    "iter_dsl_lines",
+    "write_dsl",
+    "write_dsl_stream",
+    "read_dsl_stream",
+    "parse_dsl",
+    "validate_dsl",
+    "ParsedDSL",
+    "DSLError",
+    "DSLParseError",
     "render_to_svg",
+    "render_to_svg_async",
     "save_svg",
 ]
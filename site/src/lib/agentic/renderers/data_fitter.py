@@ -0,0 +1,280 @@
+"""
+[INPUT]: TemplateSelection；config.templates 的模板能力目录（TemplateLimits / FALLBACK_SUB_CATEGORIES）；graph_normalizer
+[OUTPUT]: fit_selection → (符合模板上限的 TemplateSelection, 调整说明列表)；truncate_label
+[POS]: renderers 的数据规整步骤，在 generate_dsl 之前执行，超出模板容量的数据不再进入 Node.js 渲染
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 renderers/.folder.md 的描述是否仍然准确。
+
+规整顺序:
+    1. 按目录修正 category / sub_category（以模板名为准）
+    2. 顶层条目数超过 max_items 时，先在 FALLBACK_SUB_CATEGORIES 指定的子分类中找容量足够的模板
+       （优先风格后缀相同的，如 list-column-done-list → list-grid-done-list），找不到再截断
+    3. 分组内子项（comparison children / quadrant items）按 max_items 截断
+    4. hierarchy 按 max_depth / max_branches / max_children 剪枝（显式栈，不受树深度限制）
+    5. relation 经 graph_normalizer 规整：节点去重、按 max_nodes 保留前 N 个、自动创建被引用但缺失的节点，
+       丢弃自环 / 重复边 / 端点被删的关系；有向流程模板额外报告环
+    6. label 超过 max_label_length 时截断并以 "…" 结尾
+
+输入的 selection 不会被修改；无需调整时原样返回同一对象。
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from ..config.templates import (
+    CATEGORY_ITEM_KEYS,
+    FALLBACK_SUB_CATEGORIES,
+    TEMPLATE_CATEGORIES,
+    TemplateLimits,
+    TemplateSpec,
+    get_template_spec,
+)
+
+from .graph_normalizer import normalize_graph
+
+if TYPE_CHECKING:
+    from ..models import TemplateSelection
+
+ELLIPSIS = "…"
+
+# 有向流程布局的子分类：关系图中的环会被报告
+FLOW_SUB_CATEGORIES = frozenset(("relation-dagre-flow",))
+
+
+def truncate_label(text: str, max_length: Optional[int]) -> str:
+    """超过 max_length 的文本截断为 max_length 个字符（含结尾的省略号）"""
+    if max_length is None or len(text) <= max_length:
+        return text
+    return text[: max(max_length - 1, 0)] + ELLIPSIS
+
+
+def _suffix_score(a: str, b: str) -> int:
+    """两个模板名末尾相同的 "-" 分段数"""
+    score = 0
+    for x, y in zip(reversed(a.split("-")), reversed(b.split("-"))):
+        if x != y:
+            break
+        score += 1
+    return score
+
+
+def _capacity(spec: TemplateSpec) -> Optional[int]:
+    """决定是否回退的容量：relation 看节点数，其余看顶层条目数"""
+    return spec.limits.max_nodes if spec.category == "relation" else spec.limits.max_items
+
+
+def _fallback_template(spec: TemplateSpec, count: int) -> Optional[TemplateSpec]:
+    """
+    在回退子分类中找容量更大的模板
+
+    优先容量 ≥ count 且风格后缀相同的；都放不下时取容量最大的（仍需截断，但保留更多条目）。
+    回退子分类的容量不大于当前模板时返回 None。
+    """
+    target = FALLBACK_SUB_CATEGORIES.get(spec.sub_category)
+    if target is None:
+        return None
+    current = _capacity(spec)
+    best: Optional[TemplateSpec] = None
+    best_rank: Tuple[int, float, int] = (0, 0.0, -1)
+    for name in TEMPLATE_CATEGORIES[spec.category]["sub_categories"][target]["templates"]:
+        candidate = get_template_spec(name)
+        if candidate is None:
+            continue
+        capacity = _capacity(candidate)
+        if current is not None and capacity is not None and capacity <= current:
+            continue
+        fits = capacity is None or capacity >= count
+        # 放得下的优先；放不下时容量越大越好；同等条件下风格后缀相同的优先
+        rank = (int(fits), 0.0 if fits else float(capacity or 0), _suffix_score(spec.name, name))
+        if best is None or rank > best_rank:
+            best, best_rank = candidate, rank
+    return best
+
+
+class _Fitter:
+    """按一个模板的上限规整数据，并统计被截断的 label 数"""
+
+    def __init__(self, limits: TemplateLimits) -> None:
+        self.limits = limits
+        self.truncated_labels = 0
+
+    def label(self, item: Any) -> Any:
+        """截断条目的 label（对象条目）或文本本身（字符串条目）"""
+        max_length = self.limits.max_label_length
+        if max_length is None:
+            return item
+        if isinstance(item, str):
+            if len(item) > max_length:
+                self.truncated_labels += 1
+                return truncate_label(item, max_length)
+        elif isinstance(item, dict):
+            label = item.get("label")
+            if isinstance(label, str) and len(label) > max_length:
+                self.truncated_labels += 1
+                return {**item, "label": truncate_label(label, max_length)}
+        return item
+
+    def items(self, items: List[Any]) -> List[Any]:
+        if self.limits.max_items is not None:
+            items = items[: self.limits.max_items]
+        return [self.label(item) for item in items]
+
+    def groups(self, groups: List[Any], child_key: str) -> Tuple[List[Any], int]:
+        """分组内子项截断，返回 (新分组列表, 被删除的子项数)"""
+        fitted: List[Any] = []
+        dropped = 0
+        for group in groups:
+            if isinstance(group, dict) and isinstance(group.get(child_key), list):
+                children = group[child_key]
+                kept = self.items(children)
+                dropped += len(children) - len(kept)
+                group = {**group, child_key: kept}
+            fitted.append(self.label(group))
+        return fitted, dropped
+
+    def tree(self, root: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
+        """按深度 / 分支 / 子节点数剪枝，返回 (新根节点, 被删除的节点数)"""
+        limits = self.limits
+        dropped = 0
+        new_root = dict(self.label(root))
+        stack: List[Tuple[Dict[str, Any], int]] = [(new_root, 1)]
+        while stack:
+            node, depth = stack.pop()
+            children = node.get("children")
+            if not isinstance(children, list) or not children:
+                continue
+            cap = limits.max_branches if depth == 1 and limits.max_branches is not None else limits.max_children
+            if limits.max_depth is not None and depth >= limits.max_depth:
+                cap = 0
+            kept = children if cap is None else children[:cap]
+            for removed in children[len(kept):]:
+                dropped += _subtree_size(removed)
+            new_children = []
+            for child in kept:
+                if isinstance(child, dict):
+                    child = dict(self.label(child))
+                    stack.append((child, depth + 1))
+                new_children.append(child)
+            if new_children:
+                node["children"] = new_children
+            else:
+                node.pop("children", None)
+        return new_root, dropped
+
+    def graph(self, data: Dict[str, Any], flow: bool) -> Tuple[Dict[str, Any], List[str]]:
+        """按 graph_normalizer 规整节点与关系，返回 (新 data, 调整说明)"""
+        fitted, report = normalize_graph(data, max_nodes=self.limits.max_nodes, detect_cycles=flow)
+        nodes = fitted.get("nodes")
+        if isinstance(nodes, list):
+            labelled = []
+            changed = False
+            for node in nodes:
+                new = self.label(node)
+                if new is not node:
+                    changed = True
+                    # 关系可能以 label 引用节点：截断 label 时用原 label 作为 id
+                    if isinstance(node, dict) and node.get("id") is None:
+                        new = {"id": node.get("label"), **new}
+                labelled.append(new)
+            if changed:
+                fitted = {**fitted, "nodes": labelled}
+        return fitted, report.notes(self.limits.max_nodes)
+
+
+def _graph_size(data: Dict[str, Any]) -> int:
+    """节点数（没有 nodes 时按关系端点计）"""
+    nodes = data.get("nodes")
+    if isinstance(nodes, list) and nodes:
+        return len(nodes)
+    relations = data.get("relations")
+    if not isinstance(relations, list):
+        return 0
+    return len({r.get(end) for r in relations if isinstance(r, dict) for end in ("from", "to")})
+
+
+def _subtree_size(node: Any) -> int:
+    size = 0
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        size += 1
+        children = current.get("children") if isinstance(current, dict) else None
+        if isinstance(children, list):
+            stack.extend(children)
+    return size
+
+
+def fit_selection(selection: "TemplateSelection") -> Tuple["TemplateSelection", List[str]]:
+    """
+    按模板能力目录规整 selection
+
+    Returns:
+        (规整后的 selection, 调整说明列表)；未知模板或无需调整时返回原对象与空列表
+    """
+    if selection.template is None or not isinstance(selection.data, dict):
+        return selection, []
+    spec = get_template_spec(selection.template)
+    if spec is None:
+        return selection, []
+
+    notes: List[str] = []
+    data = selection.data
+    if (selection.category, selection.sub_category) != (spec.category, spec.sub_category):
+        notes.append(f"category {selection.category}/{selection.sub_category} -> {spec.category}/{spec.sub_category}")
+
+    item_key, child_key = CATEGORY_ITEM_KEYS.get(spec.sub_category) or CATEGORY_ITEM_KEYS.get(
+        spec.category, (None, None)
+    )
+    items = data.get(item_key) if item_key else None
+    if spec.category == "relation":
+        count, field = _graph_size(data), "nodes"
+    elif isinstance(items, list) and child_key is None:
+        count, field = len(items), item_key
+    else:
+        count, field = 0, ""
+    limit = _capacity(spec)
+    if limit is not None and count > limit:
+        fallback = _fallback_template(spec, count)
+        if fallback is not None:
+            notes.append(f"{field}: {count} > {limit}, template -> {fallback.name}")
+            spec = fallback
+
+    fitter = _Fitter(spec.limits)
+    if isinstance(items, list):
+        if child_key is None:
+            fitted = fitter.items(items)
+            if len(fitted) < len(items):
+                notes.append(f"{item_key}: truncated {len(items)} -> {len(fitted)} items")
+            data = {**data, item_key: fitted}
+        else:
+            groups, dropped = fitter.groups(items, child_key)
+            if dropped:
+                notes.append(f"{item_key}: dropped {dropped} {child_key} over {spec.limits.max_items} per group")
+            data = {**data, item_key: groups}
+    if spec.category == "hierarchy" and isinstance(data.get("root"), dict):
+        root, dropped = fitter.tree(data["root"])
+        if dropped:
+            notes.append(f"root: pruned {dropped} nodes")
+        data = {**data, "root": root}
+    if spec.category == "relation":
+        data, graph_notes = fitter.graph(data, flow=spec.sub_category in FLOW_SUB_CATEGORIES)
+        notes.extend(graph_notes)
+    if fitter.truncated_labels:
+        notes.append(f"labels: truncated {fitter.truncated_labels} to {spec.limits.max_label_length} characters")
+
+    if not notes:
+        return selection, []
+    return (
+        selection.model_copy(
+            update={
+                "category": spec.category,
+                "sub_category": spec.sub_category,
+                "template": spec.name,
+                "data": data,
+            }
+        ),
+        notes,
+    )
@@ -1,12 +1,28 @@
 """
 [INPUT]: TemplateSelection (template, data, category)
-[OUTPUT]: DSL 语法字符串
+[OUTPUT]: DSL 语法字符串（generate_dsl），逐行生成器（iter_dsl_lines），流式写入文本流（write_dsl）；
+    批量生成（generate_dsl_many）与长度前缀的批量流（write_dsl_stream / read_dsl_stream）
 [POS]: 将 Python 数据结构转换为 @antv/infographic DSL 格式（按官方 DataSchema）
 
 [PROTOCOL]:
 1. 一旦本文件逻辑变更，必须同步更新此 Header。
 2. 更新后必须上浮检查 renderers/.folder.md 的描述是否仍然准确。
 
+两种发射方式输出逐字节一致:
+    解释模式   _generate_data_block: 每个对象重新计算 key 顺序与 inline key
+    编译模式   _emit_data_block_compiled（默认）: 按 (模板, 数据 key 集合) 与每个列表项的 key 元组
+              编译发射计划并缓存，应用到新数据时只做类型分派；root / children 树用显式栈发射，
+              不受递归上限约束
+
+全部 value 都为空（""、None、{}）的嵌套 dict 与空值一样整体跳过，不输出没有 block 的 key 行。
+
+大数据量（数百词的词云、大型关系图）可用 iter_dsl_lines / write_dsl 直接写入文件或渲染进程 stdin，
+不在内存中拼出完整文本。
+
+批量导出用 generate_dsl_many：theme 块每批只构造一次，发射计划在批内（及跨批）复用，输出与逐个调用
+generate_dsl 逐字节一致。write_dsl_stream 把一批 DSL 写成一个长度前缀流，供批量渲染进程一次读入:
+    <UTF-8 字节数>\n<DSL>\n        每个 selection 一帧，顺序与输入一致；没有模板的 selection 写长度 0 的空帧
+
 DSL 格式示例:
 ```
 infographic chart-bar-plain-text
@@ -22,10 +38,13 @@ theme
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 
 from ..config.palette import AI_COLOR_PALETTE
 
+if TYPE_CHECKING:
+    from ..models import TemplateSelection
+
 DATA_KEY_ORDER = [
     "title",
     "desc",
@@ -99,6 +118,7 @@ def generate_dsl(
     data: Dict[str, Any],
     title: Optional[str] = None,
     desc: Optional[str] = None,
+    compiled: bool = True,
 ) -> str:
     """将 TemplateSelection 数据转换为 DSL 语法字符串
 
@@ -108,26 +128,164 @@ def generate_dsl(
         data: 填充数据，结构取决于 category
         title: 可选标题
         desc: 可选描述
+        compiled: 使用按数据形状缓存的发射计划（输出与逐项解释的发射器逐字节一致）
 
     Returns:
         DSL 语法字符串
     """
-    # chart-combo 需要 values 占位字段以通过 isCompleteParsedInfographicOptions() 检查
-    if template == "chart-combo" and "values" not in data:
-        data = {**data, "values": [{"label": "placeholder", "value": 0}]}
+    data = _with_placeholders(template, data)
 
     lines = [f"infographic {template}"]
     lines.append("data")
-    lines.extend(_generate_data_block(data, title=title, desc=desc))
-
-    # 添加 theme
-    lines.append("theme")
-    palette_colors = list(AI_COLOR_PALETTE["primary"].values())
-    lines.append(f"  palette {' '.join(palette_colors)}")
+    if compiled:
+        _emit_data_block_compiled(lines.append, template, data, title=title, desc=desc)
+    else:
+        lines.extend(_generate_data_block(data, title=title, desc=desc))
+    lines.extend(_theme_lines())
 
     return "\n".join(lines)
 
 
+def iter_dsl_lines(
+    selection: TemplateSelection,
+    title: Optional[str] = None,
+    desc: Optional[str] = None,
+) -> Iterator[str]:
+    """逐行生成 selection 的 DSL（不含换行符），"\n".join 后与 generate_dsl 逐字节一致
+
+    顶层列表逐项发射、root 树按显式栈逐行发射，任一时刻只缓冲一个列表项（或一个非树嵌套值）的行，
+    内存占用与条目数无关。
+
+    Raises:
+        ValueError: selection 没有选定模板（skip / timed_out）
+    """
+    if selection.template is None:
+        raise ValueError(f"Selection has no template (category={selection.category})")
+    template = selection.template
+    data = _with_placeholders(template, selection.data or {})
+
+    yield f"infographic {template}"
+    yield "data"
+    yield from _title_lines(data, title, desc)
+
+    buffer: List[str] = []
+    emit = buffer.append
+    for key in _data_plan(template, data):
+        value = data[key]
+        if key == "root" and isinstance(value, dict) and value:
+            yield "  root"
+            for _ in _walk_tree(emit, _root_frame(value, 4)):
+                yield from buffer
+                buffer.clear()
+            yield from buffer
+            buffer.clear()
+        elif isinstance(value, list) and value:
+            yield f"  {key}"
+            for item in value:
+                _emit_list_compiled(emit, key, (item,), 4)
+                yield from buffer
+                buffer.clear()
+        else:
+            _emit_value_compiled(emit, key, value, 2)
+            yield from buffer
+            buffer.clear()
+
+    yield from _theme_lines()
+
+
+def write_dsl(
+    selection: TemplateSelection,
+    fp: TextIO,
+    title: Optional[str] = None,
+    desc: Optional[str] = None,
+) -> int:
+    """把 selection 的 DSL 流式写入文本流（文件、管道、socket.makefile、子进程 stdin）
+
+    写出的内容与 generate_dsl 的返回值逐字节一致（行间以 "\n" 分隔，末尾无换行）。
+
+    Returns:
+        写出的字符数
+    """
+    written = 0
+    separator = ""
+    for line in iter_dsl_lines(selection, title=title, desc=desc):
+        written += fp.write(separator + line)
+        separator = "\n"
+    return written
+
+
+def generate_dsl_many(
+    selections: Iterable[TemplateSelection],
+    compiled: bool = True,
+) -> List[Optional[str]]:
+    """批量生成 DSL，theme 块每批只构造一次
+
+    Returns:
+        与输入顺序一致的 DSL 列表，等于逐个调用 generate_dsl(s.template, s.category, s.data or {})；
+        没有模板的 selection（skip / timed_out）对应 None
+    """
+    theme = "\n" + "\n".join(_theme_lines())
+    results: List[Optional[str]] = []
+    for selection in selections:
+        template = selection.template
+        if template is None:
+            results.append(None)
+            continue
+        data = _with_placeholders(template, selection.data or {})
+        lines = [f"infographic {template}", "data"]
+        if compiled:
+            _emit_data_block_compiled(lines.append, template, data)
+        else:
+            lines.extend(_generate_data_block(data))
+        results.append("\n".join(lines) + theme)
+    return results
+
+
+def write_dsl_stream(selections: Iterable[TemplateSelection], fp: BinaryIO) -> int:
+    """把一批 selection 的 DSL 写成长度前缀流（每帧 b"<字节数>\\n<DSL>\\n"）
+
+    Returns:
+        写出的字节数
+    """
+    written = 0
+    for dsl in generate_dsl_many(selections):
+        payload = dsl.encode("utf-8") if dsl is not None else b""
+        written += fp.write(b"%d\n%s\n" % (len(payload), payload))
+    return written
+
+
+def read_dsl_stream(fp: BinaryIO) -> Iterator[Optional[str]]:
+    """逐帧读取 write_dsl_stream 的输出，空帧为 None
+
+    Raises:
+        ValueError: 长度前缀非法或流在帧中间结束
+    """
+    while True:
+        header = fp.readline()
+        if not header:
+            return
+        try:
+            size = int(header)
+        except ValueError:
+            raise ValueError(f"Invalid DSL stream frame header: {header[:40]!r}") from None
+        payload = fp.read(size + 1)
+        if len(payload) != size + 1 or payload[-1:] != b"\n":
+            raise ValueError("Truncated DSL stream frame")
+        yield payload[:-1].decode("utf-8") if size else None
+
+
+def _with_placeholders(template: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    # chart-combo 需要 values 占位字段以通过 isCompleteParsedInfographicOptions() 检查
+    if template == "chart-combo" and "values" not in data:
+        return {**data, "values": [{"label": "placeholder", "value": 0}]}
+    return data
+
+
+def _theme_lines() -> List[str]:
+    palette_colors = list(AI_COLOR_PALETTE["primary"].values())
+    return ["theme", f"  palette {' '.join(palette_colors)}"]
+
+
 def _escape_value(value: str) -> str:
     """转义 DSL 值中的特殊字符"""
     if not value:
@@ -169,7 +327,7 @@ def _emit_key_value(
     value: Any,
     indent: int,
 ) -> None:
-    if _is_empty(value):
+    if _is_blank(value):
         return
 
     prefix = " " * indent
@@ -285,6 +443,13 @@ def _is_empty(value: Any) -> bool:
     return False
 
 
+def _is_blank(value: Any) -> bool:
+    """不发射任何行的值：空值，或全部 value 都为空的 dict（否则只剩一行没有 block 的 key）"""
+    if isinstance(value, dict):
+        return all(_is_blank(v) for v in value.values())
+    return _is_empty(value)
+
+
 def _is_scalar(value: Any) -> bool:
     return isinstance(value, (str, int, float, bool))
 
@@ -314,3 +479,332 @@ def _ordered_keys(obj: Dict[str, Any], preferred: Optional[List[str]]) -> List[s
     ordered = [key for key in preferred if key in obj]
     ordered.extend([key for key in keys if key not in ordered])
     return ordered
+
+
+# ============================================================
+# 编译模式：按数据形状缓存的发射计划
+# ============================================================
+
+# 每类计划缓存的形状数上限，超出后清空（正常数据只有少量形状）
+_PLAN_CACHE_SIZE = 1024
+
+Emit = Callable[[str], None]
+
+
+def _cache_put(cache: Dict[Any, Any], key: Any, plan: Any) -> Any:
+    if len(cache) >= _PLAN_CACHE_SIZE:
+        cache.clear()
+    cache[key] = plan
+    return plan
+
+
+def _fast_scalar(value: Any) -> str:
+    """_format_scalar 的快速路径（精确类型），其他类型回退到 _format_scalar"""
+    t = type(value)
+    if t is str:
+        return value.replace("\n", " ").replace("\r", "").strip()
+    if t is int or t is float:
+        return str(value)
+    return _format_scalar(value)
+
+
+def _inline_candidate(value: Any) -> bool:
+    """等价于 _is_scalar(value) and not _is_empty(value)"""
+    t = type(value)
+    if t is str:
+        return bool(value.strip())
+    if t is int or t is float or t is bool:
+        return True
+    return _is_scalar(value) and not _is_empty(value)
+
+
+class _ItemContext:
+    """列表项（带 "- " 前缀的对象）的发射上下文：inline key 偏好与子 key 顺序
+
+    plans 按项的 key 元组缓存 (inline 候选顺序, 子 key 发射顺序, 是否可写成 from -> to)。
+    """
+
+    __slots__ = ("prefs", "order", "relations", "plans")
+
+    def __init__(self, prefs: List[str], order: List[str], relations: bool = False) -> None:
+        self.prefs = tuple(prefs)
+        self.order = order
+        self.relations = relations
+        self.plans: Dict[Tuple[str, ...], Tuple[Tuple[str, ...], Tuple[str, ...], bool]] = {}
+
+    def plan(self, shape: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Tuple[str, ...], bool]:
+        plan = self.plans.get(shape)
+        if plan is None:
+            candidates = [key for key in self.prefs if key in shape]
+            candidates.extend(key for key in shape if key not in candidates)
+            arrow = self.relations and len(shape) == 2 and set(shape) == {"from", "to"}
+            plan = _cache_put(
+                self.plans,
+                shape,
+                (tuple(candidates), tuple(_ordered_keys(dict.fromkeys(shape), self.order)), arrow),
+            )
+        return plan
+
+
+_ITEM_CONTEXTS: Dict[str, _ItemContext] = {
+    key: _ItemContext(prefs, ITEM_KEY_ORDER) for key, prefs in INLINE_KEY_PREFS.items()
+}
+_RELATION_CONTEXT = _ItemContext(["from", "id", "label"], RELATION_KEY_ORDER, relations=True)
+
+# root 对象（非列表项）按 ITEM_KEY_ORDER 的 key 顺序缓存
+_OBJECT_PLANS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+# 数据块顶层计划: (模板, 数据 key 元组) -> 按 DATA_KEY_ORDER 排列的 key
+_DATA_PLANS: Dict[Tuple[str, Tuple[str, ...]], Tuple[str, ...]] = {}
+
+
+def _data_plan(template: str, data: Dict[str, Any]) -> Tuple[str, ...]:
+    shape = (template, tuple(data))
+    keys = _DATA_PLANS.get(shape)
+    if keys is None:
+        keys = _cache_put(
+            _DATA_PLANS,
+            shape,
+            tuple(key for key in DATA_KEY_ORDER if key not in ("title", "desc") and key in data),
+        )
+    return keys
+
+
+def _title_lines(data: Dict[str, Any], title: Optional[str], desc: Optional[str]) -> List[str]:
+    lines: List[str] = []
+    effective_title = title if title is not None else data.get("title")
+    effective_desc = desc if desc is not None else data.get("desc")
+    if effective_title:
+        lines.append(f"  title {_format_scalar(effective_title)}")
+    if effective_desc:
+        lines.append(f"  desc {_format_scalar(effective_desc)}")
+    return lines
+
+
+def _emit_data_block_compiled(
+    emit: Emit,
+    template: str,
+    data: Dict[str, Any],
+    title: Optional[str] = None,
+    desc: Optional[str] = None,
+) -> None:
+    """_generate_data_block 的编译版本"""
+    for line in _title_lines(data, title, desc):
+        emit(line)
+    for key in _data_plan(template, data):
+        _emit_value_compiled(emit, key, data[key], 2)
+
+
+def _emit_value_compiled(emit: Emit, key: str, value: Any, indent: int) -> None:
+    """_emit_key_value 的编译版本；root / children 子树交给显式栈发射器"""
+    if _is_blank(value):
+        return
+    prefix = " " * indent
+    if isinstance(value, list):
+        emit(f"{prefix}{key}")
+        if key == "children":
+            _drain(_walk_tree(emit, _children_frame(value, indent + 2)))
+        else:
+            _emit_list_compiled(emit, key, value, indent + 2)
+    elif isinstance(value, dict):
+        emit(f"{prefix}{key}")
+        if key == "root":
+            _drain(_walk_tree(emit, _root_frame(value, indent + 2)))
+        else:
+            for child_key, child in value.items():
+                _emit_value_compiled(emit, child_key, child, indent + 2)
+    else:
+        emit(f"{prefix}{key} {_fast_scalar(value)}")
+
+
+# ============================================================
+# 显式栈发射：root / children 树
+# ============================================================
+
+_CHILDREN_CONTEXT = _ITEM_CONTEXTS["children"]
+_END = object()
+
+# 栈帧: (迭代器, 对象, 缩进, 跳过的 key)
+_Frame = Tuple[Iterator[Any], Optional[Dict[str, Any]], int, Optional[str]]
+
+
+def _root_frame(root: Dict[str, Any], indent: int) -> _Frame:
+    """root 对象按 ITEM_KEY_ORDER 发射全部 key"""
+    shape = tuple(root)
+    keys = _OBJECT_PLANS.get(shape)
+    if keys is None:
+        keys = _cache_put(_OBJECT_PLANS, shape, tuple(_ordered_keys(root, ITEM_KEY_ORDER)))
+    return (iter(keys), root, indent, None)
+
+
+def _children_frame(items: List[Any], indent: int) -> _Frame:
+    return (iter(items), None, indent, None)
+
+
+def _drain(walker: Iterator[None]) -> None:
+    for _ in walker:
+        pass
+
+
+def _walk_tree(emit: Emit, frame: _Frame) -> Iterator[None]:
+    """
+    用显式栈代替 _emit_key_value → _emit_list → _emit_object_item 的逐层递归，
+    树的深度不受递归上限约束，输出与递归发射器逐字节一致
+
+    每开始一个 children 项 yield 一次，流式调用方借此分批取走 emit 缓冲（缓冲只含一个节点的行）。
+
+    栈帧 (迭代器, 对象, 缩进, 跳过的 key):
+        对象为 None   children 列表的剩余项；项的 key 在同一循环内直接发射，
+                      遇到非空 children 时依次压入 剩余兄弟项、该项剩余 key、子项 三个帧后下降
+        对象为 dict   对象的剩余 key（root，或子树完成后继续的项），跳过 inline key
+    children 以外的嵌套值（attributes 等）深度有限，仍交给 _emit_value_compiled。
+    """
+    plans = _CHILDREN_CONTEXT.plans
+    stack = [frame]
+    while stack:
+        iterator, obj, indent, skip = stack.pop()
+
+        if obj is not None:
+            prefix = " " * indent
+            for key in iterator:
+                if key == skip:
+                    continue
+                value = obj[key]
+                t = type(value)
+                if t is str:
+                    text = value.replace("\n", " ").replace("\r", "").strip()
+                    if text:
+                        emit(f"{prefix}{key} {text}")
+                elif t is int or t is float:
+                    emit(f"{prefix}{key} {value}")
+                elif value is None:
+                    continue
+                elif key == "children" and isinstance(value, list):
+                    if value:
+                        emit(f"{prefix}children")
+                        stack.append((iterator, obj, indent, skip))
+                        stack.append((iter(value), None, indent + 2, None))
+                        break
+                else:
+                    _emit_value_compiled(emit, key, value, indent)
+            continue
+
+        item_prefix = " " * indent + "- "
+        bare_prefix = " " * indent + "-"
+        child_indent = indent + 2
+        child_prefix = " " * child_indent
+        for item in iterator:
+            yield
+            if not isinstance(item, dict):
+                emit(f"{item_prefix}{_fast_scalar(item)}")
+                continue
+            shape = tuple(item)
+            plan = plans.get(shape)
+            if plan is None:
+                plan = _CHILDREN_CONTEXT.plan(shape)
+            inline_key, inline_text = _pick_inline_compiled(item, plan[0])
+            if not inline_key:
+                emit(bare_prefix)
+            else:
+                emit(f"{item_prefix}{inline_key} {inline_text}")
+
+            keys = iter(plan[1])
+            descend = None
+            for key in keys:
+                if key == inline_key:
+                    continue
+                value = item[key]
+                t = type(value)
+                if t is str:
+                    text = value.replace("\n", " ").replace("\r", "").strip()
+                    if text:
+                        emit(f"{child_prefix}{key} {text}")
+                elif t is int or t is float:
+                    emit(f"{child_prefix}{key} {value}")
+                elif value is None:
+                    continue
+                elif key == "children" and isinstance(value, list):
+                    if value:
+                        emit(f"{child_prefix}children")
+                        descend = value
+                        break
+                else:
+                    _emit_value_compiled(emit, key, value, child_indent)
+            if descend is not None:
+                stack.append((iterator, None, indent, None))
+                stack.append((keys, item, child_indent, inline_key))
+                stack.append((iter(descend), None, child_indent + 2, None))
+                break
+
+
+def _pick_inline_compiled(item: Dict[str, Any], candidates: Tuple[str, ...]) -> Tuple[Optional[str], str]:
+    """按候选顺序选 inline key，返回 (key, 格式化后的值)；字符串转义后非空当且仅当 strip() 后非空
+
+    选中空字符串 key 时，调用方与 _emit_object_item 一样按无 inline key 输出 "-"（该 key 的值不输出）。
+    """
+    for candidate in candidates:
+        value = item[candidate]
+        t = type(value)
+        if t is str:
+            text = value.replace("\n", " ").replace("\r", "").strip()
+            if text:
+                return candidate, text
+        elif t is int or t is float:
+            return candidate, str(value)
+        elif _inline_candidate(value):
+            return candidate, _fast_scalar(value)
+    return None, ""
+
+
+def _emit_list_compiled(emit: Emit, key: str, items: Iterable[Any], indent: int) -> None:
+    """_emit_list / _emit_relations 的编译版本"""
+    if key == "relations":
+        context = _RELATION_CONTEXT
+        scalar_prefix = " " * indent
+    else:
+        context = _ITEM_CONTEXTS.get(key) or _ITEM_CONTEXTS["default"]
+        scalar_prefix = " " * indent + "- "
+    item_prefix = " " * indent + "- "
+    bare_prefix = " " * indent + "-"
+    child_indent = indent + 2
+    child_prefix = " " * child_indent
+    plans = context.plans
+
+    for item in items:
+        if not isinstance(item, dict):
+            emit(f"{scalar_prefix}{_fast_scalar(item)}")
+            continue
+
+        shape = tuple(item)
+        plan = plans.get(shape)
+        if plan is None:
+            plan = context.plan(shape)
+        candidates, ordered, arrow = plan
+        if arrow:
+            from_value = item["from"]
+            to_value = item["to"]
+            if from_value is not None and to_value is not None:
+                emit(f"{scalar_prefix}{_fast_scalar(from_value)} -> {_fast_scalar(to_value)}")
+                continue
+
+        inline_key, inline_text = _pick_inline_compiled(item, candidates)
+        if not inline_key:
+            emit(bare_prefix)
+        else:
+            emit(f"{item_prefix}{inline_key} {inline_text}")
+
+        for child_key in ordered:
+            if child_key == inline_key:
+                continue
+            value = item[child_key]
+            t = type(value)
+            if t is str:
+                text = value.replace("\n", " ").replace("\r", "").strip()
+                if text:
+                    emit(f"{child_prefix}{child_key} {text}")
+            elif t is int or t is float:
+                emit(f"{child_prefix}{child_key} {value}")
+            elif value is None:
+                continue
+            else:
+                _emit_value_compiled(emit, child_key, value, child_indent)
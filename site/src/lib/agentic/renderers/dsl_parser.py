@@ -0,0 +1,357 @@
+"""
+[INPUT]: @antv/infographic DSL 字符串（通常来自 generate_dsl）
+[OUTPUT]: parse_dsl → ParsedDSL (template, data, theme)；validate_dsl → DSLError 列表；DSLParseError
+[POS]: renderers 的纯 Python DSL 解析与校验，在进入 Node.js 渲染队列前以微秒级发现结构错误
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 renderers/.folder.md 的描述是否仍然准确。
+
+语法（与 dsl_generator 的输出一致）:
+    infographic <template>          首行，必须存在
+    data                            必须存在且非空
+      key value                     标量: true/false → bool，整数 / 小数 → 数值，其余为字符串
+      key                           块: 下一行缩进 +2，内容为映射或列表
+        - key value                 列表项（对象），后续 key 缩进 +2 属于该项
+        -                           无 inline key 的列表项
+        - token                     标量列表项（单个词；首词不是标识符且没有子 key 的多词项也是标量）
+      relations
+        A -> B                      关系简写 → {"from": A, "to": B}
+    theme
+      palette #c1 #c2               palette 解析为颜色列表
+
+结构错误（附 1 起始的行号）: 首行缺失、未知 section、重复 section / key、缩进非 2 的倍数或使用 tab、
+缩进跳级、不一致的回退、块没有内容、同一块混用列表项与 key、非法 key 名（"-"，或 tab 等空白混入）、缺少 data。
+key 可以是任意不含空白的词（中文、数字开头、含 "." 或以 "-" 开头都合法），与 generate_dsl 对额外字段的输出一致。
+
+往返: parse_dsl(generate_dsl(t, c, data)).data 与 data 在生成器的规范化下一致（空值被省略、换行转为空格、
+顶层只保留 DATA_KEY_ORDER 中的 key、无额外字段的关系写成简写）；看起来像数字或 true/false 的字符串会解析为对应类型，
+首词是标识符的多词标量列表项（如 "- hello world"）会被解析为 {key: value}。
+
+解析是单遍、显式栈的（不递归），与 generate_dsl 一样不受树深度限制。
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# key: 任意不含空白的词（"-" 除外，它是列表项标记）；数据模型允许额外字段，中文、数字开头、含 "." 的 key 都会出现
+_KEY_RE = re.compile(r"(?!-\Z)\S+\Z")
+# 标识符形式的 key：列表项 "- word rest" 的首词是标识符时直接视为 {word: rest}
+_NAME_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*\Z")
+_INT_RE = re.compile(r"-?\d+\Z")
+_FLOAT_RE = re.compile(r"-?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?\Z|-?(?:inf|nan)\Z")
+
+SECTIONS = ("data", "theme")
+
+# 单文件报告的错误数上限（避免一处缩进错误引发大量级联报告）
+MAX_ERRORS = 20
+
+
+@dataclass(frozen=True)
+class DSLError:
+    """一处结构错误，line 从 1 开始"""
+
+    line: int
+    message: str
+
+    def __str__(self) -> str:
+        return f"line {self.line}: {self.message}"
+
+
+class DSLParseError(ValueError):
+    """DSL 存在结构错误"""
+
+    def __init__(self, errors: List[DSLError]) -> None:
+        self.errors = errors
+        summary = "; ".join(str(e) for e in errors[:3])
+        more = f" (+{len(errors) - 3} more)" if len(errors) > 3 else ""
+        super().__init__(f"Invalid DSL: {summary}{more}")
+
+
+@dataclass
+class ParsedDSL:
+    """解析结果"""
+
+    template: str
+    data: Dict[str, Any] = field(default_factory=dict)
+    theme: Dict[str, Any] = field(default_factory=dict)
+
+
+# 可能是数值的首字符（含 inf / nan）
+_NUMERIC_START = frozenset("0123456789-.in")
+
+# 已校验过的 key 名 → _key_kind（数据中的 key 高度重复）
+_valid_keys: Dict[str, int] = {}
+
+
+def parse_scalar(text: str) -> Any:
+    """DSL 标量 → Python 值（generate_dsl 中 _format_scalar 的逆操作）"""
+    if text and text[0] in _NUMERIC_START:
+        if _INT_RE.match(text):
+            return int(text)
+        if _FLOAT_RE.match(text):
+            return float(text)
+        return text
+    if text == "true":
+        return True
+    if text == "false":
+        return False
+    return text
+
+
+def _key_kind(key: str) -> int:
+    """0 = 不是合法 key，1 = 合法 key，2 = 标识符形式的 key"""
+    kind = _valid_keys.get(key)
+    if kind is None:
+        kind = 2 if _NAME_RE.match(key) else 1 if _KEY_RE.match(key) else 0
+        if len(_valid_keys) < 4096:
+            _valid_keys[key] = kind
+    return kind
+
+
+class _Frame:
+    """一个缩进层级上的容器
+
+    kind:
+        root       顶层（infographic / data / theme）
+        pending    "key" 行后等待第一行子内容决定是映射还是列表
+        map        映射
+        list       列表（relations 下同时接受 A -> B）
+    """
+
+    __slots__ = ("indent", "kind", "container", "owner", "key", "line", "optional", "relations", "promote")
+
+    def __init__(
+        self,
+        indent: int,
+        kind: str,
+        container: Any = None,
+        owner: Optional[Dict[str, Any]] = None,
+        key: str = "",
+        line: int = 0,
+        optional: bool = False,
+        relations: bool = False,
+    ) -> None:
+        self.indent = indent
+        self.kind = kind
+        self.container = container
+        self.owner = owner
+        self.key = key
+        self.line = line
+        self.optional = optional
+        self.relations = relations
+        # (列表, 下标)：先按标量记录的列表项，出现子 key 时替换为本映射
+        self.promote: Optional[Tuple[List[Any], int]] = None
+
+
+def _split_key(text: str) -> Tuple[str, Optional[str]]:
+    key, _, value = text.partition(" ")
+    if not value:
+        return key, None
+    if value[0] == " ":
+        value = value.lstrip()
+    return key, value
+
+
+def _parse(text: str) -> Tuple[Optional[ParsedDSL], List[DSLError]]:
+    errors: List[DSLError] = []
+
+    def error(line: int, message: str) -> None:
+        if len(errors) < MAX_ERRORS:
+            errors.append(DSLError(line, message))
+
+    result: Optional[ParsedDSL] = None
+    sections: Dict[str, Dict[str, Any]] = {}
+    stack: List[_Frame] = [_Frame(0, "root")]
+    # 出错行更深的缩进整体跳过，避免级联报告
+    skip_deeper_than: Optional[int] = None
+    lineno = 0
+    valid_keys = _valid_keys
+
+    if "\r" in text:
+        text = text.replace("\r\n", "\n")
+    for lineno, line in enumerate(text.split("\n"), 1):
+        content = line.lstrip(" ")
+        if not content or content.isspace():
+            continue
+        indent = len(line) - len(content)
+        if skip_deeper_than is not None:
+            if indent > skip_deeper_than:
+                continue
+            skip_deeper_than = None
+        if content[0] == "\t":
+            error(lineno, "Tab in indentation")
+            skip_deeper_than = indent
+            continue
+        if content[-1] == " ":
+            content = content.rstrip()
+        if indent % 2:
+            error(lineno, f"Indentation of {indent} spaces is not a multiple of 2")
+            skip_deeper_than = indent
+            continue
+
+        # 回退到与本行缩进匹配的层级
+        while stack[-1].indent > indent:
+            frame = stack.pop()
+            if frame.kind == "pending" and not frame.optional:
+                error(frame.line, f"'{frame.key}' has no value or block")
+        frame = stack[-1]
+        if frame.indent != indent:
+            error(lineno, f"Unexpected indentation ({indent} spaces, expected {frame.indent})")
+            skip_deeper_than = indent
+            continue
+
+        # ---- 顶层 ----
+        if frame.kind == "root":
+            key, value = _split_key(content)
+            if result is None:
+                if key != "infographic":
+                    error(lineno, "DSL must start with 'infographic <template>'")
+                    result = ParsedDSL(template="")
+                elif not value:
+                    error(lineno, "Missing template name after 'infographic'")
+                    result = ParsedDSL(template="")
+                else:
+                    result = ParsedDSL(template=value)
+                    continue
+            if key == "infographic":
+                error(lineno, "Duplicate 'infographic' line")
+                continue
+            if key not in SECTIONS:
+                error(lineno, f"Unknown section '{key}'")
+                skip_deeper_than = indent
+                continue
+            if key in sections:
+                error(lineno, f"Duplicate section '{key}'")
+                skip_deeper_than = indent
+                continue
+            if value is not None:
+                error(lineno, f"Section '{key}' must not have an inline value")
+            sections[key] = {}
+            stack.append(_Frame(2, "map", sections[key], key=key, line=lineno))
+            continue
+
+        # ---- 待定块：第一行子内容决定映射 / 列表 ----
+        if frame.kind == "pending":
+            is_item = content == "-" or content.startswith("- ")
+            is_arrow = frame.relations and " -> " in content
+            if is_item or is_arrow:
+                frame.kind = "list"
+                frame.container = []
+            else:
+                frame.kind = "map"
+                frame.container = {}
+            frame.owner[frame.key] = frame.container
+
+        # ---- 列表 ----
+        if frame.kind == "list":
+            items: List[Any] = frame.container
+            if frame.relations and " -> " in content and not content.startswith("- "):
+                parts = [p.strip() for p in content.split(" -> ")]
+                if any(not p for p in parts):
+                    error(lineno, f"Incomplete relation '{content}'")
+                    continue
+                for source, target in zip(parts, parts[1:]):
+                    items.append({"from": parse_scalar(source), "to": parse_scalar(target)})
+                continue
+            if content == "-":
+                item: Dict[str, Any] = {}
+                items.append(item)
+                stack.append(_Frame(indent + 2, "map", item, line=lineno, optional=True))
+                continue
+            if not content.startswith("- "):
+                error(lineno, f"Expected a list item ('- ...') in '{frame.key}', got '{content[:40]}'")
+                skip_deeper_than = indent
+                continue
+            body = content[2:]
+            if body[0] == " ":
+                body = body.lstrip()
+            key, _, value = body.partition(" ")
+            kind = valid_keys.get(key) or _key_kind(key)
+            if not value or not kind:
+                # "- token" 或首词不是合法 key：标量列表项
+                items.append(parse_scalar(body))
+                continue
+            if value[0] == " ":
+                value = value.lstrip()
+            item = {key: parse_scalar(value)}
+            item_frame = _Frame(indent + 2, "map", item, line=lineno, optional=True)
+            if kind == 2:
+                items.append(item)
+            else:
+                # 首词不是标识符（如 "- 苹果 手机"）：先作为标量项，后面出现子 key 时才是对象项
+                items.append(parse_scalar(body))
+                item_frame.promote = (items, len(items) - 1)
+            stack.append(item_frame)
+            continue
+
+        # ---- 映射 ----
+        mapping: Dict[str, Any] = frame.container
+        if content == "-" or content.startswith("- "):
+            error(lineno, f"List item inside a mapping{f' ({frame.key})' if frame.key else ''}")
+            skip_deeper_than = indent
+            continue
+        key, _, value = content.partition(" ")
+        if not (valid_keys.get(key) or _key_kind(key)):
+            error(lineno, f"Invalid key '{key[:40]}'")
+            skip_deeper_than = indent
+            continue
+        if frame.promote is not None:
+            owner, index = frame.promote
+            owner[index] = mapping
+            frame.promote = None
+        if key in mapping:
+            error(lineno, f"Duplicate key '{key}'")
+            skip_deeper_than = indent
+            continue
+        if value:
+            if value[0] == " ":
+                value = value.lstrip()
+            mapping[key] = parse_scalar(value)
+            continue
+        stack.append(
+            _Frame(indent + 2, "pending", owner=mapping, key=key, line=lineno, relations=key == "relations")
+        )
+
+    # 收尾：未闭合的待定块
+    while len(stack) > 1:
+        frame = stack.pop()
+        if frame.kind == "pending" and not frame.optional:
+            error(frame.line, f"'{frame.key}' has no value or block")
+
+    if result is None:
+        error(1, "Empty DSL")
+        return None, errors
+    if "data" not in sections:
+        error(lineno or 1, "Missing 'data' section")
+    elif not sections["data"]:
+        error(lineno or 1, "Empty 'data' section")
+
+    result.data = sections.get("data", {})
+    theme = sections.get("theme", {})
+    palette = theme.get("palette")
+    if isinstance(palette, str):
+        theme["palette"] = palette.split()
+    result.theme = theme
+    return result, errors
+
+
+def validate_dsl(text: str) -> List[DSLError]:
+    """返回 DSL 的结构错误列表（为空表示通过）"""
+    return _parse(text)[1]
+
+
+def parse_dsl(text: str) -> ParsedDSL:
+    """
+    解析 DSL 为 (template, data, theme)
+
+    Raises:
+        DSLParseError: 存在结构错误，errors 属性包含全部错误与行号
+    """
+    parsed, errors = _parse(text)
+    if errors or parsed is None:
+        raise DSLParseError(errors)
+    return parsed
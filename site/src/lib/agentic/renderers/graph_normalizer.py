@@ -0,0 +1,249 @@
+"""
+[INPUT]: relation 分类的 data（nodes / relations），模板的 max_nodes
+[OUTPUT]: normalize_graph → (规整后的 data, GraphReport)；find_cycle
+[POS]: renderers 的关系图规整，data_fitter 对 relation 模板调用，悬空 / 重复 / 自环的边不再进入渲染
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 renderers/.folder.md 的描述是否仍然准确。
+
+基于索引（引用 → 节点 key 的 dict、边集合），整体 O(V + E)，数千条边也只是一次遍历:
+    1. 节点去重：以 id（无 id 时以 label）为 key，重复的保留第一个；关系可以用 id 或 label 引用节点
+    2. 按 max_nodes 保留前 N 个节点
+    3. 关系：丢弃自环、重复边（同一 from → to）、缺少端点的；端点不存在时自动创建节点
+       （{"id": ref, "label": ref}，追加在末尾且不超过 max_nodes），容量已满或原节点被截掉时丢弃该关系
+    4. 只有 relations 没有 nodes 时，按端点首次出现的顺序计数，不创建 nodes 列表
+    5. detect_cycles=True（dagre 有向流程模板）时用迭代 DFS 找出一个环，记录在报告中（不修改数据）
+
+关系中的 from / to 原样保留（不改写为 id），其余字段也原样保留。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+@dataclass
+class GraphReport:
+    """规整过程中的调整计数"""
+
+    duplicate_nodes: int = 0
+    invalid_nodes: int = 0
+    dropped_nodes: int = 0
+    created_nodes: int = 0
+    invalid_relations: int = 0
+    dangling_relations: int = 0
+    self_loops: int = 0
+    duplicate_relations: int = 0
+    cycle: List[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return any(
+            (
+                self.duplicate_nodes,
+                self.invalid_nodes,
+                self.dropped_nodes,
+                self.created_nodes,
+                self.invalid_relations,
+                self.dangling_relations,
+                self.self_loops,
+                self.duplicate_relations,
+            )
+        )
+
+    def notes(self, max_nodes: Optional[int] = None) -> List[str]:
+        notes: List[str] = []
+        if self.duplicate_nodes:
+            notes.append(f"nodes: merged {self.duplicate_nodes} duplicates")
+        if self.invalid_nodes:
+            notes.append(f"nodes: dropped {self.invalid_nodes} without id/label")
+        if self.dropped_nodes:
+            notes.append(f"nodes: dropped {self.dropped_nodes} over {max_nodes}")
+        if self.created_nodes:
+            notes.append(f"nodes: created {self.created_nodes} referenced by relations")
+        for count, what in (
+            (self.self_loops, "self-loops"),
+            (self.duplicate_relations, "duplicate relations"),
+            (self.dangling_relations, "relations with missing or dropped endpoints"),
+            (self.invalid_relations, "relations without from/to"),
+        ):
+            if count:
+                notes.append(f"relations: dropped {count} {what}")
+        if self.cycle:
+            notes.append(f"relations: cycle {' -> '.join(self.cycle)}")
+        return notes
+
+
+def _ref(value: Any) -> Optional[str]:
+    """引用统一为字符串（id 可能是数字）；空值返回 None"""
+    if type(value) is str:
+        return value.strip() or None
+    if value is None or isinstance(value, (dict, list)):
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def _node_key(node: Any) -> Tuple[Optional[str], Tuple[Optional[str], ...]]:
+    """(节点 key, 可用于引用该节点的全部值)"""
+    if isinstance(node, dict):
+        node_id, label = _ref(node.get("id")), _ref(node.get("label"))
+        return node_id or label, (node_id, label)
+    ref = _ref(node)
+    return ref, (ref,)
+
+
+def find_cycle(adjacency: Dict[str, List[str]]) -> List[str]:
+    """
+    迭代 DFS 找一个环
+
+    Returns:
+        环上的节点 key（首尾相同，如 [a, b, a]）；无环时为空列表
+    """
+    state: Dict[str, int] = {}  # 1 = 在当前路径上, 2 = 已完成
+    for start in adjacency:
+        if start in state:
+            continue
+        path: List[str] = [start]
+        iters = [iter(adjacency.get(start, ()))]
+        state[start] = 1
+        while iters:
+            for nxt in iters[-1]:
+                mark = state.get(nxt)
+                if mark == 1:
+                    return path[path.index(nxt):] + [nxt]
+                if mark is None:
+                    state[nxt] = 1
+                    path.append(nxt)
+                    iters.append(iter(adjacency.get(nxt, ())))
+                    break
+            else:
+                state[path.pop()] = 2
+                iters.pop()
+    return []
+
+
+def normalize_graph(
+    data: Dict[str, Any],
+    max_nodes: Optional[int] = None,
+    create_missing: bool = True,
+    detect_cycles: bool = False,
+) -> Tuple[Dict[str, Any], GraphReport]:
+    """
+    规整关系图数据
+
+    Returns:
+        (新 data, GraphReport)；输入不会被修改
+    """
+    report = GraphReport()
+    nodes = data.get("nodes")
+    relations = data.get("relations")
+    relations = relations if isinstance(relations, list) else []
+    has_nodes = isinstance(nodes, list) and bool(nodes)
+
+    # 引用值 → 节点 key；key → 展示名（报告环路用）
+    alias: Dict[str, str] = {}
+    names: Dict[str, str] = {}
+    kept_nodes: List[Any] = []
+    # 被 max_nodes 截掉的节点的引用值：引用它们的关系直接丢弃，不重新创建
+    removed: Set[str] = set()
+
+    if has_nodes:
+        seen: Set[str] = set()
+        for node in nodes:
+            key, refs = _node_key(node)
+            if key is None:
+                report.invalid_nodes += 1
+                continue
+            if key in seen:
+                report.duplicate_nodes += 1
+                continue
+            seen.add(key)
+            if max_nodes is not None and len(kept_nodes) >= max_nodes:
+                report.dropped_nodes += 1
+                removed.update(ref for ref in refs if ref is not None)
+                continue
+            kept_nodes.append(node)
+            names[key] = refs[-1] or key
+            for ref in refs:
+                if ref is not None:
+                    alias.setdefault(ref, key)
+
+    edges: Set[Tuple[str, str]] = set()
+    adjacency: Dict[str, List[str]] = {}
+    kept_relations: List[Any] = []
+    endpoints_seen: Dict[str, None] = {}
+
+    def capacity() -> Optional[int]:
+        if max_nodes is None:
+            return None
+        return max_nodes - (len(kept_nodes) if has_nodes else len(endpoints_seen))
+
+    def add_node(ref: str) -> None:
+        if has_nodes:
+            kept_nodes.append({"id": ref, "label": ref})
+            report.created_nodes += 1
+        else:
+            endpoints_seen[ref] = None
+        alias[ref] = ref
+        names[ref] = ref
+
+    for relation in relations:
+        if not isinstance(relation, dict):
+            report.invalid_relations += 1
+            continue
+        source_ref, target_ref = _ref(relation.get("from")), _ref(relation.get("to"))
+        if source_ref is None or target_ref is None:
+            report.invalid_relations += 1
+            continue
+        if source_ref == target_ref:
+            report.self_loops += 1
+            continue
+        source, target = alias.get(source_ref), alias.get(target_ref)
+        if source is not None and source == target:
+            report.self_loops += 1
+            continue
+        # 端点不存在：有 nodes 时按 create_missing 创建，只有关系时端点即节点；容量不够或节点已被截掉则丢弃关系
+        if source is None or target is None:
+            missing = [ref for ref, key in ((source_ref, source), (target_ref, target)) if key is None]
+            room = capacity()
+            if (
+                (has_nodes and not create_missing)
+                or any(ref in removed for ref in missing)
+                or (room is not None and room < len(missing))
+            ):
+                if not has_nodes:
+                    # 端点按首次出现的顺序占用容量，放不下的才算被截掉
+                    for ref in missing:
+                        if ref in removed:
+                            continue
+                        if room is None or room > 0:
+                            add_node(ref)
+                            room = None if room is None else room - 1
+                        else:
+                            removed.add(ref)
+                            report.dropped_nodes += 1
+                report.dangling_relations += 1
+                continue
+            for ref in missing:
+                add_node(ref)
+            source, target = alias[source_ref], alias[target_ref]
+        if (source, target) in edges:
+            report.duplicate_relations += 1
+            continue
+        edges.add((source, target))
+        adjacency.setdefault(source, []).append(target)
+        kept_relations.append(relation)
+
+    if detect_cycles and edges:
+        report.cycle = [names.get(key, key) for key in find_cycle(adjacency)]
+
+    if not report.changed:
+        return data, report
+    normalized = dict(data)
+    normalized["relations"] = kept_relations
+    if has_nodes:
+        normalized["nodes"] = kept_nodes
+    return normalized, report
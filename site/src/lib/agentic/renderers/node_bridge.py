@@ -1,6 +1,6 @@
 """
 [INPUT]: DSL 语法字符串
-[OUTPUT]: SVG 字符串 或 错误信息
+[OUTPUT]: SVG 字符串 或 错误信息（render_to_svg / render_to_svg_async）
 [POS]: 调用 Node.js @antv/infographic SSR 渲染器
 
 [PROTOCOL]:
@@ -8,9 +8,11 @@
 2. 更新后必须上浮检查 renderers/.folder.md 的描述是否仍然准确。
 
 使用方式:
-    from renderers import render_to_svg
+    from renderers import render_to_svg, render_to_svg_async
 
     result = render_to_svg(dsl_syntax)
+    # 异步上下文中（超时或取消时终止 Node.js 进程）:
+    # result = await render_to_svg_async(dsl_syntax, timeout=10)
     if result["success"]:
         svg_content = result["svg"]
     else:
@@ -19,12 +21,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import subprocess
 import tempfile
+import time
 from pathlib import Path
 from typing import TypedDict
 
+from ..utils.metrics import metrics
+
 
 class RenderResult(TypedDict):
     """渲染结果类型"""
@@ -36,19 +42,12 @@ class RenderResult(TypedDict):
 # 获取 site 目录 (Node.js 项目根目录)
 SITE_ROOT = Path(__file__).parent.parent.parent.parent.parent
 
+# 单次渲染的默认超时（秒）
+RENDER_TIMEOUT = 30.0
 
-def render_to_svg(dsl_syntax: str, width: int = 800, height: int = 600) -> RenderResult:
-    """通过 Node.js subprocess 渲染 DSL 到 SVG
-
-    Args:
-        dsl_syntax: @antv/infographic DSL 语法字符串
-        width: SVG 宽度，默认 800
-        height: SVG 高度，默认 600
 
-    Returns:
-        RenderResult: {"success": bool, "svg": str | None, "error": str | None}
-    """
-    # 将 DSL 写入临时文件以避免命令行转义问题
+def _write_dsl_file(dsl_syntax: str) -> str:
+    """将 DSL 写入临时文件以避免命令行转义问题"""
     with tempfile.NamedTemporaryFile(
         mode="w",
         suffix=".dsl",
@@ -56,10 +55,12 @@ def render_to_svg(dsl_syntax: str, width: int = 800, height: int = 600) -> Rende
         encoding="utf-8",
     ) as f:
         f.write(dsl_syntax)
-        dsl_file = f.name
+        return f.name
 
-    # Node.js 渲染脚本
-    node_script = f'''
+
+def _node_script(dsl_file: str, width: int, height: int) -> str:
+    """Node.js 渲染脚本"""
+    return f'''
 const fs = require('fs');
 const {{ renderToString }} = require('@antv/infographic/ssr');
 
@@ -74,58 +75,119 @@ renderToString(dsl, {{ width: {width}, height: {height} }})
   }});
 '''
 
+
+def _error(message: str) -> RenderResult:
+    return {"success": False, "svg": None, "error": message}
+
+
+def _parse_output(returncode: int, stdout: str, stderr: str) -> RenderResult:
+    """解析 Node.js 进程输出"""
+    if returncode != 0:
+        # Node.js 执行错误
+        return _error(f"Node.js error: {stderr or stdout}")
+
+    # 解析 JSON 输出
+    try:
+        return json.loads(stdout)
+    except json.JSONDecodeError:
+        return _error(f"Invalid JSON output: {stdout[:500]}")
+
+
+def _observe(started: float, result: RenderResult) -> RenderResult:
+    """记录 Node.js 渲染耗时与结果"""
+    if result["success"]:
+        outcome = "success"
+    elif (result["error"] or "").startswith("Rendering timeout"):
+        outcome = "timeout"
+    else:
+        outcome = "error"
+    metrics.node_render_seconds.observe(time.perf_counter() - started, outcome=outcome)
+    return result
+
+
+def render_to_svg(dsl_syntax: str, width: int = 800, height: int = 600) -> RenderResult:
+    """通过 Node.js subprocess 渲染 DSL 到 SVG
+
+    Args:
+        dsl_syntax: @antv/infographic DSL 语法字符串
+        width: SVG 宽度，默认 800
+        height: SVG 高度，默认 600
+
+    Returns:
+        RenderResult: {"success": bool, "svg": str | None, "error": str | None}
+    """
+    dsl_file = _write_dsl_file(dsl_syntax)
+    started = time.perf_counter()
     try:
         result = subprocess.run(
-            ["node", "-e", node_script],
+            ["node", "-e", _node_script(dsl_file, width, height)],
             capture_output=True,
             text=True,
             cwd=str(SITE_ROOT),
-            timeout=30,
+            timeout=RENDER_TIMEOUT,
         )
-
+        return _observe(started, _parse_output(result.returncode, result.stdout, result.stderr))
+    except subprocess.TimeoutExpired:
+        return _observe(started, _error(f"Rendering timeout ({RENDER_TIMEOUT:.0f}s)"))
+    except FileNotFoundError:
+        return _observe(started, _error("Node.js not found. Please install Node.js."))
+    except Exception as e:
+        return _observe(started, _error(str(e)))
+    finally:
         # 清理临时文件
         Path(dsl_file).unlink(missing_ok=True)
 
-        if result.returncode != 0:
-            # Node.js 执行错误
-            return {
-                "success": False,
-                "svg": None,
-                "error": f"Node.js error: {result.stderr or result.stdout}",
-            }
-
-        # 解析 JSON 输出
-        try:
-            output = json.loads(result.stdout)
-            return output
-        except json.JSONDecodeError:
-            return {
-                "success": False,
-                "svg": None,
-                "error": f"Invalid JSON output: {result.stdout[:500]}",
-            }
 
-    except subprocess.TimeoutExpired:
-        Path(dsl_file).unlink(missing_ok=True)
-        return {
-            "success": False,
-            "svg": None,
-            "error": "Rendering timeout (30s)",
-        }
+async def render_to_svg_async(
+    dsl_syntax: str,
+    width: int = 800,
+    height: int = 600,
+    timeout: float = RENDER_TIMEOUT,
+) -> RenderResult:
+    """render_to_svg 的异步版本，超时或任务被取消时终止 Node.js 进程
+
+    Args:
+        dsl_syntax: @antv/infographic DSL 语法字符串
+        width: SVG 宽度，默认 800
+        height: SVG 高度，默认 600
+        timeout: 超时秒数，调用方可传入截止时间的剩余时间
+
+    Returns:
+        RenderResult: {"success": bool, "svg": str | None, "error": str | None}
+    """
+    dsl_file = _write_dsl_file(dsl_syntax)
+    started = time.perf_counter()
+    proc = None
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "node",
+            "-e",
+            _node_script(dsl_file, width, height),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(SITE_ROOT),
+        )
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        return _observe(
+            started,
+            _parse_output(
+                proc.returncode,
+                stdout.decode("utf-8", errors="replace"),
+                stderr.decode("utf-8", errors="replace"),
+            ),
+        )
+    except asyncio.TimeoutError:
+        return _observe(started, _error(f"Rendering timeout ({timeout:.1f}s)"))
     except FileNotFoundError:
-        Path(dsl_file).unlink(missing_ok=True)
-        return {
-            "success": False,
-            "svg": None,
-            "error": "Node.js not found. Please install Node.js.",
-        }
+        return _observe(started, _error("Node.js not found. Please install Node.js."))
     except Exception as e:
+        return _observe(started, _error(str(e)))
+    finally:
+        # 超时或取消时进程仍在运行，必须终止，避免截止时间后继续占用资源
+        if proc is not None and proc.returncode is None:
+            proc.kill()
+            await asyncio.shield(proc.wait())
         Path(dsl_file).unlink(missing_ok=True)
-        return {
-            "success": False,
-            "svg": None,
-            "error": str(e),
-        }
 
 
 def save_svg(svg_content: str, output_path: str | Path) -> Path:
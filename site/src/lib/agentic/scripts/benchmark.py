@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+[INPUT]: 文章语料目录（默认 scripts/bench_corpus），可选基线 JSON
+[OUTPUT]: 机器可读的基准结果 JSON；与基线比较时超过阈值的回归以退出码 1 报告
+[POS]: agentic/scripts 的端到端基准测试套件
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 scripts/.folder.md 的描述是否仍然准确。
+
+套件:
+    dsl       generate_dsl 在小/大/1k 条目/深层树（1 万节点、深度 200）payload 上的吞吐量（ops/s），
+              details 中附解释模式吞吐量与加速比；
+              dsl.batch: 100 个 selection（小 : 大 = 9 : 1）的 generate_dsl_many 吞吐量（批/s），details 中附逐个调用的对比
+    render    render_to_svg 冷启动（进程内首次）与热启动延迟；Node 依赖不可用时跳过
+    pipeline  process_article 在 fake model 下的吞吐量与延迟分位数:
+              - pipeline.*          使用 --latency 模拟真实模型延迟
+              - pipeline_overhead.* 模型零延迟，只衡量本仓库与 SDK 的开销
+
+Usage:
+    cd site/src/lib
+    python -m agentic.scripts.benchmark --output bench.json
+    python -m agentic.scripts.benchmark --suite dsl,pipeline --baseline bench.json --threshold 0.15
+    python -m agentic.scripts.benchmark --save-baseline bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+# 确保父目录在 Python 路径中
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# 基准测试始终使用离线 fake model；必须在创建 RunConfig 之前设置
+os.environ["AGENTIC_MODEL_PROVIDER"] = "fake"
+
+from agentic.agents.pipeline import process_article
+from agentic.models import TemplateSelection
+from agentic.renderers import generate_dsl, generate_dsl_many, render_to_svg
+from agentic.utils import reset_run_config
+from agentic.utils.benchmark import (
+    DEFAULT_THRESHOLD,
+    compare_to_baseline,
+    latency_summary,
+    load_corpus,
+    metric,
+)
+
+SUITES = ("dsl", "render", "pipeline")
+
+# 与 gpt-4o 级别模型单次调用接近的默认延迟分布（中位数 0.8s）
+DEFAULT_LATENCY = "lognormal:0.8,0.35"
+
+SMALL_PAYLOAD: Tuple[str, str, Dict[str, Any]] = (
+    "list-column-done-list",
+    "list",
+    {"lists": [{"label": "实时协作"}, {"label": "版本管理"}, {"label": "权限控制"}, {"label": "数据导出"}]},
+)
+
+LARGE_PAYLOAD: Tuple[str, str, Dict[str, Any]] = (
+    "hierarchy-tree-curved-line-rounded-rect-node",
+    "hierarchy",
+    {
+        "root": {
+            "label": "公司",
+            "children": [
+                {
+                    "label": f"事业部{i}",
+                    "desc": "负责一条产品线的研发、市场与销售",
+                    "children": [
+                        {
+                            "label": f"部门{i}-{j}",
+                            "children": [{"label": f"小组{i}-{j}-{k}", "value": k} for k in range(4)],
+                        }
+                        for j in range(4)
+                    ],
+                }
+                for i in range(4)
+            ],
+        }
+    },
+)
+
+
+# 1k 条目的列表 payload（编译发射计划的主要目标）
+XL_PAYLOAD: Tuple[str, str, Dict[str, Any]] = (
+    "list-column-done-list",
+    "list",
+    {
+        "title": "功能清单",
+        "lists": [
+            {"label": f"功能 {i}", "value": i, "desc": "支持批量导入与\n增量同步", "icon": "check"}
+            for i in range(1000)
+        ],
+    },
+)
+
+
+def _deep_tree(nodes: int, depth: int) -> Dict[str, Any]:
+    """深度为 depth 的组织结构树：每层一个继续下探的节点加若干叶子，共约 nodes 个节点"""
+    per_level = max(nodes // depth, 1)
+    node: Dict[str, Any] = {"label": "末级岗位", "value": 0}
+    for level in range(depth, 0, -1):
+        leaves = [{"label": f"岗位 {level}-{j}", "value": j, "desc": "负责本层级事务"} for j in range(per_level - 1)]
+        node = {"label": f"层级 {level}", "value": level, "children": [node, *leaves]}
+    return node
+
+
+# 1 万节点、深度 200 的树（显式栈发射器的主要目标）
+TREE_PAYLOAD: Tuple[str, str, Dict[str, Any]] = (
+    "hierarchy-structure",
+    "hierarchy",
+    {"title": "集团组织结构", "root": _deep_tree(10_000, 200)},
+)
+
+
+def _throughput(func: Callable[[], Any], min_time: float) -> Tuple[float, int]:
+    """至少运行 min_time 秒，返回 (ops/s, 次数)"""
+    func()  # 预热
+    count = 0
+    batch = 1
+    started = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        batch_started = time.perf_counter()
+        for _ in range(batch):
+            func()
+        count += batch
+        # 批次耗时不足 10ms 时加倍，减少计时开销；慢操作保持小批次，不超出 min_time 太多
+        if time.perf_counter() - batch_started < 0.01 and batch < 100:
+            batch *= 2
+        elapsed = time.perf_counter() - started
+    return count / elapsed, count
+
+
+def bench_dsl(results: Dict[str, Any], min_time: float) -> None:
+    payloads = (
+        ("small", SMALL_PAYLOAD),
+        ("large", LARGE_PAYLOAD),
+        ("1k", XL_PAYLOAD),
+        ("tree_10k", TREE_PAYLOAD),
+    )
+    for name, (template, category, data) in payloads:
+        ops, count = _throughput(lambda: generate_dsl(template, category, data), min_time)
+        reference_ops, _ = _throughput(lambda: generate_dsl(template, category, data, compiled=False), min_time)
+        size = len(generate_dsl(template, category, data))
+        results["metrics"][f"dsl.{name}.ops_per_sec"] = metric(ops, "ops/s", "higher")
+        results["details"][f"dsl.{name}"] = {
+            "iterations": count,
+            "dsl_bytes": size,
+            "reference_ops_per_sec": round(reference_ops, 2),
+            "speedup": round(ops / reference_ops, 2),
+        }
+
+
+def bench_dsl_batch(results: Dict[str, Any], min_time: float) -> None:
+    """导出任务的形态：一批小 payload 为主、夹杂少量大 payload"""
+    payloads = [SMALL_PAYLOAD] * 9 + [LARGE_PAYLOAD]
+    selections = [
+        TemplateSelection(category=category, sub_category=None, template=template, data=data, rationale="")
+        for template, category, data in payloads * 10
+    ]
+
+    def loop() -> List[str]:
+        return [generate_dsl(s.template, s.category, s.data or {}) for s in selections]
+
+    if generate_dsl_many(selections) != loop():
+        raise RuntimeError("generate_dsl_many output differs from per-call generate_dsl")
+    ops, count = _throughput(lambda: generate_dsl_many(selections), min_time)
+    loop_ops, _ = _throughput(loop, min_time)
+    results["metrics"]["dsl.batch.ops_per_sec"] = metric(ops, "batches/s", "higher")
+    results["details"]["dsl.batch"] = {
+        "iterations": count,
+        "batch_size": len(selections),
+        "loop_ops_per_sec": round(loop_ops, 2),
+        "speedup": round(ops / loop_ops, 2),
+    }
+
+
+def bench_render(results: Dict[str, Any], runs: int) -> None:
+    dsl = generate_dsl(*SMALL_PAYLOAD)
+    started = time.perf_counter()
+    first = render_to_svg(dsl)
+    cold = time.perf_counter() - started
+    if not first["success"]:
+        results["details"]["render"] = {"skipped": True, "error": (first["error"] or "")[:500]}
+        return
+
+    warm: List[float] = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        render_to_svg(dsl)
+        warm.append(time.perf_counter() - started)
+    summary = latency_summary(warm)
+    results["metrics"]["render.cold.seconds"] = metric(cold, "s", "lower")
+    results["metrics"]["render.warm.p50_seconds"] = metric(summary["p50"], "s", "lower")
+    results["details"]["render"] = {"cold": round(cold, 6), "warm": summary}
+
+
+async def _run_corpus(
+    corpus: List[Tuple[str, str]], repeat: int, concurrency: int
+) -> Tuple[List[float], float, int, int]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    intents = 0
+    failures = 0
+
+    async def one(text: str) -> None:
+        nonlocal intents, failures
+        async with semaphore:
+            started = time.perf_counter()
+            selections = await process_article(text)
+            latencies.append(time.perf_counter() - started)
+            intents += len(selections)
+            failures += sum(1 for s in selections if s is None)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(text) for _ in range(repeat) for _, text in corpus))
+    return latencies, time.perf_counter() - started, intents, failures
+
+
+def bench_pipeline(
+    results: Dict[str, Any],
+    corpus: List[Tuple[str, str]],
+    repeat: int,
+    concurrency: int,
+    latency: str,
+) -> None:
+    for prefix, spec in (("pipeline", latency), ("pipeline_overhead", "fixed:0")):
+        os.environ["AGENTIC_FAKE_LATENCY"] = spec
+        reset_run_config()
+        latencies, wall, intents, failures = asyncio.run(_run_corpus(corpus, repeat, concurrency))
+        summary = latency_summary(latencies)
+        results["metrics"][f"{prefix}.articles_per_sec"] = metric(len(latencies) / wall, "articles/s", "higher")
+        results["metrics"][f"{prefix}.p50_seconds"] = metric(summary["p50"], "s", "lower")
+        results["metrics"][f"{prefix}.p95_seconds"] = metric(summary["p95"], "s", "lower")
+        results["details"][prefix] = {
+            "latency_model": spec,
+            "articles": len(latencies),
+            "intents": intents,
+            "failed_intents": failures,
+            "wall_seconds": round(wall, 6),
+            "latency": summary,
+        }
+
+
+def _print_comparison(rows: List[Dict[str, Any]], threshold: float) -> None:
+    print(f"\nBaseline comparison (threshold {threshold:.0%})", file=sys.stderr)
+    print(f"{'Metric':<36} {'Baseline':>12} {'Current':>12} {'Change':>8}", file=sys.stderr)
+    print("-" * 72, file=sys.stderr)
+    for row in rows:
+        flag = "  REGRESSION" if row["regressed"] else ""
+        print(
+            f"{row['name']:<36} {row['baseline']:>12.4g} {row['current']:>12.4g} "
+            f"{row['change']:>+8.1%}{flag}",
+            file=sys.stderr,
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark DSL generation, rendering and the full pipeline")
+    parser.add_argument("--suite", default=",".join(SUITES), help=f"Comma-separated suites ({', '.join(SUITES)})")
+    parser.add_argument("--corpus", type=Path, help="Article directory or file (default: scripts/bench_corpus)")
+    parser.add_argument("--repeat", type=int, default=3, help="Times to replay the corpus (default: 3)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Articles in flight (default: 4)")
+    parser.add_argument("--latency", default=DEFAULT_LATENCY, help=f"Fake model latency (default: {DEFAULT_LATENCY})")
+    parser.add_argument("--min-time", type=float, default=1.0, help="Seconds per DSL benchmark (default: 1.0)")
+    parser.add_argument("--render-runs", type=int, default=5, help="Warm render samples (default: 5)")
+    parser.add_argument("--output", type=Path, help="Write results JSON here (default: stdout)")
+    parser.add_argument("--baseline", type=Path, help="Compare against this results JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed relative regression")
+    parser.add_argument("--save-baseline", type=Path, help="Also write results as the new baseline")
+    parser.add_argument("--verbose", action="store_true", help="Keep pipeline INFO logs")
+    args = parser.parse_args()
+
+    suites = [s.strip() for s in args.suite.split(",") if s.strip()]
+    unknown = set(suites) - set(SUITES)
+    if unknown:
+        parser.error(f"Unknown suite(s): {', '.join(sorted(unknown))}")
+    if not args.verbose:
+        logging.getLogger("agentic.pipeline").setLevel(logging.WARNING)
+
+    corpus = load_corpus(args.corpus)
+    results: Dict[str, Any] = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "suites": suites,
+            "corpus": [name for name, _ in corpus],
+            "repeat": args.repeat,
+            "concurrency": args.concurrency,
+        },
+        "metrics": {},
+        "details": {},
+    }
+
+    if "dsl" in suites:
+        bench_dsl(results, args.min_time)
+        bench_dsl_batch(results, args.min_time)
+    if "render" in suites:
+        bench_render(results, args.render_runs)
+    if "pipeline" in suites:
+        bench_pipeline(results, corpus, args.repeat, args.concurrency, args.latency)
+
+    exit_code = 0
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        rows, regressions = compare_to_baseline(results, baseline, args.threshold)
+        results["comparison"] = {
+            "baseline": str(args.baseline),
+            "threshold": args.threshold,
+            "rows": rows,
+            "regressions": [r.to_dict() for r in regressions],
+        }
+        _print_comparison(rows, args.threshold)
+        if regressions:
+            exit_code = 1
+
+    payload = json.dumps(results, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+    if args.save_baseline:
+        args.save_baseline.write_text(payload + "\n", encoding="utf-8")
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
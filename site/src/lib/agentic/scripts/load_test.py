@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+[INPUT]: 文章语料目录（默认 scripts/bench_corpus），目标到达率序列，可选服务端点 URL
+[OUTPUT]: 各到达率下的吞吐量、延迟分位数、在途请求数、事件循环延迟、错误/超时率，以及饱和点（JSON + 表格）
+[POS]: agentic/scripts 的并发负载测试，开环 Poisson 到达，用于容量规划
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 scripts/.folder.md 的描述是否仍然准确。
+
+开环: 到达时刻按 Poisson 过程预先生成，与请求是否完成无关，系统变慢时在途请求会堆积，
+这正是闭环压测（固定并发）观察不到的排队效应。
+
+目标:
+    默认在进程内调用 process_article（AGENTIC_MODEL_PROVIDER 未设置时使用 fake model）
+    --replay 时回放录制的真实模型响应与延迟（见 utils/model_replay），--time-scale 缩放录制的延迟
+    --url 时向服务端点 POST {"article_text": ...}，2xx 视为成功
+
+饱和判定（拐点）: p95 延迟超过最低到达率档位 p95 的 --knee-factor 倍，或有请求在排空时限内未完成。
+开环下系统跟不上到达率时积压线性增长，延迟随之上升，比吞吐量比值在短窗口内更稳定。
+
+Usage:
+    cd site/src/lib
+    python -m agentic.scripts.load_test --rates 0.5,1,2,4 --duration 30
+    python -m agentic.scripts.load_test --rates 1,2 --latency lognormal:0.8,0.35 --deadline 20 --output load.json
+    python -m agentic.scripts.load_test --replay recordings.jsonl.gz --time-scale 0.5 --rates 1,2,4
+    python -m agentic.scripts.load_test --url http://127.0.0.1:8000/process --rates 1,2,4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# 确保父目录在 Python 路径中
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# 未显式指定 provider 时使用离线 fake model；必须在创建 RunConfig 之前设置
+os.environ.setdefault("AGENTIC_MODEL_PROVIDER", "fake")
+
+from agentic.agents.pipeline import TIMED_OUT_CATEGORY, process_article
+from agentic.utils import reset_run_config
+from agentic.utils.benchmark import latency_summary, load_corpus
+
+# 在途请求数与事件循环延迟的采样间隔（秒）
+SAMPLE_INTERVAL = 0.25
+
+
+class _Step:
+    """单个到达率档位的观测结果"""
+
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        self.sent = 0
+        self.success = 0
+        self.errors = 0
+        self.timed_out = 0
+        self.intents = 0
+        self.intent_errors = 0
+        self.intent_timeouts = 0
+        self.latencies: List[float] = []
+        self.in_flight = 0
+        self.in_flight_samples: List[int] = []
+        self.task_samples: List[int] = []
+        self.loop_lag: List[float] = []
+        self.error_messages: Dict[str, int] = {}
+
+    def record_error(self, error: BaseException) -> None:
+        self.errors += 1
+        key = f"{type(error).__name__}: {str(error)[:120]}"
+        self.error_messages[key] = self.error_messages.get(key, 0) + 1
+
+    def report(self, duration: float, elapsed: float, drained: bool) -> Dict[str, Any]:
+        completed = len(self.latencies)
+
+        def rate(n: int, total: int) -> float:
+            return round(n / total, 4) if total else 0.0
+
+        return {
+            "offered_rate": self.rate,
+            "arrival_rate": round(self.sent / duration, 4),
+            "sent": self.sent,
+            "completed": completed,
+            "incomplete": self.sent - completed - self.errors,
+            # 发送窗口 + 排空时间内的完成速率
+            "throughput": round(completed / elapsed, 4) if elapsed else 0.0,
+            "drain_seconds": round(elapsed - duration, 3),
+            "latency": latency_summary(self.latencies),
+            "error_rate": rate(self.errors, self.sent),
+            "timeout_rate": rate(self.timed_out, self.sent),
+            "intent_error_rate": rate(self.intent_errors, self.intents),
+            "intent_timeout_rate": rate(self.intent_timeouts, self.intents),
+            "in_flight": {
+                "mean": round(sum(self.in_flight_samples) / len(self.in_flight_samples), 2)
+                if self.in_flight_samples
+                else 0,
+                "max": max(self.in_flight_samples, default=0),
+            },
+            # 事件循环中待调度的任务数（含各文章内部的意图级任务）
+            "loop_tasks_max": max(self.task_samples, default=0),
+            "loop_lag": latency_summary(self.loop_lag),
+            "drained": drained,
+            "errors": self.error_messages,
+        }
+
+
+async def _call_pipeline(step: _Step, text: str, deadline: Optional[float]) -> None:
+    selections = await process_article(text, deadline=deadline)
+    step.intents += len(selections)
+    step.intent_errors += sum(1 for s in selections if s is None)
+    timeouts = sum(1 for s in selections if s is not None and s.category == TIMED_OUT_CATEGORY)
+    step.intent_timeouts += timeouts
+    if timeouts:
+        step.timed_out += 1
+
+
+def _post(url: str, text: str, timeout: Optional[float]) -> None:
+    body = json.dumps({"article_text": text}, ensure_ascii=False).encode("utf-8")
+    request = urllib.request.Request(
+        url, data=body, headers={"Content-Type": "application/json"}, method="POST"
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        response.read()
+
+
+async def _call_url(step: _Step, url: str, text: str, deadline: Optional[float]) -> None:
+    try:
+        await asyncio.to_thread(_post, url, text, deadline)
+    except TimeoutError:
+        step.timed_out += 1
+        raise
+
+
+async def _one(
+    step: _Step,
+    text: str,
+    url: Optional[str],
+    deadline: Optional[float],
+) -> None:
+    step.sent += 1
+    step.in_flight += 1
+    started = time.perf_counter()
+    try:
+        if url:
+            await _call_url(step, url, text, deadline)
+        else:
+            await _call_pipeline(step, text, deadline)
+        step.latencies.append(time.perf_counter() - started)
+    except Exception as e:
+        step.record_error(e)
+    finally:
+        step.in_flight -= 1
+
+
+async def _sampler(step: _Step, stop: asyncio.Event) -> None:
+    """周期采样在途请求数、事件循环任务数与事件循环延迟（实际唤醒时间 - 期望唤醒时间）"""
+    while not stop.is_set():
+        expected = time.perf_counter() + SAMPLE_INTERVAL
+        await asyncio.sleep(SAMPLE_INTERVAL)
+        step.loop_lag.append(max(time.perf_counter() - expected, 0.0))
+        step.in_flight_samples.append(step.in_flight)
+        step.task_samples.append(len(asyncio.all_tasks()))
+
+
+async def run_step(
+    rate: float,
+    duration: float,
+    corpus: List[Tuple[str, str]],
+    rng: random.Random,
+    url: Optional[str],
+    deadline: Optional[float],
+    drain_timeout: float,
+) -> Dict[str, Any]:
+    """以 Poisson 到达率 rate 发送 duration 秒，然后等待在途请求排空"""
+    step = _Step(rate)
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(_sampler(step, stop))
+    tasks: List[asyncio.Task] = []
+
+    started = time.perf_counter()
+    next_arrival = rng.expovariate(rate)
+    while next_arrival < duration:
+        delay = started + next_arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        _, text = corpus[rng.randrange(len(corpus))]
+        tasks.append(asyncio.create_task(_one(step, text, url, deadline)))
+        next_arrival += rng.expovariate(rate)
+
+    drained = True
+    pending = [t for t in tasks if not t.done()]
+    if pending:
+        _, still_pending = await asyncio.wait(pending, timeout=drain_timeout)
+        drained = not still_pending
+        for task in still_pending:
+            task.cancel()
+        await asyncio.gather(*still_pending, return_exceptions=True)
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await sampler
+    return step.report(duration, elapsed, drained)
+
+
+def _is_saturated(point: Dict[str, Any], reference_p95: Optional[float], knee_factor: float) -> bool:
+    if not point["drained"]:
+        return True
+    p95 = point["latency"]["p95"]
+    return reference_p95 is not None and p95 is not None and p95 > reference_p95 * knee_factor
+
+
+def _print_curve(curve: List[Dict[str, Any]]) -> None:
+    def ms(value: Optional[float]) -> str:
+        return f"{value * 1000:.0f}" if value is not None else "-"
+
+    print(
+        f"\n{'Rate':>6} {'Arr':>6} {'Thru':>6} {'Sent':>5} {'p50ms':>7} {'p95ms':>7} {'p99ms':>7} "
+        f"{'Err':>6} {'T/O':>6} {'InFl':>5} {'Lag99':>6}  Saturated",
+        file=sys.stderr,
+    )
+    print("-" * 89, file=sys.stderr)
+    for p in curve:
+        latency = p["latency"]
+        print(
+            f"{p['offered_rate']:>6.2f} {p['arrival_rate']:>6.2f} {p['throughput']:>6.2f} {p['sent']:>5} "
+            f"{ms(latency['p50']):>7} {ms(latency['p95']):>7} {ms(latency['p99']):>7} "
+            f"{p['error_rate']:>6.1%} {p['timeout_rate']:>6.1%} {p['in_flight']['max']:>5} "
+            f"{ms(p['loop_lag']['p99']):>6}  {'yes' if p['saturated'] else ''}",
+            file=sys.stderr,
+        )
+
+
+async def run_load_test(args: argparse.Namespace, corpus: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    rng = random.Random(args.seed)
+    curve: List[Dict[str, Any]] = []
+    reference_p95: Optional[float] = None
+    for rate in sorted(args.rates):
+        point = await run_step(
+            rate,
+            args.duration,
+            corpus,
+            rng,
+            args.url,
+            args.deadline,
+            args.drain_timeout if args.drain_timeout is not None else args.duration,
+        )
+        if reference_p95 is None:
+            reference_p95 = point["latency"]["p95"]
+        point["saturated"] = _is_saturated(point, reference_p95, args.knee_factor)
+        curve.append(point)
+        print(
+            f"rate {rate:g}/s: throughput {point['throughput']:.2f}/s, "
+            f"p95 {point['latency']['p95'] or 0:.2f}s, in-flight max {point['in_flight']['max']}",
+            file=sys.stderr,
+        )
+        if point["saturated"] and args.stop_on_saturation:
+            break
+    return curve
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Open-loop Poisson load test for the agentic pipeline")
+    parser.add_argument("--rates", default="0.5,1,2,4", help="Comma-separated arrival rates in articles/s")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of arrivals per rate (default: 30)")
+    parser.add_argument("--drain-timeout", type=float, help="Seconds to wait for in-flight work (default: duration)")
+    parser.add_argument("--corpus", type=Path, help="Article directory or file (default: scripts/bench_corpus)")
+    parser.add_argument("--url", help="POST articles to this endpoint instead of calling process_article")
+    parser.add_argument("--deadline", type=float, help="Per-article deadline in seconds")
+    parser.add_argument("--latency", help="Fake model latency, e.g. lognormal:0.8,0.35")
+    parser.add_argument("--error-rate", type=float, help="Fake model injected error rate")
+    parser.add_argument("--replay", type=Path, help="Replay recorded model calls instead of the fake model")
+    parser.add_argument("--time-scale", type=float, help="Scale recorded latencies when replaying (default: 1.0)")
+    parser.add_argument("--seed", type=int, default=0, help="Arrival process seed (default: 0)")
+    parser.add_argument("--knee-factor", type=float, default=2.0, help="p95 growth over the lowest rate that marks saturation")
+    parser.add_argument("--stop-on-saturation", action="store_true", help="Skip higher rates once saturated")
+    parser.add_argument("--output", type=Path, help="Write results JSON here (default: stdout)")
+    parser.add_argument("--verbose", action="store_true", help="Keep pipeline INFO logs")
+    args = parser.parse_args()
+
+    try:
+        args.rates = [float(r) for r in args.rates.split(",") if r.strip()]
+    except ValueError:
+        parser.error("--rates must be comma-separated numbers")
+    if not args.rates or any(r <= 0 for r in args.rates):
+        parser.error("--rates must be positive")
+    if args.replay:
+        os.environ["AGENTIC_MODEL_PROVIDER"] = "replay"
+        os.environ["AGENTIC_REPLAY_PATH"] = str(args.replay)
+    if args.time_scale is not None:
+        os.environ["AGENTIC_REPLAY_TIME_SCALE"] = str(args.time_scale)
+    if args.latency:
+        os.environ["AGENTIC_FAKE_LATENCY"] = args.latency
+    if args.error_rate is not None:
+        os.environ["AGENTIC_FAKE_ERROR_RATE"] = str(args.error_rate)
+    reset_run_config()
+    if not args.verbose:
+        logging.getLogger("agentic.pipeline").setLevel(logging.WARNING)
+
+    corpus = load_corpus(args.corpus)
+    curve = asyncio.run(run_load_test(args, corpus))
+    _print_curve(curve)
+
+    saturation = next((p["offered_rate"] for p in curve if p["saturated"]), None)
+    results = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "target": args.url or "process_article",
+            "provider": None if args.url else os.environ.get("AGENTIC_MODEL_PROVIDER"),
+            "latency_model": os.environ.get("AGENTIC_FAKE_LATENCY"),
+            "replay": str(args.replay) if args.replay else None,
+            "duration": args.duration,
+            "deadline": args.deadline,
+            "corpus": [name for name, _ in corpus],
+            "seed": args.seed,
+        },
+        "saturation_rate": saturation,
+        "max_sustained_throughput": max(
+            (p["throughput"] for p in curve if not p["saturated"]), default=None
+        ),
+        "curve": curve,
+    }
+    payload = json.dumps(results, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
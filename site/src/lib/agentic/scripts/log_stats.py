@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+[INPUT]: JSONL 日志文件或目录（支持 .gz / .zst 分段），默认 LOG_DIR
+[OUTPUT]: 各 category / template 的 p50/p95/p99 延迟、跳过率、错误率、超时率
+[POS]: agentic/scripts 的日志分析 CLI，单次遍历、常量内存
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 scripts/.folder.md 的描述是否仍然准确。
+
+Usage:
+    cd site/src/lib
+    python -m agentic.scripts.log_stats                       # 全部日志
+    python -m agentic.scripts.log_stats --since 2026-01-01    # 日期范围
+    python -m agentic.scripts.log_stats a.jsonl b.jsonl.gz --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# 确保父目录在 Python 路径中
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agentic.utils.log_analytics import aggregate_logs
+
+
+def _ms(value: Optional[float]) -> str:
+    return f"{value * 1000:.0f}ms" if value is not None else "-"
+
+
+def _print_table(title: str, groups: Dict[str, Any]) -> None:
+    print(f"\n{title}")
+    print(
+        f"{'Name':<36} {'Total':>6} {'Skip':>6} {'Error':>6} {'Timeout':>8} "
+        f"{'p50':>8} {'p95':>8} {'p99':>8}"
+    )
+    print("-" * 94)
+    for name, stats in groups.items():
+        latency = stats["latency"]
+        print(
+            f"{name[:36]:<36} {stats['total']:>6} {stats['skip_rate']:>6.1%} "
+            f"{stats['error_rate']:>6.1%} {stats['timeout_rate']:>8.1%} "
+            f"{_ms(latency['p50']):>8} {_ms(latency['p95']):>8} {_ms(latency['p99']):>8}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Latency percentiles and error rates from pipeline logs")
+    parser.add_argument("paths", nargs="*", type=Path, help="Log files or directories (default: LOG_DIR)")
+    parser.add_argument("--since", help="First date to include (YYYY-MM-DD, directories only)")
+    parser.add_argument("--until", help="Last date to include (YYYY-MM-DD, directories only)")
+    parser.add_argument("--json", action="store_true", help="Output JSON instead of tables")
+    args = parser.parse_args()
+
+    report = aggregate_logs(args.paths or None, since=args.since, until=args.until)
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    print(f"Records: {report['records']}")
+    _print_table("Selection by category", report["by_category"])
+    _print_table("Selection by template", report["by_template"])
+    if report["render_by_template"]:
+        _print_table("Render by template", report["render_by_template"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+[INPUT]: 随机生成的各 category data（含中文 / 数字开头 / 含 "." / 以 "-" 开头 / 空字符串的额外 key、嵌套对象与列表、
+         全部 value 为空的嵌套对象）
+[OUTPUT]: 失败用例的 payload 与错误；全部通过时退出码为 0
+[POS]: agentic/scripts 的 DSL 随机测试，验证 validate_dsl 接受 generate_dsl 的全部输出，
+       且编译发射器与逐项发射器（compiled=False）逐字节一致
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 scripts/.folder.md 的描述是否仍然准确。
+
+Usage:
+    cd site/src/lib
+    python -m agentic.scripts.test_dsl_fuzz [--cases 3000] [--seed 0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# 确保父目录在 Python 路径中
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agentic.renderers.dsl_generator import generate_dsl
+from agentic.renderers.dsl_parser import validate_dsl
+
+# 额外字段的 key：generate_dsl 原样输出，validate_dsl 必须接受
+EXTRA_KEYS = ["颜色", "2023", "v1.2", "-x", "note", "icon_2", "a-b", "重点.说明", "_", "€", "x:y"]
+# 逐字节一致性检查额外覆盖空字符串 key（两条路径都按无 inline key 输出 "-"）；其输出本身不是合法 DSL
+IDENTITY_KEYS = EXTRA_KEYS + [""]
+# 全部 value 为空的嵌套对象：generate_dsl 整体跳过，不能留下没有 block 的 key 行
+BLANKS: List[Any] = [{"x": ""}, {"x": None}, {"x": {}}, {"x": {"y": "  "}, "z": None}, {}]
+WORDS = ["苹果", "hello", "world", "增长 20%", "12", "-3.5", "true", "a -> b", "多行\n文本", "  空格  ", "x", "#1"]
+
+# (category, 模板, 顶层条目 key, 子项 key)；quadrants 不在 DATA_KEY_ORDER 中，generate_dsl 不输出，不参与
+SHAPES: List[Tuple[str, str, str, Optional[str]]] = [
+    ("chart", "chart-pie-plain-text", "values", None),
+    ("chart", "chart-combo", "primaryValues", None),
+    ("list", "list-grid-simple", "lists", None),
+    ("sequence", "sequence-timeline-simple", "sequences", None),
+    ("comparison", "compare-binary-horizontal-vs-simple", "compares", "children"),
+    ("hierarchy", "hierarchy-tree-tech-style-capsule-item", "root", "children"),
+    ("relation", "relation-dagre-flow-tb-simple-circle-node", "nodes", None),
+]
+
+
+def _scalar(rng: random.Random) -> Any:
+    roll = rng.random()
+    if roll < 0.6:
+        return rng.choice(WORDS)
+    if roll < 0.8:
+        return rng.randint(-100, 1000)
+    if roll < 0.9:
+        return round(rng.uniform(-10, 10), 2)
+    return rng.random() < 0.5
+
+
+def _value(rng: random.Random, depth: int, keys: List[str]) -> Any:
+    roll = rng.random()
+    if depth <= 0 or roll < 0.55:
+        return _scalar(rng)
+    if roll < 0.6:
+        return rng.choice(BLANKS)
+    if roll < 0.8:
+        return {key: _value(rng, depth - 1, keys) for key in rng.sample(keys, rng.randint(1, 3))}
+    return [_value(rng, depth - 1, keys) for _ in range(rng.randint(1, 3))]
+
+
+def _item(rng: random.Random, keys: List[str], depth: int = 2) -> Dict[str, Any]:
+    item: Dict[str, Any] = {}
+    if rng.random() < 0.8:
+        item["label"] = rng.choice(WORDS)
+    if rng.random() < 0.5:
+        item["value"] = rng.randint(0, 100)
+    if rng.random() < 0.3:
+        item["desc"] = rng.choice(WORDS)
+    for key in rng.sample(keys, rng.randint(0, 3)):
+        item[key] = _value(rng, depth, keys)
+    return item
+
+
+def _tree(rng: random.Random, depth: int, keys: List[str]) -> Dict[str, Any]:
+    node = _item(rng, keys, 1)
+    if depth > 0 and rng.random() < 0.7:
+        node["children"] = [_tree(rng, depth - 1, keys) for _ in range(rng.randint(1, 3))]
+    return node
+
+
+def random_payload(rng: random.Random, keys: List[str] = EXTRA_KEYS) -> Tuple[str, str, Dict[str, Any]]:
+    """随机的 (模板, category, data)，额外字段的 key 取自 keys"""
+    category, template, item_key, child_key = rng.choice(SHAPES)
+    data: Dict[str, Any] = {}
+    if rng.random() < 0.5:
+        data["title"] = rng.choice(WORDS)
+    if item_key == "root":
+        data["root"] = _tree(rng, 3, keys)
+        # 空 root 生成空的 data 段，validate_dsl 拒绝是预期行为
+        data["root"].setdefault("label", rng.choice(WORDS))
+    else:
+        items = []
+        for _ in range(rng.randint(1, 5)):
+            item = _item(rng, keys)
+            if child_key is not None:
+                item[child_key] = [
+                    rng.choice(WORDS) if rng.random() < 0.5 else _item(rng, keys, 1) for _ in range(rng.randint(1, 4))
+                ]
+            items.append(item)
+        data[item_key] = items
+        if template == "chart-combo":
+            data["secondaryValues"] = [_item(rng, keys) for _ in items]
+    if category == "relation":
+        labels = [item.get("label", "n") for item in data["nodes"]]
+        data["relations"] = [
+            {"from": rng.choice(labels), "to": rng.choice(labels), **({"label": "x"} if rng.random() < 0.3 else {})}
+            for _ in range(rng.randint(1, 4))
+        ]
+    if rng.random() < 0.3:
+        data["attributes"] = _value(rng, 2, keys) if rng.random() < 0.5 else {"颜色": "红", "2023": 5}
+    return template, category, data
+
+
+def check_validate_roundtrip(template: str, category: str, data: Dict[str, Any]) -> List[str]:
+    """validate_dsl(generate_dsl(...)) 必须没有错误（编译 / 逐项两条路径）"""
+    problems = []
+    for compiled in (True, False):
+        errors = validate_dsl(generate_dsl(template, category, data, compiled=compiled))
+        if errors:
+            problems.append(f"compiled={compiled}: {'; '.join(map(str, errors))}")
+    return problems
+
+
+def check_compiled_identical(template: str, category: str, data: Dict[str, Any]) -> List[str]:
+    """编译发射器的输出必须与逐项发射器逐字节一致"""
+    compiled = generate_dsl(template, category, data, compiled=True)
+    baseline = generate_dsl(template, category, data, compiled=False)
+    if compiled == baseline:
+        return []
+    for line_no, (a, b) in enumerate(zip(compiled.splitlines(), baseline.splitlines()), 1):
+        if a != b:
+            return [f"line {line_no}: compiled={a!r} baseline={b!r}"]
+    return [f"line count: compiled={len(compiled.splitlines())} baseline={len(baseline.splitlines())}"]
+
+
+# (检查, 生成 payload 用的额外 key)
+CHECKS: List[Tuple[Callable[[str, str, Dict[str, Any]], List[str]], List[str]]] = [
+    (check_validate_roundtrip, EXTRA_KEYS),
+    (check_compiled_identical, IDENTITY_KEYS),
+]
+
+
+def run(cases: int, seed: int) -> int:
+    """返回失败用例数"""
+    rng = random.Random(seed)
+    failures = 0
+    for index in range(cases):
+        for check, keys in CHECKS:
+            template, category, data = random_payload(rng, keys)
+            problems = check(template, category, data)
+            if problems:
+                failures += 1
+                if failures <= 5:
+                    print(f"✗ case {index} {check.__name__} {template}: {data!r}")
+                    for problem in problems:
+                        print(f"    {problem}")
+    return failures
+
+
+def test_dsl_fuzz() -> None:
+    assert run(2000, 0) == 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DSL 随机测试")
+    parser.add_argument("--cases", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    failures = run(args.cases, args.seed)
+    print(f"{args.cases} cases, {failures} failed")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@
 使用方法:
     cd site/src/lib/agentic
     .venv/bin/python -m scripts.test_pipeline /path/to/article.md
+    AGENTIC_PROFILE=cpu .venv/bin/python -m scripts.test_pipeline article.md -r -o out/   # 剖析报告写入 out/
 """
 
 from __future__ import annotations
@@ -55,6 +56,7 @@ sys.modules["agents"] = openai_agents_sdk
 
 # 现在导入本地模块 (使用 agentic 作为包名)
 from agentic.models import ArticleSegmentation, TemplateSelection, Intent
+from agentic.utils.profiling import profiled
 
 
 class PipelineLogger:
@@ -640,6 +642,7 @@ async def render_selections(
     return outputs
 
 
+@profiled("test_pipeline", output_dir_arg="output_dir")
 async def main(article_path: str, render: bool = False, output_dir: str = None):
     """主函数
 
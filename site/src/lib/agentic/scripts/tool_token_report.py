@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+[INPUT]: 全部 category agents 的 instructions 与 tools
+[OUTPUT]: 每个 agent 在 verbose / compact tool schema 模式下的 prompt token 对比表
+[POS]: agentic/scripts 的 token 统计脚本，评估 AGENTIC_TOOL_SCHEMA=compact 的收益
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 scripts/.folder.md 的描述是否仍然准确。
+
+Usage:
+    cd site/src/lib
+    python -m agentic.scripts.tool_token_report [--json]
+
+说明:
+    安装 tiktoken 时使用 o200k_base 精确计数，否则按字符估算。
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# 确保父目录在 Python 路径中
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agentic.tools.compact import tool_token_report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare verbose vs compact tool schema tokens")
+    parser.add_argument("--json", action="store_true", help="Output JSON instead of a table")
+    args = parser.parse_args()
+
+    report = tool_token_report()
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    print(f"{'Agent':<20} {'Tools':>5} {'Verbose':>9} {'Compact':>9} {'Saved':>9} {'Ratio':>7}")
+    print("-" * 64)
+    for row in report:
+        print(
+            f"{row['agent']:<20} {row['tools']:>5} {row['verbose']:>9} "
+            f"{row['compact']:>9} {row['saved']:>9} {row['ratio']:>7.1%}"
+        )
+    total_verbose = sum(r["verbose"] for r in report)
+    total_compact = sum(r["compact"] for r in report)
+    print("-" * 64)
+    print(
+        f"{'Total':<20} {'':>5} {total_verbose:>9} {total_compact:>9} "
+        f"{total_verbose - total_compact:>9} {total_compact / total_verbose:>7.1%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
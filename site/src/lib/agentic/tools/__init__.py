@@ -1,6 +1,6 @@
 """
-[INPUT]: 各分类 tools 模块
-[OUTPUT]: 所有 sub-category tools
+[INPUT]: 各分类 tools 模块（由 factory 按 ToolSpec 表生成）
+[OUTPUT]: 所有 sub-category tools；ToolSpec, build_tool, build_tools（tool 工厂）；ToolDataError, validate_tool_input（data_json 校验）；loads_tolerant, JSONRepairError（容错 JSON 解析）
 [POS]: tools 包的入口，导出所有 function tools
 
 [PROTOCOL]:
@@ -42,6 +42,9 @@ from .relation_tools import (
     relation_dagre_flow,
     relation_circle,
 )
+from .factory import ToolSpec, build_tool, build_tools
+from .json_repair import JSONRepairError, loads_tolerant
+from .schemas import ToolDataError, validate_tool_input
 from .sequence_tools import (
     sequence_stairs,
     sequence_timeline,
@@ -91,4 +94,13 @@ __all__ = [
     "sequence_funnel",
     "sequence_roadmap",
     "sequence_zigzag",
+    # Factory
+    "ToolSpec",
+    "build_tool",
+    "build_tools",
+    # Validation
+    "ToolDataError",
+    "validate_tool_input",
+    "loads_tolerant",
+    "JSONRepairError",
 ]
@@ -0,0 +1,229 @@
+"""
+[INPUT]: Intent.paragraphs 中的简单数值文本（"苹果占 27%，三星 21%"、"2020年 50，2021年 65"）及 Intent.intent
+[OUTPUT]: extract_chart_data, extract_chart_selection, ChartExtraction
+[POS]: agentic/tools 的本地 chart 数据提取器，规则匹配简单数值内容，置信度不足时交回 LLM
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 tools/.folder.md 的描述是否仍然准确。
+
+规则:
+    - 按标点把段落切成短句，每个短句必须整体匹配「标签 + 数值 + 单位」
+    - 全部为百分比且总和≈100 → chart-pie
+    - 标签均为年份/季度/月份且时间递增 → chart-line
+    - 同一单位的分类数值 → chart-column
+    - 标签是动词短语（"增长了"、"持平"）或相对时间（"今年收入"、"去年"）时不提取
+    置信度 = 被匹配短句覆盖的数值 / 文本中全部数值，再按意图文本是否支持该图表类型折算：
+    意图文本不含对应语义词（占比/趋势/对比…）时任何类型都达不到 MIN_CONFIDENCE；
+    分类数值即使有语义词也要求完全覆盖。存在未被解释的数值（可能是第二个指标、增长率等）
+    时置信度下降，交回 LLM。
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from ..models import Intent, TemplateSelection
+from .common import validate_list_field
+
+# 低于该置信度时交回 LLM
+MIN_CONFIDENCE = 0.8
+
+# 短句分隔符；不含 "："，以保留 "苹果：27%" 这类写法
+_CLAUSE_SPLIT = re.compile(r"[，,；;。！？!?\n]+")
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+
+_LEADING_WORDS = ("其中", "以及", "另外", "其次", "而", "和", "及", "与")
+_VERBS = r"(?:占比为?|占据|占|约为|约|为|是|达到|达|有|:|：)?"
+_UNITS = r"(?:%|％|万元|亿元|万人|万|亿|元|人|个|台|家|件|次|吨)?"
+_TRAILING = r"(?:左右|上下|多)?"
+
+_PAIR = re.compile(
+    rf"^(?P<label>[^\d%％]{{1,15}}?)\s*{_VERBS}\s*"
+    rf"(?P<value>\d+(?:\.\d+)?)\s*(?P<unit>{_UNITS})\s*{_TRAILING}$"
+)
+_TIME_POINT = re.compile(
+    rf"^(?P<label>(?P<year>(?:19|20)\d{{2}})\s*年?\s*"
+    rf"(?:(?P<quarter>Q[1-4]|第?[一二三四1-4]季度)|(?P<month>\d{{1,2}})\s*月)?)\s*"
+    rf"(?:的)?\s*[^\d%％]{{0,6}}?\s*{_VERBS}\s*(?P<value>\d+(?:\.\d+)?)\s*(?P<unit>{_UNITS})\s*{_TRAILING}$"
+)
+
+_QUARTERS = {"一": 1, "二": 2, "三": 3, "四": 4}
+
+# 动词短语与相对时间不是分类标签："增长了 20%"、"今年收入 100 万元" 交给 LLM
+_VERB_LABEL = re.compile(r"了$|增长|增加|上升|提升|提高|下降|下滑|降低|减少|回落|持平|同比|环比")
+_RELATIVE_TIME = re.compile(r"[今去前明本上下](?:年|月|季度?|周)")
+
+# 意图文本中支持各图表类型的语义词
+_INTENT_HINTS = {
+    "chart-pie": ("占比", "份额", "比例", "比重", "构成", "组成", "分布", "结构"),
+    "chart-line": ("趋势", "走势", "变化", "历年", "逐年", "增长", "演变", "发展"),
+    "chart-column": ("对比", "比较", "排名", "排行", "差异", "分布", "各"),
+}
+# 置信度折算系数：(意图文本支持, 意图文本不支持)
+_WEIGHTS = {
+    "chart-pie": (1.0, 0.75),
+    "chart-line": (1.0, 0.75),
+    "chart-column": (0.9, 0.6),
+}
+
+
+@dataclass
+class ChartExtraction:
+    """本地提取结果"""
+
+    sub_category: str
+    template: str
+    data: Dict[str, Any]
+    confidence: float
+    rationale: str
+
+
+def _clean_label(label: str) -> str:
+    label = label.strip(" 　\t")
+    for word in _LEADING_WORDS:
+        if label.startswith(word) and len(label) > len(word):
+            label = label[len(word):]
+            break
+    return label.strip(" 　\t")
+
+
+def _time_key(match: re.Match) -> tuple:
+    quarter = match.group("quarter")
+    if quarter:
+        digit = quarter[-1] if quarter.startswith("Q") else quarter.strip("第季度")
+        quarter_no = _QUARTERS.get(digit) or int(digit)
+    else:
+        quarter_no = 0
+    month = int(match.group("month") or 0)
+    return (int(match.group("year")), quarter_no, month)
+
+
+def _to_number(text: str) -> float:
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+def _clauses(paragraphs: List[str]) -> List[str]:
+    return [
+        clause.strip()
+        for paragraph in paragraphs
+        for clause in _CLAUSE_SPLIT.split(paragraph)
+        if clause.strip()
+    ]
+
+
+def _build(
+    sub_category: str,
+    template: str,
+    values: List[Dict[str, Any]],
+    coverage: float,
+    kind: str,
+    intent_text: str,
+) -> Optional[ChartExtraction]:
+    supported = any(hint in intent_text for hint in _INTENT_HINTS[sub_category])
+    confidence = coverage * _WEIGHTS[sub_category][0 if supported else 1]
+    data: Dict[str, Any] = {"values": values}
+    if sub_category == "chart-pie" and intent_text.strip():
+        data = {"title": intent_text.strip(), **data}
+    ok, _ = validate_list_field(data, "values", min_len=2)
+    if not ok:
+        return None
+    return ChartExtraction(
+        sub_category=sub_category,
+        template=template,
+        data=data,
+        confidence=round(confidence, 3),
+        rationale=f"本地规则提取：{kind}，{len(values)} 项（置信度 {confidence:.2f}）",
+    )
+
+
+def extract_chart_data(paragraphs: List[str], intent_text: str = "") -> Optional[ChartExtraction]:
+    """从段落中提取简单数值数据并推断 chart 类型
+
+    Args:
+        paragraphs: 意图块的段落列表
+        intent_text: 意图描述；用于确认图表类型并作为饼图标题，为空时置信度低于 MIN_CONFIDENCE
+
+    Returns:
+        ChartExtraction；没有可识别的模式时返回 None（置信度可能低于 MIN_CONFIDENCE）
+    """
+    clauses = _clauses(paragraphs)
+    total_numbers = sum(len(_NUMBER.findall(c)) for c in clauses)
+    if total_numbers == 0:
+        return None
+
+    time_points = []
+    pairs = []
+    covered = 0
+    for clause in clauses:
+        # "2023年份额如下：苹果 27%" 只匹配冒号后的部分，前半句视为上下文
+        for candidate in dict.fromkeys((clause, re.split(r"[:：]", clause)[-1].strip())):
+            match = _TIME_POINT.match(candidate)
+            if match:
+                time_points.append(match)
+                break
+            match = _PAIR.match(candidate)
+            if match:
+                pairs.append(match)
+                break
+        else:
+            continue
+        covered += len(_NUMBER.findall(candidate))
+    coverage = covered / total_numbers
+
+    # 时间序列: ≥3 个时间点，严格递增，单位一致
+    if len(time_points) >= 3 and not pairs:
+        keys = [_time_key(m) for m in time_points]
+        units = {m.group("unit") for m in time_points}
+        if len(units) == 1 and all(a < b for a, b in zip(keys, keys[1:])):
+            values = [
+                {"label": re.sub(r"\s+", "", m.group("label")), "value": _to_number(m.group("value"))}
+                for m in time_points
+            ]
+            return _build("chart-line", "chart-line-plain-text", values, coverage, "时间序列", intent_text)
+
+    if len(pairs) < 2 or time_points:
+        return None
+
+    labels = [_clean_label(m.group("label")) for m in pairs]
+    units = {m.group("unit") in ("%", "％") for m in pairs}
+    if len(set(labels)) != len(labels) or len(units) != 1 or any(not label for label in labels):
+        return None
+    if any(_VERB_LABEL.search(label) or _RELATIVE_TIME.search(label) for label in labels):
+        return None
+    values = [
+        {"label": label, "value": _to_number(m.group("value"))}
+        for label, m in zip(labels, pairs)
+    ]
+
+    if units == {True}:
+        # 占比: 2-6 项，总和≈100；否则可能是增长率等，不适合饼图
+        total = sum(v["value"] for v in values)
+        if len(values) <= 6 and 95 <= total <= 105 and all(len(l) <= 10 for l in labels):
+            return _build("chart-pie", "chart-pie-plain-text", values, coverage, "占比", intent_text)
+        return None
+
+    # 分类数值: 单位必须一致，3-8 项；分类对比语义比占比/时间序列更依赖上下文，置信度打折
+    if len({m.group("unit") for m in pairs}) == 1 and 3 <= len(values) <= 8:
+        if all(len(l) <= 8 for l in labels):
+            return _build("chart-column", "chart-column-simple", values, coverage, "分类数值", intent_text)
+    return None
+
+
+def extract_chart_selection(
+    intent: Intent, min_confidence: float = MIN_CONFIDENCE
+) -> Optional[TemplateSelection]:
+    """对简单数值内容直接生成 TemplateSelection，置信度不足时返回 None 交回 LLM"""
+    extraction = extract_chart_data(intent.paragraphs, intent.intent)
+    if extraction is None or extraction.confidence < min_confidence:
+        return None
+    return TemplateSelection(
+        category="chart",
+        sub_category=extraction.sub_category,
+        template=extraction.template,
+        data=extraction.data,
+        rationale=extraction.rationale,
+    )
@@ -1,75 +1,48 @@
 """
-[INPUT]: intent, paragraphs 从 category agent 传入
-[OUTPUT]: TemplateSelection - 选择的模板和数据
+[INPUT]: ToolSpec 表（场景说明、模板简短说明、参数说明）；factory.build_tools 按 TEMPLATE_CATEGORIES 生成 tool
+[OUTPUT]: chart_pie, chart_bar, chart_line, chart_column, chart_wordcloud, chart_combo（FunctionTool，返回 TemplateSelection 或 ToolDataError）；CHART_TOOL_SPECS
 [POS]: agentic/tools 的 chart 分类工具集
 
 [PROTOCOL]:
 1. 一旦本文件逻辑变更，必须同步更新此 Header。
 2. 更新后必须上浮检查 tools/.folder.md 的描述是否仍然准确。
+
+模板名、"## 可用模板" 的顺序与容量提示由目录生成；新增模板只需改 config.templates，必要时在 template_notes 中补一句说明。
 """
 
 from __future__ import annotations
 
-from typing import Literal
-
-from agents import function_tool
-
-from ..models import TemplateSelection
-from .common import log_tool_call, parse_data_json, validate_list_field
-
-
-# Type aliases for template parameters
-ChartPieTemplate = Literal[
-    "chart-pie-plain-text"
-]
-
-ChartBarTemplate = Literal["chart-bar-plain-text"]
-
-ChartLineTemplate = Literal["chart-line-plain-text"]
-
-ChartColumnTemplate = Literal["chart-column-simple"]
-
-ChartWordcloudTemplate = Literal["chart-wordcloud"]
+from .factory import ToolSpec, build_tools
 
-ChartComboTemplate = Literal["chart-combo"]
-
-
-@function_tool
-def chart_pie(
-    template: ChartPieTemplate,
-    data_json: str,
-    rationale: str,
-) -> TemplateSelection:
-    """选择 chart-pie 类型模板 - 饼图/环形图，展示占比关系。
-
-    ## 可用模板
-    - 由对应的 Literal 类型定义（与 getTemplates 对齐）
-
-    ## 适用场景
-    - 占比关系、部分与整体
-    - 百分比数据（各项之和=100%）
-    - 市场份额、预算分配
-
-    ## 不适用场景
-    - 趋势变化（用 chart-line）
-    - 数值大小对比（用 chart-bar）
-    - 时间序列数据
-    - 超过 6 个分类
-    - 定性描述（用 list）
-
-    ## 与其他 chart 类型的区别
-    - chart-pie: 占比关系，各项相加=100%
-    - chart-bar: 数值大小对比，横向条形
-    - chart-line: 趋势变化，连续数据
-    - chart-column: 分类对比，纵向柱状
-    - chart-wordcloud: 词频展示，关键词云
-
-    ## 数据格式
-    {"title": "<可选标题>", "values": [{"label": "<分类名>", "value": <数值>, "desc": "<可选描述>"}...]}
-
-    Args:
-        template: 模板名称（必填），取值由对应的 Literal 类型定义
-        data_json: JSON 字符串（必填）。
+CHART_TOOL_SPECS = (
+    ToolSpec(
+        sub_category="chart-pie",
+        summary="饼图/环形图，展示占比关系。",
+        guide="""
+            ## 适用场景
+            - 占比关系、部分与整体
+            - 百分比数据（各项之和=100%）
+            - 市场份额、预算分配
+
+            ## 不适用场景
+            - 趋势变化（用 chart-line）
+            - 数值大小对比（用 chart-bar）
+            - 时间序列数据
+            - 超过 6 个分类
+            - 定性描述（用 list）
+
+            ## 与其他 chart 类型的区别
+            - chart-pie: 占比关系，各项相加=100%
+            - chart-bar: 数值大小对比，横向条形
+            - chart-line: 趋势变化，连续数据
+            - chart-column: 分类对比，纵向柱状
+            - chart-wordcloud: 词频展示，关键词云
+
+            ## 数据格式
+            {"title": "<可选标题>", "values": [{"label": "<分类名>", "value": <数值>, "desc": "<可选描述>"}...]}
+            """,
+        data_json="""
+            JSON 字符串（必填）。
             格式: {"title": "<可选标题>", "values": [{"label": "<名称>", "value": <数值>, "desc": "<可选描述>"}...]}
             规则:
             - title 可选，用于图表标题（如"2023年市场份额"）
@@ -82,62 +55,35 @@ def chart_pie(
             示例1: {"values": [{"label": "苹果", "value": 45}, {"label": "三星", "value": 35}, {"label": "其他", "value": 20}]}
             示例2: {"title": "部门预算占比", "values": [{"label": "研发", "value": 35}, {"label": "销售", "value": 25}, {"label": "运营", "value": 20}, {"label": "行政", "value": 15}, {"label": "其他", "value": 5}]}
             示例3: {"values": [{"label": "移动端", "value": 55, "desc": "手机+平板"}, {"label": "桌面端", "value": 30}, {"label": "其他", "value": 15}]}
-        rationale: 选择该模板的理由（必填）
-    """
-    data = parse_data_json(data_json)
-    log_tool_call("chart_pie", template, data_json, rationale, data)
-    ok, reason = validate_list_field(data, "values", min_len=2)
-    if not ok:
-        return TemplateSelection(
-            category="chart",
-            sub_category="chart-pie",
-            template=None,
-            data=None,
-            rationale=f"数据不完整，无法渲染饼图：{reason}",
-        )
-    return TemplateSelection(
-        category="chart",
-        sub_category="chart-pie",
-        template=template,
-        data=data,
-        rationale=rationale,
-    )
-
-
-@function_tool
-def chart_bar(
-    template: ChartBarTemplate,
-    data_json: str,
-    rationale: str,
-) -> TemplateSelection:
-    """选择 chart-bar 类型模板 - 横向条形图，展示数值大小对比。
-
-    ## 可用模板
-    - 由对应的 Literal 类型定义（与 getTemplates 对齐）
-
-    ## 适用场景
-    - 类别对比、排名展示
-    - 数值大小对比
-    - 需要 >=2 个数值数据点
-
-    ## 不适用场景
-    - 时间序列（用 chart-line）
-    - 占比数据（用 chart-pie）
-    - 趋势变化
-    - 定性描述、单一数值
-
-    ## 与其他 chart 类型的区别
-    - chart-bar: 横向条形，适合较长标签，强调排名
-    - chart-column: 纵向柱状，适合短标签，强调对比
-    - chart-pie: 占比关系
-    - chart-line: 连续趋势
-
-    ## 数据格式
-    {"title": "<可选标题>", "values": [{"label": "<类别名>", "value": <数值>, "desc": "<可选描述>"}...]}
-
-    Args:
-        template: 模板名称（必填），取值由对应的 Literal 类型定义
-        data_json: JSON 字符串（必填）。
+            """,
+        rationale="选择该模板的理由（必填）",
+    ),
+    ToolSpec(
+        sub_category="chart-bar",
+        summary="横向条形图，展示数值大小对比。",
+        guide="""
+            ## 适用场景
+            - 类别对比、排名展示
+            - 数值大小对比
+            - 需要 >=2 个数值数据点
+
+            ## 不适用场景
+            - 时间序列（用 chart-line）
+            - 占比数据（用 chart-pie）
+            - 趋势变化
+            - 定性描述、单一数值
+
+            ## 与其他 chart 类型的区别
+            - chart-bar: 横向条形，适合较长标签，强调排名
+            - chart-column: 纵向柱状，适合短标签，强调对比
+            - chart-pie: 占比关系
+            - chart-line: 连续趋势
+
+            ## 数据格式
+            {"title": "<可选标题>", "values": [{"label": "<类别名>", "value": <数值>, "desc": "<可选描述>"}...]}
+            """,
+        data_json="""
+            JSON 字符串（必填）。
             格式: {"title": "<可选标题>", "values": [{"label": "<类别名>", "value": <数值>, "desc": "<可选描述>"}...]}
             规则:
             - title 可选，用于图表标题（如"城市GDP排名"）
@@ -150,61 +96,34 @@ def chart_bar(
             示例1: {"values": [{"label": "上海", "value": 4.32}, {"label": "北京", "value": 4.03}, {"label": "深圳", "value": 3.24}]}
             示例2: {"title": "用户偏好排名", "values": [{"label": "性能", "value": 92}, {"label": "价格", "value": 85}, {"label": "外观", "value": 78}, {"label": "售后", "value": 65}]}
             示例3: {"values": [{"label": "深圳", "value": 120, "desc": "华南区"}, {"label": "上海", "value": 115, "desc": "华东区"}, {"label": "北京", "value": 98, "desc": "华北区"}]}
-        rationale: 选择该模板的理由（必填）
-    """
-    data = parse_data_json(data_json)
-    log_tool_call("chart_bar", template, data_json, rationale, data)
-    ok, reason = validate_list_field(data, "values", min_len=2)
-    if not ok:
-        return TemplateSelection(
-            category="chart",
-            sub_category="chart-bar",
-            template=None,
-            data=None,
-            rationale=f"数据不完整，无法渲染条形图：{reason}",
-        )
-    return TemplateSelection(
-        category="chart",
-        sub_category="chart-bar",
-        template=template,
-        data=data,
-        rationale=rationale,
-    )
-
-
-@function_tool
-def chart_line(
-    template: ChartLineTemplate,
-    data_json: str,
-    rationale: str,
-) -> TemplateSelection:
-    """选择 chart-line 类型模板 - 折线图，展示趋势变化。
-
-    ## 可用模板
-    - 由对应的 Literal 类型定义（与 getTemplates 对齐）
-
-    ## 适用场景
-    - 趋势变化、时间序列
-    - 连续数据、>=3 个有序数据点
-    - 上升或下降趋势展示
-
-    ## 不适用场景
-    - 类别对比（用 chart-bar）
-    - 占比数据（用 chart-pie）
-    - 无顺序数据
-    - 定性描述、<3 个数据点
-
-    ## 与其他 chart 类型的区别
-    - chart-line: 连续趋势，数据点用线连接
-    - chart-bar/column: 离散对比
-    - chart-pie: 占比关系
-
-    ## 数据格式
-    {"title": "<可选标题>", "values": [{"label": "<时间点>", "value": <数值>, "desc": "<可选描述>"}...]}
-
-    Args:
-        template: 模板名称（必填），取值由对应的 Literal 类型定义
-        data_json: JSON 字符串（必填）。
+            """,
+        rationale="选择该模板的理由（必填）",
+    ),
+    ToolSpec(
+        sub_category="chart-line",
+        summary="折线图，展示趋势变化。",
+        guide="""
+            ## 适用场景
+            - 趋势变化、时间序列
+            - 连续数据、>=3 个有序数据点
+            - 上升或下降趋势展示
+
+            ## 不适用场景
+            - 类别对比（用 chart-bar）
+            - 占比数据（用 chart-pie）
+            - 无顺序数据
+            - 定性描述、<3 个数据点
+
+            ## 与其他 chart 类型的区别
+            - chart-line: 连续趋势，数据点用线连接
+            - chart-bar/column: 离散对比
+            - chart-pie: 占比关系
+
+            ## 数据格式
+            {"title": "<可选标题>", "values": [{"label": "<时间点>", "value": <数值>, "desc": "<可选描述>"}...]}
+            """,
+        data_json="""
+            JSON 字符串（必填）。
             格式: {"title": "<可选标题>", "values": [{"label": "<时间点>", "value": <数值>, "desc": "<可选描述>"}...]}
             规则:
             - title 可选，用于图表标题（如"营收增长趋势"）
@@ -217,62 +136,35 @@ def chart_line(
             示例1: {"values": [{"label": "Q1", "value": 85}, {"label": "Q2", "value": 92}, {"label": "Q3", "value": 78}, {"label": "Q4", "value": 105}]}
             示例2: {"title": "年度营收", "values": [{"label": "2020", "value": 50}, {"label": "2021", "value": 65}, {"label": "2022", "value": 82}, {"label": "2023", "value": 100}]}
             示例3: {"values": [{"label": "1月", "value": 1000}, {"label": "2月", "value": 600}, {"label": "3月", "value": 1200}]}
-        rationale: 选择该模板的理由（必填）
-    """
-    data = parse_data_json(data_json)
-    log_tool_call("chart_line", template, data_json, rationale, data)
-    ok, reason = validate_list_field(data, "values", min_len=2)
-    if not ok:
-        return TemplateSelection(
-            category="chart",
-            sub_category="chart-line",
-            template=None,
-            data=None,
-            rationale=f"数据不完整，无法渲染折线图：{reason}",
-        )
-    return TemplateSelection(
-        category="chart",
-        sub_category="chart-line",
-        template=template,
-        data=data,
-        rationale=rationale,
-    )
-
-
-@function_tool
-def chart_column(
-    template: ChartColumnTemplate,
-    data_json: str,
-    rationale: str,
-) -> TemplateSelection:
-    """选择 chart-column 类型模板 - 纵向柱状图，展示分类数据对比。
-
-    ## 可用模板
-    - 由对应的 Literal 类型定义（与 getTemplates 对齐）
-
-    ## 适用场景
-    - 数值对比、离散时间点
-    - 类别对比
-    - 需要 >=2 个数值数据点
-
-    ## 不适用场景
-    - 连续趋势（用 chart-line）
-    - 占比数据（用 chart-pie）
-    - 定性描述
-    - 标签过长（用 chart-bar）
-
-    ## 与其他 chart 类型的区别
-    - chart-column: 纵向柱状，适合短标签
-    - chart-bar: 横向条形，适合长标签
-    - chart-line: 连续趋势
-    - chart-pie: 占比关系
-
-    ## 数据格式
-    {"title": "<可选标题>", "values": [{"label": "<类别名>", "value": <数值>, "desc": "<可选描述>"}...]}
-
-    Args:
-        template: 模板名称（必填），取值由对应的 Literal 类型定义
-        data_json: JSON 字符串（必填）。
+            """,
+        rationale="选择该模板的理由（必填）",
+    ),
+    ToolSpec(
+        sub_category="chart-column",
+        summary="纵向柱状图，展示分类数据对比。",
+        guide="""
+            ## 适用场景
+            - 数值对比、离散时间点
+            - 类别对比
+            - 需要 >=2 个数值数据点
+
+            ## 不适用场景
+            - 连续趋势（用 chart-line）
+            - 占比数据（用 chart-pie）
+            - 定性描述
+            - 标签过长（用 chart-bar）
+
+            ## 与其他 chart 类型的区别
+            - chart-column: 纵向柱状，适合短标签
+            - chart-bar: 横向条形，适合长标签
+            - chart-line: 连续趋势
+            - chart-pie: 占比关系
+
+            ## 数据格式
+            {"title": "<可选标题>", "values": [{"label": "<类别名>", "value": <数值>, "desc": "<可选描述>"}...]}
+            """,
+        data_json="""
+            JSON 字符串（必填）。
             格式: {"title": "<可选标题>", "values": [{"label": "<类别名>", "value": <数值>, "desc": "<可选描述>"}...]}
             规则:
             - title 可选，用于图表标题（如"部门人数"）
@@ -285,61 +177,34 @@ def chart_column(
             示例1: {"values": [{"label": "研发", "value": 120}, {"label": "销售", "value": 85}, {"label": "运营", "value": 45}, {"label": "行政", "value": 30}]}
             示例2: {"title": "产品销量", "values": [{"label": "A产品", "value": 5000}, {"label": "B产品", "value": 3200}, {"label": "C产品", "value": 2800}]}
             示例3: {"values": [{"label": "华东", "value": 1.2, "desc": "上海为主"}, {"label": "华南", "value": 0.9}, {"label": "华北", "value": 0.85}]}
-        rationale: 选择该模板的理由（必填）
-    """
-    data = parse_data_json(data_json)
-    log_tool_call("chart_column", template, data_json, rationale, data)
-    ok, reason = validate_list_field(data, "values", min_len=2)
-    if not ok:
-        return TemplateSelection(
-            category="chart",
-            sub_category="chart-column",
-            template=None,
-            data=None,
-            rationale=f"数据不完整，无法渲染柱状图：{reason}",
-        )
-    return TemplateSelection(
-        category="chart",
-        sub_category="chart-column",
-        template=template,
-        data=data,
-        rationale=rationale,
-    )
-
-
-@function_tool
-def chart_wordcloud(
-    template: ChartWordcloudTemplate,
-    data_json: str,
-    rationale: str,
-) -> TemplateSelection:
-    """选择 chart-wordcloud 类型模板 - 词云图，展示关键词频率。
-
-    ## 可用模板
-    - 由对应的 Literal 类型定义（与 getTemplates 对齐）
-
-    ## 适用场景
-    - 关键词频率、词频统计
-    - 主题分布、>=5 个词语
-    - 视觉丰富的展示
-
-    ## 不适用场景
-    - 精确数值对比
-    - 趋势变化
-    - 少于 5 个词
-    - 需要精确排名
-
-    ## 与其他 chart 类型的区别
-    - chart-wordcloud: 词语大小表示频率，适合关键词展示
-    - chart-bar: 精确数值对比
-    - chart-pie: 占比关系
-
-    ## 数据格式
-    {"title": "<可选标题>", "values": [{"label": "<关键词>", "value": <权重数值>}...]}
-
-    Args:
-        template: 模板名称（必填），取值由对应的 Literal 类型定义
-        data_json: JSON 字符串（必填）。
+            """,
+        rationale="选择该模板的理由（必填）",
+    ),
+    ToolSpec(
+        sub_category="chart-wordcloud",
+        summary="词云图，展示关键词频率。",
+        guide="""
+            ## 适用场景
+            - 关键词频率、词频统计
+            - 主题分布、>=5 个词语
+            - 视觉丰富的展示
+
+            ## 不适用场景
+            - 精确数值对比
+            - 趋势变化
+            - 少于 5 个词
+            - 需要精确排名
+
+            ## 与其他 chart 类型的区别
+            - chart-wordcloud: 词语大小表示频率，适合关键词展示
+            - chart-bar: 精确数值对比
+            - chart-pie: 占比关系
+
+            ## 数据格式
+            {"title": "<可选标题>", "values": [{"label": "<关键词>", "value": <权重数值>}...]}
+            """,
+        data_json="""
+            JSON 字符串（必填）。
             格式: {"title": "<可选标题>", "values": [{"label": "<关键词>", "value": <权重>}...]}
             规则:
             - title 可选，用于图表标题（如"技术热词"）
@@ -352,76 +217,49 @@ def chart_wordcloud(
             示例1: {"values": [{"label": "AI", "value": 100}, {"label": "大数据", "value": 85}, {"label": "云计算", "value": 72}, {"label": "区块链", "value": 55}, {"label": "物联网", "value": 42}]}
             示例2: {"title": "用户评价", "values": [{"label": "好用", "value": 100}, {"label": "便宜", "value": 90}, {"label": "快速", "value": 80}, {"label": "稳定", "value": 70}, {"label": "简洁", "value": 60}, {"label": "美观", "value": 50}]}
             示例3: {"values": [{"label": "数字化", "value": 100}, {"label": "智能制造", "value": 90}, {"label": "绿色低碳", "value": 80}, {"label": "可持续", "value": 70}]}
-        rationale: 选择该模板的理由（必填）
-    """
-    data = parse_data_json(data_json)
-    log_tool_call("chart_wordcloud", template, data_json, rationale, data)
-    ok, reason = validate_list_field(data, "values", min_len=3)
-    if not ok:
-        return TemplateSelection(
-            category="chart",
-            sub_category="chart-wordcloud",
-            template=None,
-            data=None,
-            rationale=f"数据不完整，无法渲染词云：{reason}",
-        )
-    return TemplateSelection(
-        category="chart",
-        sub_category="chart-wordcloud",
-        template=template,
-        data=data,
-        rationale=rationale,
-    )
-
-
-@function_tool
-def chart_combo(
-    template: ChartComboTemplate,
-    data_json: str,
-    rationale: str,
-) -> TemplateSelection:
-    """选择 chart-combo 类型模板 - 双轴组合图（柱状图+折线图）。
-
-    ## 可用模板
-    - 由对应的 Literal 类型定义（与 getTemplates 对齐）
-
-    ## 适用场景
-    - 同一维度（如时间）下需要展示两个不同指标
-    - 主指标（绝对值）用柱状图，副指标（比率/增长率）用折线图
-    - 典型例子：营收 + 增长率、销量 + 转化率、成本 + 利润率
-
-    ## 不适用场景
-    - 两个指标没有共同的 X 轴维度
-    - 只有一个指标需要展示（用 chart-line 或 chart-column）
-    - 两个指标单位相同，无需双轴（用 chart-line 或 chart-column）
-
-    ## 与其他 chart 类型的区别
-    - chart-combo: 双轴组合，柱状图+折线图，两个不同单位的指标
-    - chart-line: 单轴折线，单一指标趋势
-    - chart-column: 单轴柱状，单一指标对比
-    - chart-bar: 横向条形，排名展示
-
-    ## 数据格式
-    {
-      "title": "<标题>",
-      "xTitle": "<X轴标题>",
-      "primaryYTitle": "<左Y轴标题>",
-      "secondaryYTitle": "<右Y轴标题>",
-      "primaryLabel": "<左轴图例>",
-      "secondaryLabel": "<右轴图例>",
-      "primaryMin": <左轴起始值>,
-      "primaryMax": <左轴最大值>,
-      "primaryStep": <左轴刻度间隔>,
-      "secondaryMin": <右轴起始值>,
-      "secondaryMax": <右轴最大值>,
-      "secondaryStep": <右轴刻度间隔>,
-      "primaryValues": [{"label": "<X轴标签>", "value": <主指标值>}...],
-      "secondaryValues": [{"label": "<X轴标签>", "value": <副指标值>}...]
-    }
-
-    Args:
-        template: 模板名称（必填），固定为 "chart-combo"
-        data_json: JSON 字符串（必填）。
+            """,
+        rationale="选择该模板的理由（必填）",
+    ),
+    ToolSpec(
+        sub_category="chart-combo",
+        summary="双轴组合图（柱状图+折线图）。",
+        guide="""
+            ## 适用场景
+            - 同一维度（如时间）下需要展示两个不同指标
+            - 主指标（绝对值）用柱状图，副指标（比率/增长率）用折线图
+            - 典型例子：营收 + 增长率、销量 + 转化率、成本 + 利润率
+
+            ## 不适用场景
+            - 两个指标没有共同的 X 轴维度
+            - 只有一个指标需要展示（用 chart-line 或 chart-column）
+            - 两个指标单位相同，无需双轴（用 chart-line 或 chart-column）
+
+            ## 与其他 chart 类型的区别
+            - chart-combo: 双轴组合，柱状图+折线图，两个不同单位的指标
+            - chart-line: 单轴折线，单一指标趋势
+            - chart-column: 单轴柱状，单一指标对比
+            - chart-bar: 横向条形，排名展示
+
+            ## 数据格式
+            {
+              "title": "<标题>",
+              "xTitle": "<X轴标题>",
+              "primaryYTitle": "<左Y轴标题>",
+              "secondaryYTitle": "<右Y轴标题>",
+              "primaryLabel": "<左轴图例>",
+              "secondaryLabel": "<右轴图例>",
+              "primaryMin": <左轴起始值>,
+              "primaryMax": <左轴最大值>,
+              "primaryStep": <左轴刻度间隔>,
+              "secondaryMin": <右轴起始值>,
+              "secondaryMax": <右轴最大值>,
+              "secondaryStep": <右轴刻度间隔>,
+              "primaryValues": [{"label": "<X轴标签>", "value": <主指标值>}...],
+              "secondaryValues": [{"label": "<X轴标签>", "value": <副指标值>}...]
+            }
+            """,
+        data_json="""
+            JSON 字符串（必填）。
             格式: {"title": "<标题>", "primaryValues": [...], "secondaryValues": [...], ...}
             规则:
             - title 可选，用于图表标题（如"季度业绩对比"）
@@ -442,37 +280,16 @@ def chart_combo(
             - values 数组 2-8 项
             示例1: {"title": "季度业绩", "primaryValues": [{"label": "Q1", "value": 100}, {"label": "Q2", "value": 150}], "secondaryValues": [{"label": "Q1", "value": 10}, {"label": "Q2", "value": 25}], "primaryLabel": "营收", "secondaryLabel": "增长率", "primaryMax": 200, "primaryStep": 50, "secondaryMax": 40, "secondaryStep": 10}
             示例2: {"title": "年度用户增长", "xTitle": "年份", "primaryYTitle": "用户数 (万)", "secondaryYTitle": "同比增长 (%)", "primaryValues": [{"label": "2022", "value": 120}, {"label": "2023", "value": 280}], "secondaryValues": [{"label": "2022", "value": 0}, {"label": "2023", "value": 133}], "primaryMax": 300, "primaryStep": 100}
-        rationale: 选择该模板的理由（必填）
-    """
-    data = parse_data_json(data_json)
-    log_tool_call("chart_combo", template, data_json, rationale, data)
-
-    # 验证 primaryValues
-    ok1, reason1 = validate_list_field(data, "primaryValues", min_len=2)
-    if not ok1:
-        return TemplateSelection(
-            category="chart",
-            sub_category="chart-combo",
-            template=None,
-            data=None,
-            rationale=f"数据不完整，无法渲染组合图：{reason1}",
-        )
-
-    # 验证 secondaryValues
-    ok2, reason2 = validate_list_field(data, "secondaryValues", min_len=2)
-    if not ok2:
-        return TemplateSelection(
-            category="chart",
-            sub_category="chart-combo",
-            template=None,
-            data=None,
-            rationale=f"数据不完整，无法渲染组合图：{reason2}",
-        )
-
-    return TemplateSelection(
-        category="chart",
-        sub_category="chart-combo",
-        template=template,
-        data=data,
-        rationale=rationale,
-    )
+            """,
+        rationale="选择该模板的理由（必填）",
+    ),
+)
+
+_tools = build_tools(CHART_TOOL_SPECS)
+
+chart_pie = _tools["chart_pie"]
+chart_bar = _tools["chart_bar"]
+chart_line = _tools["chart_line"]
+chart_column = _tools["chart_column"]
+chart_wordcloud = _tools["chart_wordcloud"]
+chart_combo = _tools["chart_combo"]
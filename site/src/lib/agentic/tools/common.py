@@ -1,6 +1,7 @@
 """
-[INPUT]: category 名称
-[OUTPUT]: 对应 category 的 skip tool，返回 TemplateSelection
+[INPUT]: category 名称, LLM 传入的 template / data_json
+[OUTPUT]: 对应 category 的 skip tool，make_selection（容错解析 + 校验后构造 TemplateSelection 或返回 ToolDataError），
+    stop_on_selection（category agent 的 tool_use_behavior），parse_data_json, validate_list_field, log_tool_call
 [POS]: agentic/tools 的通用工具模块，提供跨 category 共享的功能
 
 [PROTOCOL]:
@@ -10,11 +11,128 @@
 
 from __future__ import annotations
 
-from typing import Callable
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from agents import function_tool
+from agents import FunctionToolResult, RunContextWrapper, ToolsToFinalOutputResult, function_tool
 
 from ..models import TemplateSelection
+from ..utils import get_logger, metrics
+from .json_repair import JSONRepairError, loads_tolerant
+from .schemas import ToolDataError, validate_tool_input
+
+_tool_logger = get_logger("agentic.tools")
+
+
+def parse_data_json(data_json: str) -> Optional[Dict[str, Any]]:
+    """解析 LLM 传入的 data_json。
+
+    解析失败或顶层不是对象时返回 None，由调用方的校验逻辑给出失败原因，
+    而不是让异常穿透到 Runner。
+    """
+    if not data_json:
+        return None
+    try:
+        data, _ = loads_tolerant(data_json)
+    except JSONRepairError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def validate_list_field(
+    data: Optional[Dict[str, Any]],
+    field: str,
+    min_len: int = 1,
+) -> Tuple[bool, str]:
+    """校验 data[field] 是否为可渲染的 {label, value} 列表。
+
+    规则:
+    - data 必须是对象，field 必须是数组且至少 min_len 项
+    - 每项必须是对象且包含非空 label
+    - 若包含 value，则必须是数值（bool 不算数值）
+
+    Returns:
+        (是否通过, 失败原因)
+    """
+    if not isinstance(data, dict):
+        return False, "data_json 不是合法的 JSON 对象"
+    items = data.get(field)
+    if not isinstance(items, list):
+        return False, f"缺少 {field} 数组"
+    if len(items) < min_len:
+        return False, f"{field} 至少需要 {min_len} 项，实际 {len(items)} 项"
+    for i, item in enumerate(items):
+        if not isinstance(item, dict):
+            return False, f"{field}[{i}] 不是对象"
+        label = item.get("label")
+        if label is None or not str(label).strip():
+            return False, f"{field}[{i}] 缺少 label"
+        if "value" in item:
+            value = item["value"]
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return False, f"{field}[{i}].value 不是数值"
+    return True, ""
+
+
+def log_tool_call(
+    tool_name: str,
+    template: str,
+    data_json: str,
+    rationale: str,
+    data: Optional[Dict[str, Any]] = None,
+) -> None:
+    """调试日志：记录 LLM 传给 tool 的参数及解析结果"""
+    _tool_logger.debug(
+        f"🔧 {tool_name} | template: {template} | "
+        f"data_json: {data_json[:200] if data_json else 'EMPTY'} | "
+        f"rationale: {rationale[:100] if rationale else 'EMPTY'}"
+    )
+
+
+def make_selection(
+    tool_name: str,
+    category: str,
+    sub_category: str,
+    template: str,
+    data_json: str,
+    rationale: str,
+) -> Union[TemplateSelection, ToolDataError]:
+    """校验 tool 参数并构造 TemplateSelection。
+
+    data_json 的格式缺陷能在本地修复的直接修复（记录日志与 agentic_json_repairs 指标），不消耗模型重试。
+    校验失败时返回 ToolDataError：stop_on_selection 不会把它当作最终输出，
+    模型在同一次 run 中看到问题列表并修正后重新调用。
+    """
+    data, error, repairs = validate_tool_input(tool_name, category, sub_category, template, data_json)
+    log_tool_call(tool_name, template, data_json, rationale, data)
+    for repair in repairs:
+        metrics.json_repairs.inc(repair=repair, outcome="failed" if error is not None else "repaired")
+    if repairs and error is None:
+        _tool_logger.info(f"🩹 {tool_name} | data_json repaired locally: {', '.join(repairs)}")
+    if error is not None:
+        _tool_logger.info(f"⚠️ {tool_name} | invalid data_json: {'; '.join(error.problems)}")
+        return error
+    return TemplateSelection(
+        category=category,
+        sub_category=sub_category,
+        template=template,
+        data=data,
+        rationale=rationale,
+    )
+
+
+def stop_on_selection(
+    context: RunContextWrapper[Any],
+    tool_results: List[FunctionToolResult],
+) -> ToolsToFinalOutputResult:
+    """category agent 的 tool_use_behavior：第一个 TemplateSelection 即为最终输出。
+
+    其余输出（ToolDataError、tool 异常信息）交回模型，由其修正后重试；
+    重试次数受 Runner.run 的 max_turns 约束。
+    """
+    for result in tool_results:
+        if isinstance(result.output, TemplateSelection):
+            return ToolsToFinalOutputResult(is_final_output=True, final_output=result.output)
+    return ToolsToFinalOutputResult(is_final_output=False, final_output=None)
 
 
 def create_skip_tool(category: str) -> Callable:
@@ -0,0 +1,272 @@
+"""
+[INPUT]: tools.factory 生成的 FunctionTool, TEMPLATE_CATEGORIES, describe_limits（模板容量上限）, AGENTIC_TOOL_SCHEMA 环境变量
+[OUTPUT]: compact_tool, apply_tool_schema_mode, tool_token_report, COMPACT_TOOL_RULES
+[POS]: agentic/tools 的精简 schema 模式，用目录元数据 + 规则表替代冗长的 docstring 描述
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 tools/.folder.md 的描述是否仍然准确。
+
+背景:
+    完整的 tool 描述（ToolSpec 的适用/不适用场景、跨类型对比、示例）
+    每次 category agent 调用都会重复发送。compact 模式只保留:
+    - 子分类描述（来自 TEMPLATE_CATEGORIES）
+    - 一行规则（COMPACT_TOOL_RULES）
+    - 按目录生成的容量上限（describe_limits）；各模板上限不同时逐一列出，与 fit_selection 一致
+    - data_json 结构
+    - template 的 enum 取值
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from agents import FunctionTool
+
+from ..config import TEMPLATE_CATEGORIES, describe_limits
+from ..utils import get_tool_schema_mode
+
+# 各 category 的 data_json 结构
+_VALUES = '{"title"?,"values":[{"label","value","desc"?}]}'
+_LISTS = '{"lists":[{"label","desc"?,"icon"?}]}'
+_SEQUENCES = '{"sequences":[{"label","desc"?}]}'
+_TIMED_SEQUENCES = '{"sequences":[{"label","time"?,"desc"?}]}'
+_COMPARES = '{"compares":[{"label","children":[str]}]}'
+_QUADRANTS = '{"xAxis","yAxis","quadrants":[{"title","items":[str]}]}'
+_TREE = '{"root":{"label","children":[{"label","children"?}]}}'
+_GRAPH = '{"nodes":[{"id","label"}],"relations":[{"from","to","label"?}]}'
+
+# 子分类 -> (data_json 结构, 一行规则)
+# 规则只保留约束本身；场景说明由子分类描述承担。
+# 目录中的容量上限（最大项数、标签长度、深度、节点数）不写在这里，由 _limits_rule 按模板生成
+COMPACT_TOOL_RULES: Dict[str, Tuple[str, str]] = {
+    # Chart
+    "chart-pie": (_VALUES, "占比，各项和≈100；3-6项"),
+    "chart-bar": (_VALUES, "数值排名；3-10项按值降序"),
+    "chart-line": (_VALUES, "时间趋势；3-12项按时间排序；label为时间点"),
+    "chart-column": (_VALUES, "分类对比；3-8项"),
+    "chart-wordcloud": ('{"title"?,"values":[{"label","value"}]}', "关键词权重；5-30项"),
+    "chart-combo": (
+        '{"title"?,"xTitle"?,"primaryYTitle"?,"secondaryYTitle"?,"primaryLabel"?,'
+        '"secondaryLabel"?,"primaryValues":[{"label","value"}],"secondaryValues":[{"label","value"}]}',
+        "两个不同单位的指标共享X轴；两组label一一对应；2-8项",
+    ),
+    # List
+    "list-column": (_LISTS, "垂直并列要点，适合长标签"),
+    "list-grid": (_LISTS, "网格并列；至少4个短标签"),
+    "list-pyramid": ('{"lists":[{"label","desc"?}]}', "重要性或范围递减；自顶向下排列"),
+    "list-row": (_LISTS, "横向并列；至少3个短标签"),
+    "list-sector": ('{"lists":[{"label","desc"?}]}', "围绕中心主题放射"),
+    "list-zigzag": (_LISTS, "交替排列的并列要点"),
+    # Sequence
+    "sequence-stairs": (_SEQUENCES, "逐级递进"),
+    "sequence-timeline": (_TIMED_SEQUENCES, "按时间顺序的事件"),
+    "sequence-steps": (_SEQUENCES, "操作步骤"),
+    "sequence-snake": (_SEQUENCES, "步骤较多时使用"),
+    "sequence-circular": (_SEQUENCES, "循环往复的过程"),
+    "sequence-funnel": ('{"sequences":[{"label","value"}]}', "逐级筛选，value递减"),
+    "sequence-roadmap": (_TIMED_SEQUENCES, "规划与里程碑"),
+    "sequence-zigzag": (_SEQUENCES, "交替排列的步骤"),
+    # Comparison
+    "compare-binary": (_COMPARES, "恰好2项，两方对比"),
+    "compare-hierarchy": (_COMPARES, "多方分层对比"),
+    "compare-swot": (_COMPARES, "恰好4项，顺序S/W/O/T"),
+    "compare-quadrant": (_QUADRANTS, "按两个维度分4个象限"),
+    # Hierarchy
+    "hierarchy-tree": (_TREE, "单父节点的树"),
+    "hierarchy-mindmap": (_TREE, "中心主题向外发散"),
+    "hierarchy-structure": (
+        '{"root":{"label","title"?,"children":[...]}}',
+        "组织架构",
+    ),
+    # Quadrant
+    "quadrant-quarter": (_QUADRANTS, "两个维度的四象限；恰好4个象限"),
+    "quadrant-simple": ('{"quadrants":[{"title","items":[str]}]}', "恰好4个象限"),
+    # Relation
+    "relation-dagre-flow": (_GRAPH, "有向流程或依赖"),
+    "relation-circle": (_GRAPH, "围绕中心的关系"),
+}
+
+# 精简后的参数描述
+_COMPACT_PARAM_DESCRIPTIONS = {
+    "template": "模板名",
+    "data_json": "JSON 字符串，结构见工具描述",
+    "rationale": "选择理由",
+    "reason": "跳过原因",
+}
+
+# tool 名称 -> compact 版本 / 原始版本
+_COMPACT_CACHE: Dict[str, FunctionTool] = {}
+_VERBOSE_TOOLS: Dict[str, FunctionTool] = {}
+
+
+def _find_sub_category(tool_name: str) -> Optional[Tuple[str, str]]:
+    """由 tool 名推导 (category, sub_category)，如 chart_pie -> (chart, chart-pie)"""
+    sub_category = tool_name.replace("_", "-")
+    for category, meta in TEMPLATE_CATEGORIES.items():
+        if sub_category in meta["sub_categories"]:
+            return category, sub_category
+    return None
+
+
+def _limits_rule(templates: List[str]) -> str:
+    """子分类的容量上限：各模板一致时只写一次，否则按上限分组列出模板
+
+    如 "每组 maxItems=4；每组 maxItems=5: compare-binary-horizontal-arrow-simple, ..."，
+    最常见的上限写在最前，其余模板逐一列出。
+    """
+    groups: Dict[str, List[str]] = {}
+    for template in templates:
+        groups.setdefault(describe_limits(template), []).append(template)
+    if len(groups) == 1:
+        return next(iter(groups))
+    common = max(groups, key=lambda hint: len(groups[hint]))
+    parts = [f"{common or '不限'}（其余模板）"]
+    parts.extend(
+        f"{hint or '不限'}: {', '.join(names)}" for hint, names in groups.items() if hint != common
+    )
+    return "；".join(parts)
+
+
+def _compact_schema(
+    schema: Dict[str, Any], templates: List[str]
+) -> Dict[str, Any]:
+    schema = copy.deepcopy(schema)
+    schema.pop("description", None)
+    for name, prop in schema.get("properties", {}).items():
+        prop.pop("title", None)
+        if name in _COMPACT_PARAM_DESCRIPTIONS:
+            prop["description"] = _COMPACT_PARAM_DESCRIPTIONS[name]
+        else:
+            prop.pop("description", None)
+        # template 为 str 的 tool 用目录补全 enum；已有 Literal 约束的保持不变
+        if name == "template" and "enum" not in prop and "const" not in prop and templates:
+            prop["enum"] = list(templates)
+    return schema
+
+
+def compact_tool(tool: FunctionTool) -> FunctionTool:
+    """返回 tool 的精简版本；不在 COMPACT_TOOL_RULES 中的 tool 原样返回"""
+    if tool.name in _COMPACT_CACHE:
+        return _COMPACT_CACHE[tool.name]
+
+    found = _find_sub_category(tool.name)
+    if found is None or found[1] not in COMPACT_TOOL_RULES:
+        return tool
+
+    category, sub_category = found
+    meta = TEMPLATE_CATEGORIES[category]["sub_categories"][sub_category]
+    data_format, rules = COMPACT_TOOL_RULES[sub_category]
+    limits = _limits_rule(meta.get("templates", []))
+    if limits:
+        rules = f"{rules}。上限: {limits}"
+    description = (
+        f"{sub_category}: {meta['description']}。规则: {rules}。data_json: {data_format}"
+    )
+    compact = dataclasses.replace(
+        tool,
+        description=description,
+        params_json_schema=_compact_schema(
+            tool.params_json_schema, meta.get("templates", [])
+        ),
+    )
+    _COMPACT_CACHE[tool.name] = compact
+    _VERBOSE_TOOLS[tool.name] = tool
+    return compact
+
+
+def verbose_tool(tool: FunctionTool) -> FunctionTool:
+    """返回 tool 的原始（docstring）版本"""
+    return _VERBOSE_TOOLS.get(tool.name, tool)
+
+
+def apply_tool_schema_mode(
+    tools: List[FunctionTool], mode: Optional[str] = None
+) -> List[FunctionTool]:
+    """按 AGENTIC_TOOL_SCHEMA（verbose | compact）返回 agent 使用的 tools"""
+    mode = mode or get_tool_schema_mode()
+    if mode == "compact":
+        return [compact_tool(tool) for tool in tools]
+    return [verbose_tool(tool) for tool in tools]
+
+
+def _tool_payload(tool: FunctionTool) -> str:
+    """tool 定义在请求中的近似序列化形式"""
+    return json.dumps(
+        {
+            "name": tool.name,
+            "description": tool.description,
+            "parameters": tool.params_json_schema,
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+def count_tokens(text: str) -> int:
+    """计算 token 数；未安装 tiktoken 时按字符粗略估算
+
+    估算规则: CJK 字符约 1 token/字，其余字符约 4 字符/token。
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        cjk = sum(1 for ch in text if "一" <= ch <= "鿿")
+        return cjk + (len(text) - cjk + 3) // 4
+    return len(tiktoken.get_encoding("o200k_base").encode(text))
+
+
+def tool_token_report(agents: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
+    """对比每个 category agent 在 verbose / compact 模式下的 prompt token 数
+
+    统计范围为 instructions + 全部 tool 定义，即每次调用都会重复发送的部分。
+
+    Args:
+        agents: 待统计的 agent 列表，默认为全部 category agents
+
+    Returns:
+        每个 agent 一行: {"agent", "tools", "verbose", "compact", "saved", "ratio"}
+    """
+    if agents is None:
+        from ..agents.category_agents import (
+            chart_agent,
+            comparison_agent,
+            hierarchy_agent,
+            list_agent,
+            quadrant_agent,
+            relation_agent,
+            sequence_agent,
+        )
+
+        agents = [
+            chart_agent,
+            comparison_agent,
+            hierarchy_agent,
+            list_agent,
+            quadrant_agent,
+            relation_agent,
+            sequence_agent,
+        ]
+
+    report: List[Dict[str, Any]] = []
+    for agent in agents:
+        instructions = agent.instructions if isinstance(agent.instructions, str) else ""
+        base = count_tokens(instructions)
+        verbose_tools = apply_tool_schema_mode(agent.tools, mode="verbose")
+        compact_tools = apply_tool_schema_mode(agent.tools, mode="compact")
+        verbose = base + sum(count_tokens(_tool_payload(t)) for t in verbose_tools)
+        compact = base + sum(count_tokens(_tool_payload(t)) for t in compact_tools)
+        report.append(
+            {
+                "agent": agent.name,
+                "tools": len(agent.tools),
+                "verbose": verbose,
+                "compact": compact,
+                "saved": verbose - compact,
+                "ratio": round(compact / verbose, 3) if verbose else 1.0,
+            }
+        )
+    return report
@@ -0,0 +1,167 @@
+"""
+[INPUT]: config.templates 的模板目录（TEMPLATE_CATEGORIES / describe_limits）；各 *_tools.py 中的 ToolSpec 表
+[OUTPUT]: ToolSpec, build_tool, build_tools, tool_description
+[POS]: agentic/tools 的 tool 工厂，按目录生成各 category 的 FunctionTool，所有 tool 共用 make_selection 校验
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 tools/.folder.md 的描述是否仍然准确。
+
+每个 tool 由一条 ToolSpec 描述（子分类、场景说明、各模板的简短说明、参数说明），其余全部来自目录:
+    - template 参数的 enum
+    - "## 可用模板" 列表的顺序与容量提示（maxItems 等，来自 TEMPLATE_LIMITS / SUB_CATEGORY_LIMITS）
+    - category（由子分类反查）
+ToolSpec 中出现目录里没有的模板名时 build_tool 直接报错，目录与 tool 描述不会悄悄分叉。
+
+参数 schema 直接按目录拼出 JSON Schema（与 function_tool 的输出结构一致），不经过 docstring 解析与
+Pydantic 模型生成；生成结果按 tool 名缓存，同一 ToolSpec 重复构建返回同一个 FunctionTool，同名的不同 ToolSpec 直接报错。
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Mapping, Tuple, Union
+
+from agents import FunctionTool
+from agents.tool_context import ToolContext
+
+from ..config import TEMPLATE_CATEGORIES
+from ..config.templates import describe_limits
+from ..models import TemplateSelection
+from .common import make_selection
+from .schemas import ToolDataError
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """一个 category tool 的人工说明部分
+
+    Attributes:
+        sub_category: 子分类，如 chart-pie；tool 名为 chart_pie
+        summary: 描述首行 "选择 <sub_category> 类型模板 - " 之后的部分
+        guide: 适用 / 不适用场景、与其他类型的区别、数据格式等段落
+        data_json: data_json 参数说明
+        rationale: rationale 参数说明
+        多行文本按 docstring 规则（inspect.cleandoc）去掉首尾空行与公共缩进
+        template_notes: 模板名 → 简短说明（可省略；键必须是目录中的模板）
+    """
+
+    sub_category: str
+    summary: str
+    guide: str
+    data_json: str
+    rationale: str
+    template_notes: Mapping[str, str] = field(default_factory=dict, hash=False, compare=False)
+
+    @property
+    def name(self) -> str:
+        return self.sub_category.replace("-", "_")
+
+
+@lru_cache(maxsize=None)
+def _catalog_entry(sub_category: str) -> Tuple[str, Tuple[str, ...]]:
+    """子分类 → (category, 模板名元组)"""
+    for category, meta in TEMPLATE_CATEGORIES.items():
+        sub = meta["sub_categories"].get(sub_category)
+        if sub is not None:
+            return category, tuple(sub.get("templates", ()))
+    raise KeyError(f"Unknown sub-category '{sub_category}' (not in TEMPLATE_CATEGORIES)")
+
+
+def _limits_hint(template: str) -> str:
+    hint = describe_limits(template)
+    return f" ({hint})" if hint else ""
+
+
+def tool_description(spec: ToolSpec) -> str:
+    """tool 描述：首行 + 按目录生成的可用模板列表 + guide（guide 按 docstring 规则去缩进）"""
+    templates = _catalog_entry(spec.sub_category)[1]
+    unknown = set(spec.template_notes) - set(templates)
+    if unknown:
+        raise ValueError(
+            f"{spec.name}: template_notes 中的模板不在目录 {spec.sub_category} 中: {', '.join(sorted(unknown))}"
+        )
+    lines = [f"选择 {spec.sub_category} 类型模板 - {spec.summary}", "", "## 可用模板"]
+    for template in templates:
+        note = spec.template_notes.get(template)
+        hint = _limits_hint(template)
+        lines.append(f"- {template}: {note}{hint}" if note else f"- {template}{hint}")
+    return "\n".join(lines) + "\n\n" + inspect.cleandoc(spec.guide)
+
+
+def _params_schema(spec: ToolSpec) -> Dict[str, Any]:
+    templates = list(_catalog_entry(spec.sub_category)[1])
+    return {
+        "properties": {
+            "template": {
+                "description": f"模板名称，必须是: {' | '.join(templates)}",
+                "enum": templates,
+                "title": "Template",
+                "type": "string",
+            },
+            "data_json": {"description": inspect.cleandoc(spec.data_json), "title": "Data Json", "type": "string"},
+            "rationale": {"description": inspect.cleandoc(spec.rationale), "title": "Rationale", "type": "string"},
+        },
+        "required": ["template", "data_json", "rationale"],
+        "title": f"{spec.name}_args",
+        "type": "object",
+        "additionalProperties": False,
+    }
+
+
+def _invoker(spec: ToolSpec):
+    name = spec.name
+    category = _catalog_entry(spec.sub_category)[0]
+    sub_category = spec.sub_category
+
+    async def on_invoke_tool(ctx: ToolContext[Any], input: str) -> Union[TemplateSelection, ToolDataError]:
+        try:
+            args = json.loads(input) if input else {}
+        except json.JSONDecodeError:
+            args = None
+        if not isinstance(args, dict):
+            return ToolDataError(
+                tool=name,
+                problems=["tool 参数不是合法的 JSON 对象"],
+                hint=f"按 template / data_json / rationale 三个参数重新调用 {name}",
+            )
+        return make_selection(
+            name,
+            category,
+            sub_category,
+            args.get("template") or "",
+            args.get("data_json") or "",
+            args.get("rationale") or "",
+        )
+
+    return on_invoke_tool
+
+
+# tool 名 → (ToolSpec, 已生成的 FunctionTool)
+_TOOLS: Dict[str, Tuple[ToolSpec, FunctionTool]] = {}
+
+
+def build_tool(spec: ToolSpec) -> FunctionTool:
+    """按 ToolSpec 与目录生成 FunctionTool（按 tool 名缓存；同名但内容不同的 ToolSpec 报错）"""
+    cached = _TOOLS.get(spec.name)
+    if cached is not None:
+        cached_spec, tool = cached
+        if cached_spec != spec or cached_spec.template_notes != spec.template_notes:
+            raise ValueError(f"tool '{spec.name}' 已由另一条 ToolSpec 生成")
+        return tool
+    tool = FunctionTool(
+        name=spec.name,
+        description=tool_description(spec),
+        params_json_schema=_params_schema(spec),
+        on_invoke_tool=_invoker(spec),
+        strict_json_schema=True,
+    )
+    _TOOLS[spec.name] = (spec, tool)
+    return tool
+
+
+def build_tools(specs: Iterable[ToolSpec]) -> Dict[str, FunctionTool]:
+    """批量生成，返回 tool 名 → FunctionTool"""
+    return {spec.name: build_tool(spec) for spec in specs}
@@ -0,0 +1,387 @@
+"""
+[INPUT]: LLM 传入的 data_json 文本（可能有尾随逗号、单引号、未转义换行、被截断等缺陷）
+[OUTPUT]: loads_tolerant → (解析结果, 应用的修复列表)；repair_json → (修复后的 JSON 文本, 修复列表)；JSONRepairError
+[POS]: agentic/tools 的容错 JSON 解析，schemas.validate_tool_input 在校验前调用；只有无法本地修复的 data_json 才交回模型重试
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 tools/.folder.md 的描述是否仍然准确。
+
+合法 JSON 直接走 json.loads（快路径，修复列表为空）；失败时单遍扫描重写文本，再 json.loads 一次。
+
+修复项（REPAIRS 中的名称，按首次出现的顺序记录）:
+    code_fence          去掉 ```json ... ``` 包裹
+    extra_text          去掉 JSON 前后的说明文字
+    single_quotes       单引号字符串 → 双引号
+    unescaped_quotes    字符串内未转义的双引号（后面不是 , : } ] 或换行的引号视为正文）
+    control_chars       字符串内的原始换行 / 制表符等控制字符 → 转义序列
+    invalid_escapes     非法转义（如 \\d）→ 保留反斜杠本身
+    python_literals     True / False / None → true / false / null
+    unquoted_keys       对象中未加引号的 key
+    trailing_commas     ] / } 前的逗号、连续逗号
+    missing_commas      相邻的两个值之间缺少逗号
+    unbalanced_brackets 括号不匹配（自动闭合内层 / 丢弃多余的闭合括号）
+    truncated           输入在中途结束：闭合字符串、丢弃不完整的成员、补齐括号
+                        （输入以 } / ] 结束时字符串没闭合不算截断，而是引号无法判断，报 JSONRepairError）
+
+修复是启发式的，目标是 LLM 常见的格式缺陷，不是通用的宽松 JSON 方言；修复后仍不合法时抛出 JSONRepairError。
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, List, Optional, Tuple
+
+REPAIRS = (
+    "code_fence",
+    "extra_text",
+    "single_quotes",
+    "unescaped_quotes",
+    "control_chars",
+    "invalid_escapes",
+    "python_literals",
+    "unquoted_keys",
+    "trailing_commas",
+    "missing_commas",
+    "unbalanced_brackets",
+    "truncated",
+)
+
+_FENCE_RE = re.compile(r"\A```[A-Za-z0-9_-]*[ \t]*\n?(.*?)\n?[ \t]*(?:```\s*)?\Z", re.S)
+_NUMBER_RE = re.compile(r"[-+0-9.eE]+")
+_JSON_NUMBER_RE = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?\Z")
+_WORD_RE = re.compile(r"[^\W\d]\w*")
+_WS_RE = re.compile(r"\s*")
+# 字符串内无需处理的字符连续段
+_PLAIN_RE = re.compile(r"[^\"'\\\x00-\x1f]+")
+
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_JSON_LITERALS = frozenset(("true", "false", "null", "NaN", "Infinity"))
+_VALID_ESCAPES = frozenset('"\\/bfnrtu')
+_CONTROL_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t", "\b": "\\b", "\f": "\\f"}
+_CLOSERS = {"{": "}", "[": "]"}
+# 字符串结束引号之后允许出现的字符
+_AFTER_STRING = frozenset(",:}]")
+
+
+class JSONRepairError(ValueError):
+    """data_json 无法在本地修复"""
+
+    def __init__(self, message: str, repairs: Optional[List[str]] = None) -> None:
+        self.repairs = repairs or []
+        super().__init__(message)
+
+
+class _Frame:
+    """一层 {} / []
+
+    state:
+        object  key → colon → value → after
+        array   value → after
+    item_start 为当前成员在输出中的起点（含前导逗号），截断时从这里丢弃不完整的成员
+    """
+
+    __slots__ = ("closer", "state", "item_start")
+
+    def __init__(self, closer: str, item_start: int) -> None:
+        self.closer = closer
+        self.state = "key" if closer == "}" else "value"
+        self.item_start = item_start
+
+
+class _Repairer:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.out: List[str] = []
+        self.stack: List[_Frame] = []
+        self.repairs: List[str] = []
+        self.pending_comma = False
+
+    def note(self, repair: str) -> None:
+        if repair not in self.repairs:
+            self.repairs.append(repair)
+
+    # ---- 成员边界 ----
+
+    def begin_value(self) -> None:
+        """一个值（或 key）开始前：补上 / 输出逗号"""
+        if not self.stack:
+            return
+        frame = self.stack[-1]
+        if frame.state == "after":
+            self.note("missing_commas")
+            self.pending_comma = True
+            frame.state = "key" if frame.closer == "}" else "value"
+        if self.pending_comma:
+            frame.item_start = len(self.out)
+            self.out.append(",")
+            self.pending_comma = False
+
+    def end_value(self) -> None:
+        if self.stack:
+            frame = self.stack[-1]
+            if frame.state == "value":
+                frame.state = "after"
+
+    def is_key_position(self) -> bool:
+        return bool(self.stack) and self.stack[-1].closer == "}" and self.stack[-1].state in ("key", "after")
+
+    # ---- 扫描 ----
+
+    def run(self) -> str:
+        text = self.text
+        n = len(text)
+        i = 0
+        while i < n:
+            c = text[i]
+            if c in " \t\r\n":
+                i = _WS_RE.match(text, i).end()
+                continue
+            if c == '"' or c == "'":
+                key = self.is_key_position()
+                self.begin_value()
+                i, closed = self.read_string(i)
+                if not closed:
+                    if text.rstrip()[-1:] in ("}", "]"):
+                        # 输入以闭合括号结束却有字符串没闭合：是正文中的引号被误判为结束引号
+                        # （如 "use "fast", cheap"），按截断补齐会悄悄丢掉后半段内容
+                        raise JSONRepairError("字符串中的引号无法确定边界", self.repairs)
+                    # 截断在字符串中间：未完成的 key 在收尾时丢弃，值保留已有部分
+                    self.note("truncated")
+                    if key:
+                        self.stack[-1].state = "colon"
+                    else:
+                        self.end_value()
+                    break
+                if key:
+                    self.stack[-1].state = "colon"
+                else:
+                    self.end_value()
+                continue
+            if c == "{" or c == "[":
+                self.begin_value()
+                self.out.append(c)
+                self.stack.append(_Frame(_CLOSERS[c], len(self.out)))
+                i += 1
+                continue
+            if c == "}" or c == "]":
+                i += 1
+                if not self.close(c):
+                    continue
+                if not self.stack:
+                    if text[i:].strip():
+                        self.note("extra_text")
+                    break
+                self.end_value()
+                continue
+            if c == ",":
+                i += 1
+                if self.stack and self.stack[-1].state == "after" and not self.pending_comma:
+                    self.pending_comma = True
+                    frame = self.stack[-1]
+                    frame.state = "key" if frame.closer == "}" else "value"
+                else:
+                    self.note("trailing_commas")
+                continue
+            if c == ":":
+                i += 1
+                if self.stack and self.stack[-1].state == "colon":
+                    self.stack[-1].state = "value"
+                self.out.append(":")
+                continue
+            match = _NUMBER_RE.match(text, i)
+            if match and c not in "eE":
+                token = match.group()
+                self.begin_value()
+                self.out.append(token)
+                i = match.end()
+                if i >= n and not _JSON_NUMBER_RE.match(token):
+                    # 截断在数字中间（如 "1."）
+                    self.note("truncated")
+                    self.out.pop()
+                    break
+                self.end_value()
+                continue
+            match = _WORD_RE.match(text, i)
+            if match:
+                word = match.group()
+                i = match.end()
+                if self.is_key_position():
+                    self.begin_value()
+                    self.note("unquoted_keys")
+                    self.out.append(json.dumps(word, ensure_ascii=False))
+                    self.stack[-1].state = "colon"
+                    continue
+                self.begin_value()
+                if word in _PYTHON_LITERALS:
+                    self.note("python_literals")
+                    word = _PYTHON_LITERALS[word]
+                elif word not in _JSON_LITERALS and i >= n:
+                    # 截断在字面量中间（如 "tru"）
+                    self.note("truncated")
+                    break
+                self.out.append(word)
+                self.end_value()
+                continue
+            # 无法识别的字符原样保留，交给 json.loads 报错
+            self.out.append(c)
+            i += 1
+        else:
+            if self.stack:
+                self.note("truncated")
+
+        if self.stack:
+            self.finish_truncated()
+        return "".join(self.out)
+
+    def close(self, closer: str) -> bool:
+        """处理闭合括号，返回是否真正闭合了一层"""
+        if self.pending_comma:
+            self.note("trailing_commas")
+            self.pending_comma = False
+        if not self.stack:
+            self.note("unbalanced_brackets")
+            return False
+        if self.stack[-1].closer != closer:
+            if not any(frame.closer == closer for frame in self.stack):
+                self.note("unbalanced_brackets")
+                return False
+            self.note("unbalanced_brackets")
+            while self.stack[-1].closer != closer:
+                self.out.append(self.stack.pop().closer)
+                self.end_value()
+        self.out.append(self.stack.pop().closer)
+        return True
+
+    def finish_truncated(self) -> None:
+        self.pending_comma = False
+        while self.stack:
+            frame = self.stack[-1]
+            if frame.closer == "}" and frame.state in ("colon", "value"):
+                del self.out[frame.item_start:]
+            if self.out[-1] == ",":
+                self.out.pop()
+            self.out.append(self.stack.pop().closer)
+            self.end_value()
+
+    def read_string(self, i: int) -> Tuple[int, bool]:
+        """读取从 text[i]（引号）开始的字符串，输出为双引号 JSON 字符串；返回 (结束位置, 是否正常闭合)"""
+        text = self.text
+        n = len(text)
+        quote = text[i]
+        if quote == "'":
+            self.note("single_quotes")
+        plain = _PLAIN_RE
+        out = self.out
+        out.append('"')
+        i += 1
+        while i < n:
+            match = plain.match(text, i)
+            if match:
+                out.append(match.group())
+                i = match.end()
+                if i >= n:
+                    break
+            c = text[i]
+            if c == quote:
+                j = _WS_RE.match(text, i + 1).end()
+                if j >= n or text[j] in _AFTER_STRING or "\n" in text[i + 1:j] or (
+                    text[j] in "\"'" and j > i + 1
+                ):
+                    out.append('"')
+                    return i + 1, True
+                self.note("unescaped_quotes")
+                out.append('\\"' if quote == '"' else "'")
+                i += 1
+            elif c == '"':
+                # 单引号字符串中的双引号
+                out.append('\\"')
+                i += 1
+            elif c == "'":
+                out.append("'")
+                i += 1
+            elif c == "\\":
+                if i + 1 >= n:
+                    i += 1
+                    break
+                nxt = text[i + 1]
+                if nxt == "'":
+                    out.append("'")
+                elif nxt in _VALID_ESCAPES:
+                    out.append("\\" + nxt)
+                else:
+                    self.note("invalid_escapes")
+                    out.append("\\\\")
+                    i += 1
+                    continue
+                i += 2
+            else:
+                self.note("control_chars")
+                out.append(_CONTROL_ESCAPES.get(c) or f"\\u{ord(c):04x}")
+                i += 1
+        # 截断在字符串中间
+        out.append('"')
+        return n, False
+
+
+def _strip_wrapping(text: str, repairs: List[str]) -> str:
+    """去掉代码块包裹与 JSON 之前的文字"""
+    text = text.strip()
+    if text.startswith("```"):
+        match = _FENCE_RE.match(text)
+        if match:
+            repairs.append("code_fence")
+            text = match.group(1).strip()
+    starts = [pos for pos in (text.find("{"), text.find("[")) if pos >= 0]
+    start = min(starts) if starts else -1
+    if start > 0:
+        repairs.append("extra_text")
+        text = text[start:]
+    return text
+
+
+def repair_json(text: str) -> Tuple[str, List[str]]:
+    """
+    修复常见的 LLM JSON 缺陷
+
+    Returns:
+        (修复后的文本, 应用的修复列表)；文本本身合法时原样返回且列表为空。
+        返回的文本不保证合法（修复不了的缺陷原样保留）。
+
+    Raises:
+        JSONRepairError: 输入以 } / ] 结束但字符串边界无法确定（修复会丢内容）
+    """
+    repairs: List[str] = []
+    body = _strip_wrapping(text, repairs)
+    if not body or body[0] not in "{[":
+        return body, repairs
+    repairer = _Repairer(body)
+    repairer.repairs = repairs
+    return repairer.run(), repairs
+
+
+def loads_tolerant(text: str) -> Tuple[Any, List[str]]:
+    """
+    容错解析 JSON
+
+    Returns:
+        (解析结果, 应用的修复列表)；合法 JSON 的修复列表为空
+
+    Raises:
+        JSONRepairError: 修复后仍不是合法 JSON
+    """
+    try:
+        return json.loads(text), []
+    except json.JSONDecodeError as e:
+        original = e
+    except TypeError:
+        raise JSONRepairError("data_json 不是字符串") from None
+    try:
+        fixed, repairs = repair_json(text)
+    except JSONRepairError as e:
+        raise JSONRepairError(str(original), e.repairs) from None
+    try:
+        return json.loads(fixed), repairs
+    except json.JSONDecodeError:
+        raise JSONRepairError(str(original), repairs) from None
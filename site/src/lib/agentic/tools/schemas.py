@@ -0,0 +1,332 @@
+"""
+[INPUT]: LLM 传入的 template / data_json；TEMPLATE_CATEGORIES（合法模板）；COMPACT_TOOL_RULES（data_json 结构说明）；
+    json_repair.loads_tolerant（容错解析）
+[OUTPUT]: 各子分类的 data Pydantic 模型（SUB_CATEGORY_SCHEMAS），get_data_adapter, ToolDataError, validate_tool_input
+[POS]: agentic/tools 的 data_json 校验层，所有 category tool 在构造 TemplateSelection 之前调用
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 tools/.folder.md 的描述是否仍然准确。
+
+每个子分类对应一个 data 模型，首次使用时编译为 TypeAdapter 并缓存（同一数据形态的子分类共享同一个 adapter）。
+校验只约束结构（必填字段、类型、数组长度），容量上限（maxItems 等）与关系图的悬空端点 / 重复节点 / 自环由
+renderers.data_fitter（graph_normalizer）在渲染前规整。额外字段原样保留。
+
+data_json 先经 json_repair 容错解析：尾随逗号、单引号、未转义换行、截断等常见缺陷在本地修复并记录修复项，
+只有无法修复的才作为 "不是合法的 JSON" 报告。
+
+校验失败时 tool 返回 ToolDataError 而不是 TemplateSelection；category agent 的 tool_use_behavior
+（common.stop_on_selection）会把它作为 tool 输出交回模型，在同一次 run 中修正后重新调用。
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Optional, Tuple, Type, Union
+
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+    ValidationError,
+    model_validator,
+)
+
+from ..config import get_templates
+from .compact import COMPACT_TOOL_RULES
+from .json_repair import JSONRepairError, loads_tolerant
+
+# 单次报告的问题数上限
+MAX_PROBLEMS = 8
+
+
+def _number_to_text(value: Any) -> Any:
+    """label / id 允许数字（如年份），统一转为字符串"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return value
+
+
+def _reject_bool(value: Any) -> Any:
+    if isinstance(value, bool):
+        raise ValueError("必须是数值，不能是布尔值")
+    return value
+
+
+Label = Annotated[str, BeforeValidator(_number_to_text), StringConstraints(strip_whitespace=True, min_length=1)]
+Text = Annotated[str, BeforeValidator(_number_to_text)]
+Number = Annotated[Union[int, float], BeforeValidator(_reject_bool)]
+
+
+class _Model(BaseModel):
+    model_config = ConfigDict(extra="allow", populate_by_name=True)
+
+
+class _Data(_Model):
+    title: Optional[Text] = None
+    desc: Optional[Text] = None
+
+
+# ============================================================
+# 条目
+# ============================================================
+
+
+class Item(_Model):
+    label: Label
+    desc: Optional[Text] = None
+    icon: Optional[str] = None
+    value: Optional[Number] = None
+
+
+class ValueItem(Item):
+    value: Number
+
+
+class SequenceItem(Item):
+    time: Optional[Text] = None
+
+
+class CompareGroup(_Model):
+    label: Label
+    children: List[Union[Label, Item]] = Field(min_length=1)
+
+
+class Quadrant(_Model):
+    title: Label
+    items: List[Union[Label, Item]] = Field(default_factory=list)
+
+
+class TreeNode(_Model):
+    label: Label
+    title: Optional[Text] = None
+    children: Optional[List["TreeNode"]] = None
+
+
+class GraphNode(_Model):
+    id: Optional[Label] = None
+    label: Label
+
+
+class Relation(_Model):
+    from_: Label = Field(alias="from")
+    to: Label
+    label: Optional[Text] = None
+
+
+# ============================================================
+# 各数据形态
+# ============================================================
+
+
+class ValuesData(_Data):
+    values: List[ValueItem] = Field(min_length=2)
+
+
+class WordcloudData(_Data):
+    values: List[ValueItem] = Field(min_length=3)
+
+
+class ComboData(_Data):
+    xTitle: Optional[Text] = None
+    primaryYTitle: Optional[Text] = None
+    secondaryYTitle: Optional[Text] = None
+    primaryLabel: Optional[Text] = None
+    secondaryLabel: Optional[Text] = None
+    primaryMin: Optional[Number] = None
+    primaryMax: Optional[Number] = None
+    primaryStep: Optional[Number] = None
+    secondaryMin: Optional[Number] = None
+    secondaryMax: Optional[Number] = None
+    secondaryStep: Optional[Number] = None
+    primaryValues: List[ValueItem] = Field(min_length=2)
+    secondaryValues: List[ValueItem] = Field(min_length=2)
+
+    @model_validator(mode="after")
+    def _same_labels(self) -> "ComboData":
+        primary = [item.label for item in self.primaryValues]
+        secondary = [item.label for item in self.secondaryValues]
+        if primary != secondary:
+            raise ValueError("primaryValues 与 secondaryValues 的 label 必须一一对应且顺序一致")
+        return self
+
+
+class ListsData(_Data):
+    lists: List[Item] = Field(min_length=1)
+
+
+class SequencesData(_Data):
+    sequences: List[SequenceItem] = Field(min_length=1)
+
+
+class FunnelData(_Data):
+    sequences: List[ValueItem] = Field(min_length=1)
+
+
+class ComparesData(_Data):
+    compares: List[CompareGroup] = Field(min_length=1)
+
+
+class BinaryCompareData(_Data):
+    compares: List[CompareGroup] = Field(min_length=2, max_length=2)
+
+
+class SwotData(_Data):
+    compares: List[CompareGroup] = Field(min_length=4, max_length=4)
+
+
+class QuadrantsData(_Data):
+    xAxis: Optional[Text] = None
+    yAxis: Optional[Text] = None
+    quadrants: List[Quadrant] = Field(min_length=4, max_length=4)
+
+
+class TreeData(_Data):
+    root: TreeNode
+
+
+class GraphData(_Data):
+    nodes: Optional[List[GraphNode]] = None
+    relations: List[Relation] = Field(min_length=1)
+
+
+# 子分类 → data 模型
+SUB_CATEGORY_SCHEMAS: Dict[str, Type[BaseModel]] = {
+    "chart-pie": ValuesData,
+    "chart-bar": ValuesData,
+    "chart-line": ValuesData,
+    "chart-column": ValuesData,
+    "chart-wordcloud": WordcloudData,
+    "chart-combo": ComboData,
+    "list-column": ListsData,
+    "list-grid": ListsData,
+    "list-pyramid": ListsData,
+    "list-row": ListsData,
+    "list-sector": ListsData,
+    "list-zigzag": ListsData,
+    "sequence-stairs": SequencesData,
+    "sequence-timeline": SequencesData,
+    "sequence-steps": SequencesData,
+    "sequence-snake": SequencesData,
+    "sequence-circular": SequencesData,
+    "sequence-funnel": FunnelData,
+    "sequence-roadmap": SequencesData,
+    "sequence-zigzag": SequencesData,
+    "compare-binary": BinaryCompareData,
+    "compare-hierarchy": ComparesData,
+    "compare-swot": SwotData,
+    "compare-quadrant": QuadrantsData,
+    "hierarchy-tree": TreeData,
+    "hierarchy-mindmap": TreeData,
+    "hierarchy-structure": TreeData,
+    "quadrant-quarter": QuadrantsData,
+    "quadrant-simple": QuadrantsData,
+    "relation-dagre-flow": GraphData,
+    "relation-circle": GraphData,
+}
+
+
+@lru_cache(maxsize=None)
+def _adapter_for(schema: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+def get_data_adapter(sub_category: str) -> Optional[TypeAdapter]:
+    """子分类的 data TypeAdapter（编译一次后缓存），未知子分类返回 None"""
+    schema = SUB_CATEGORY_SCHEMAS.get(sub_category)
+    return _adapter_for(schema) if schema is not None else None
+
+
+class ToolDataError(BaseModel):
+    """tool 参数校验失败，作为 tool 输出交回模型修正"""
+
+    error: str = "invalid_data_json"
+    tool: str
+    problems: List[str]
+    expected: str = ""
+    hint: str = ""
+
+    def __str__(self) -> str:
+        return self.model_dump_json()
+
+
+def _format_loc(loc: Tuple[Any, ...]) -> str:
+    """('lists', 2, 'label') → lists[2].label；去掉 union 分支等内部标记"""
+    path = ""
+    for part in loc:
+        if isinstance(part, int):
+            path += f"[{part}]"
+        elif part[:1].isupper() or any(c in part for c in "[-("):
+            continue
+        else:
+            path += f".{part}" if path else part
+    return path
+
+
+def _problems(error: ValidationError) -> List[str]:
+    problems: List[str] = []
+    for detail in error.errors(include_url=False):
+        loc = _format_loc(detail["loc"])
+        message = detail["msg"].removeprefix("Value error, ")
+        problem = f"{loc}: {message}" if loc else message
+        if problem not in problems:
+            problems.append(problem)
+        if len(problems) >= MAX_PROBLEMS:
+            break
+    return problems
+
+
+def validate_tool_input(
+    tool: str,
+    category: str,
+    sub_category: str,
+    template: Optional[str],
+    data_json: str,
+) -> Tuple[Optional[Dict[str, Any]], Optional[ToolDataError], List[str]]:
+    """
+    校验 tool 参数
+
+    Returns:
+        (规范化后的 data, None, 修复项) 或 (None, ToolDataError, 修复项)；
+        修复项为 data_json 在本地应用的 json_repair 修复（合法 JSON 为空列表）
+    """
+    problems: List[str] = []
+    repairs: List[str] = []
+    templates = get_templates(category, sub_category)
+    if templates and template not in templates:
+        problems.append(f"template: '{template}' 不是合法模板，可选: {' | '.join(templates)}")
+
+    data: Optional[Dict[str, Any]] = None
+    try:
+        raw, repairs = loads_tolerant(data_json) if data_json else (None, [])
+    except JSONRepairError as e:
+        problems.append(f"data_json: 不是合法的 JSON，且无法自动修复（{e}）")
+        repairs = e.repairs
+        raw = None
+    else:
+        if not isinstance(raw, dict):
+            problems.append("data_json: 顶层必须是 JSON 对象")
+        else:
+            adapter = get_data_adapter(sub_category)
+            if adapter is None:
+                data = raw
+            else:
+                try:
+                    validated = adapter.validate_python(raw)
+                except ValidationError as e:
+                    problems.extend(_problems(e))
+                else:
+                    data = validated.model_dump(by_alias=True, exclude_none=True)
+
+    if not problems:
+        return data, None, repairs
+    expected = COMPACT_TOOL_RULES.get(sub_category, ("", ""))[0]
+    return None, ToolDataError(
+        tool=tool,
+        problems=problems[:MAX_PROBLEMS],
+        expected=expected,
+        hint=f"按 problems 修正参数后重新调用 {tool}",
+    ), repairs
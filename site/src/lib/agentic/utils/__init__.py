@@ -1,6 +1,6 @@
 """
-[INPUT]: client, logger 模块
-[OUTPUT]: get_openai_client, get_default_model, get_model_settings, logger 相关
+[INPUT]: client, deadline, fake_model, hooks, logger, log_storage, log_analytics, metrics, model_replay, profiling, prompts, prompt_cache, timeline, usage 模块
+[OUTPUT]: get_openai_client, get_default_model, get_model_settings, get_tool_schema_mode, get_local_extractor_enabled, get_run_config, FakeModelProvider, 录制/回放 provider, Deadline, logger 相关, 日志读取与聚合, Prometheus 指标, 剖析开关, 时间线记录, load_prompt, prompt 前缀缓存, 用量统计
 [POS]: utils 包的入口，导出工具函数
 
 [PROTOCOL]:
@@ -13,7 +13,23 @@ from .client import (
     get_default_model,
     get_default_temperature,
     get_model_settings,
+    get_tool_schema_mode,
+    get_local_extractor_enabled,
+    get_model_provider,
+    get_record_path,
+    get_retry_metrics_enabled,
+    get_run_config,
+    reset_run_config,
 )
+from .deadline import Deadline, run_with_deadline
+from .fake_model import FakeModelConfig, FakeModelError, FakeModelProvider
+from .model_replay import (
+    RecordingModelProvider,
+    ReplayedModelError,
+    ReplayMissError,
+    ReplayModelProvider,
+)
+from .hooks import CompositeHooks, combine_hooks
 from .logger import (
     setup_logger,
     get_logger,
@@ -21,6 +37,44 @@ from .logger import (
     get_current_log_file,
     PipelineLogger,
     pipeline_logger,
+    shutdown_logging,
+    get_log_queue_stats,
+)
+from .log_analytics import LogAggregator, aggregate_logs
+from .log_storage import iter_log_records, list_log_segments
+from .metrics import (
+    MetricsRegistry,
+    metrics,
+    render_metrics,
+    start_metrics_server,
+)
+from .profiling import get_profile_mode, profile_stage, profiled
+from .prompts import load_prompt
+from .prompt_cache import (
+    PREFIX_LAYOUT_VERSION,
+    get_prefix_versions,
+    prefix_fingerprint,
+    prompt_cache_key,
+    with_prompt_cache_key,
+)
+from .timeline import (
+    TimelineHooks,
+    TimelineRecorder,
+    get_recorder,
+    get_trace_dir,
+    intent_track,
+    record_span,
+    set_track,
+    timeline_hooks,
+    trace_span,
+)
+from .usage import (
+    ArticleUsage,
+    ModelCallRecord,
+    UsageHooks,
+    UsageTotals,
+    get_usage_stats,
+    usage_stats,
 )
 
 __all__ = [
@@ -28,10 +82,62 @@ __all__ = [
     "get_default_model",
     "get_default_temperature",
     "get_model_settings",
+    "get_tool_schema_mode",
+    "get_local_extractor_enabled",
+    "get_model_provider",
+    "get_record_path",
+    "get_retry_metrics_enabled",
+    "get_run_config",
+    "reset_run_config",
+    "Deadline",
+    "run_with_deadline",
+    "FakeModelConfig",
+    "FakeModelError",
+    "FakeModelProvider",
+    "RecordingModelProvider",
+    "ReplayModelProvider",
+    "ReplayMissError",
+    "ReplayedModelError",
+    "CompositeHooks",
+    "combine_hooks",
     "setup_logger",
     "get_logger",
     "get_log_dir",
     "get_current_log_file",
     "PipelineLogger",
     "pipeline_logger",
+    "shutdown_logging",
+    "get_log_queue_stats",
+    "iter_log_records",
+    "LogAggregator",
+    "aggregate_logs",
+    "list_log_segments",
+    "MetricsRegistry",
+    "metrics",
+    "render_metrics",
+    "start_metrics_server",
+    "get_profile_mode",
+    "profile_stage",
+    "profiled",
+    "load_prompt",
+    "PREFIX_LAYOUT_VERSION",
+    "get_prefix_versions",
+    "prefix_fingerprint",
+    "prompt_cache_key",
+    "with_prompt_cache_key",
+    "TimelineHooks",
+    "TimelineRecorder",
+    "get_recorder",
+    "get_trace_dir",
+    "intent_track",
+    "record_span",
+    "set_track",
+    "timeline_hooks",
+    "trace_span",
+    "ArticleUsage",
+    "ModelCallRecord",
+    "UsageHooks",
+    "UsageTotals",
+    "get_usage_stats",
+    "usage_stats",
 ]
@@ -0,0 +1,121 @@
+"""
+[INPUT]: 基准测试的原始样本（延迟、吞吐量），文章语料目录，基线 JSON
+[OUTPUT]: DEFAULT_CORPUS_DIR, load_corpus, percentile, latency_summary, metric, compare_to_baseline, Regression
+[POS]: agentic/utils 的基准测试辅助模块，供 scripts/benchmark 与负载测试脚本共享统计口径与结果格式
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 utils/.folder.md 的描述是否仍然准确。
+
+结果格式（机器可读）:
+    {
+      "meta": {...},
+      "metrics": {"dsl.small.ops_per_sec": {"value": 52000.0, "unit": "ops/s", "better": "higher"}, ...},
+      "details": {...}
+    }
+与基线比较时只比较 metrics 中双方都有的项；better 决定回归方向。
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# 默认文章语料
+DEFAULT_CORPUS_DIR = Path(__file__).parent.parent / "scripts" / "bench_corpus"
+
+# 默认回归阈值（相对变化）
+DEFAULT_THRESHOLD = 0.10
+
+
+def load_corpus(path: Optional[Path] = None) -> List[Tuple[str, str]]:
+    """读取语料目录下的 .md / .txt 文章，返回 (文件名, 正文) 列表（按文件名排序）"""
+    path = Path(path) if path else DEFAULT_CORPUS_DIR
+    if path.is_file():
+        return [(path.name, path.read_text(encoding="utf-8"))]
+    files = sorted(p for p in path.iterdir() if p.suffix in (".md", ".txt"))
+    return [(p.name, p.read_text(encoding="utf-8")) for p in files]
+
+
+def percentile(samples: Sequence[float], q: float) -> Optional[float]:
+    """线性插值分位数（q 取 0-1）"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * q
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def latency_summary(samples: Sequence[float]) -> Dict[str, Any]:
+    """延迟样本的 count / mean / p50 / p95 / p99 / max（秒）"""
+
+    def rounded(value: Optional[float]) -> Optional[float]:
+        return round(value, 6) if value is not None else None
+
+    return {
+        "count": len(samples),
+        "mean": rounded(sum(samples) / len(samples)) if samples else None,
+        "p50": rounded(percentile(samples, 0.50)),
+        "p95": rounded(percentile(samples, 0.95)),
+        "p99": rounded(percentile(samples, 0.99)),
+        "max": rounded(max(samples)) if samples else None,
+    }
+
+
+def metric(value: float, unit: str, better: str) -> Dict[str, Any]:
+    """一个可与基线比较的指标；better 为 "higher" 或 "lower\""""
+    return {"value": round(value, 6), "unit": unit, "better": better}
+
+
+@dataclass
+class Regression:
+    """与基线相比退化超过阈值的指标"""
+
+    name: str
+    baseline: float
+    current: float
+    change: float  # 相对变化，正数表示变差
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def compare_to_baseline(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> Tuple[List[Dict[str, Any]], List[Regression]]:
+    """
+    对比当前结果与基线
+
+    Returns:
+        (每个共同指标的对比行, 超过阈值的回归列表)
+    """
+    rows: List[Dict[str, Any]] = []
+    regressions: List[Regression] = []
+    current_metrics = current.get("metrics", {})
+    for name, base in sorted(baseline.get("metrics", {}).items()):
+        now = current_metrics.get(name)
+        if now is None or not base.get("value"):
+            continue
+        delta = (now["value"] - base["value"]) / base["value"]
+        # 统一成"变差的幅度"：吞吐量下降或延迟上升为正
+        worse = -delta if now.get("better", base.get("better")) == "higher" else delta
+        row = {
+            "name": name,
+            "baseline": base["value"],
+            "current": now["value"],
+            "unit": now.get("unit", ""),
+            "change": round(delta, 4),
+            "regressed": worse > threshold,
+        }
+        rows.append(row)
+        if row["regressed"]:
+            regressions.append(Regression(name, base["value"], now["value"], round(worse, 4)))
+    return rows, regressions
@@ -1,6 +1,6 @@
 """
 [INPUT]: OPENAI_* 环境变量 (API_KEY, MODEL, TEMPERATURE, TOP_P, 等)
-[OUTPUT]: get_openai_client(), get_default_model(), get_model_settings()
+[OUTPUT]: get_openai_client(), get_default_model(), get_model_settings(), get_tool_schema_mode(), get_local_extractor_enabled(), get_model_provider(), get_record_path(), get_retry_metrics_enabled(), get_run_config(), reset_run_config()
 [POS]: agentic/utils 的客户端工具，提供 OpenAI SDK 初始化和完整模型配置
 
 [PROTOCOL]:
@@ -85,6 +85,122 @@ def get_default_model() -> str:
     return _get_env_value("OPENAI_MODEL", "gpt-4o")
 
 
+def get_tool_schema_mode() -> Literal["verbose", "compact"]:
+    """获取 tool schema 模式 (AGENTIC_TOOL_SCHEMA=verbose|compact，默认 verbose)
+
+    compact 模式用目录元数据生成精简的 tool 描述，显著减少每次调用的输入 token。
+    """
+    return _parse_literal(
+        _get_env_value("AGENTIC_TOOL_SCHEMA"),
+        ("verbose", "compact"),
+        "verbose",
+    )
+
+
+def get_local_extractor_enabled() -> bool:
+    """是否启用本地 chart 数据提取 (AGENTIC_LOCAL_EXTRACTOR=true|false，默认 true)
+
+    启用时，简单数值内容（占比、时间序列、分类数值）由规则直接生成 chart 数据，
+    不再调用 LLM；意图文本不支持该图表类型或置信度不足时仍走 template_selector。
+    """
+    return _parse_bool(_get_env_value("AGENTIC_LOCAL_EXTRACTOR"), True)
+
+
+def get_model_provider() -> Literal["openai", "fake", "replay"]:
+    """获取模型 provider (AGENTIC_MODEL_PROVIDER=openai|fake|replay，默认 openai)
+
+    fake 使用 utils/fake_model 的离线规则模型，不需要 OPENAI_API_KEY。
+    replay 回放 AGENTIC_REPLAY_PATH 指向的录制（utils/model_replay）。
+    """
+    return _parse_literal(
+        _get_env_value("AGENTIC_MODEL_PROVIDER"),
+        ("openai", "fake", "replay"),
+        "openai",
+    )
+
+
+def get_retry_metrics_enabled() -> bool:
+    """是否统计模型 HTTP 重试 (AGENTIC_RETRY_METRICS=true|false，默认 false)
+
+    启用时 openai provider 使用带 request 事件钩子的客户端：openai SDK 在每次请求上设置
+    x-stainless-retry-count，大于 0 的即为重试，计入 agentic_retries_total{stage="model"}。
+    不修改任何 logger。
+    """
+    return _parse_bool(_get_env_value("AGENTIC_RETRY_METRICS"), False)
+
+
+async def _count_retry(request: Any) -> None:
+    """httpx request 钩子：openai SDK 的重试请求计入 metrics.retries"""
+    if request.headers.get("x-stainless-retry-count", "0") not in ("", "0"):
+        from .metrics import metrics
+
+        metrics.retries.inc(stage="model")
+
+
+def _retry_counting_client():
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+    return AsyncOpenAI(
+        api_key=_get_api_key(),
+        http_client=DefaultAsyncHttpxClient(event_hooks={"request": [_count_retry]}),
+    )
+
+
+def get_record_path() -> Optional[Path]:
+    """模型调用录制文件 (AGENTIC_RECORD_PATH)，未设置时不录制"""
+    value = _get_env_value("AGENTIC_RECORD_PATH")
+    return Path(value) if value else None
+
+
+@lru_cache(maxsize=1)
+def _build_run_config(provider: str, record_path: Optional[Path], count_retries: bool = False):
+    from agents import MultiProvider, RunConfig
+
+    if provider == "fake":
+        from .fake_model import FakeModelProvider
+
+        model_provider = FakeModelProvider()
+    elif provider == "replay":
+        from .model_replay import ReplayModelProvider
+
+        replay_path = _get_env_value("AGENTIC_REPLAY_PATH")
+        if not replay_path:
+            raise ValueError("AGENTIC_MODEL_PROVIDER=replay requires AGENTIC_REPLAY_PATH")
+        time_scale = _parse_float(_get_env_value("AGENTIC_REPLAY_TIME_SCALE"), 1.0)
+        model_provider = ReplayModelProvider(replay_path, time_scale=max(time_scale, 0.0))
+    elif count_retries:
+        model_provider = MultiProvider(openai_client=_retry_counting_client())
+    else:
+        model_provider = MultiProvider()
+
+    if record_path is not None:
+        from .model_replay import RecordingModelProvider
+
+        model_provider = RecordingModelProvider(model_provider, record_path)
+
+    # 离线运行不上传 trace
+    return RunConfig(model_provider=model_provider, tracing_disabled=provider != "openai")
+
+
+def get_run_config():
+    """Runner.run 使用的 RunConfig；openai provider 且不录制、不统计重试时返回 None（使用 SDK 默认配置）
+
+    provider 在进程内只创建一次：fake 在调用之间共享 prompt cache 模拟状态，
+    replay 共享同一份录制的轮转游标。
+    """
+    provider = get_model_provider()
+    record_path = get_record_path()
+    count_retries = provider == "openai" and get_retry_metrics_enabled()
+    if provider == "openai" and record_path is None and not count_retries:
+        return None
+    return _build_run_config(provider, record_path, count_retries)
+
+
+def reset_run_config() -> None:
+    """丢弃已创建的 provider，下次 get_run_config 重新读取 AGENTIC_FAKE_* / AGENTIC_REPLAY_* 配置"""
+    _build_run_config.cache_clear()
+
+
 def _parse_float(value: str, default: float | None = None) -> float | None:
     """解析浮点数，失败返回 default"""
     if not value:
@@ -0,0 +1,79 @@
+"""
+[INPUT]: 总时限（秒）
+[OUTPUT]: Deadline, run_with_deadline
+[POS]: agentic/utils 的截止时间工具，在切分、模板选择、渲染各阶段间传递同一个截止时刻
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 utils/.folder.md 的描述是否仍然准确。
+
+使用方式:
+    deadline = Deadline.after(10)
+    segmentation, results = await process_article_with_segmentation(text, deadline=deadline)
+    await render_selections(results, out_dir, deadline=deadline)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Awaitable, Optional, TypeVar, Union
+
+T = TypeVar("T")
+
+
+class Deadline:
+    """绝对截止时刻（time.monotonic 时钟），expires_at 为 None 表示不限时"""
+
+    def __init__(self, expires_at: Optional[float] = None) -> None:
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, seconds: Optional[float]) -> Deadline:
+        """从现在起 seconds 秒后到期；None 表示不限时"""
+        if seconds is None:
+            return cls(None)
+        return cls(time.monotonic() + seconds)
+
+    @classmethod
+    def coerce(cls, value: Union[Deadline, float, None]) -> Deadline:
+        """接受 Deadline 或秒数，统一为 Deadline"""
+        if isinstance(value, Deadline):
+            return value
+        return cls.after(value)
+
+    def remaining(self) -> Optional[float]:
+        """剩余秒数（不小于 0）；不限时返回 None"""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def cap(self, seconds: float) -> float:
+        """取 seconds 与剩余时间中的较小值，用于给子步骤设置超时"""
+        remaining = self.remaining()
+        return seconds if remaining is None else min(seconds, remaining)
+
+    def __repr__(self) -> str:
+        remaining = self.remaining()
+        if remaining is None:
+            return "Deadline(unbounded)"
+        return f"Deadline(remaining={remaining:.2f}s)"
+
+
+async def run_with_deadline(awaitable: Awaitable[T], deadline: Deadline) -> T:
+    """在截止时刻前等待 awaitable
+
+    到期时取消底层任务（进行中的 HTTP 请求随之关闭）并抛出 asyncio.TimeoutError。
+    """
+    remaining = deadline.remaining()
+    if remaining is not None and remaining <= 0:
+        # 已到期：不再发起请求；关闭未启动的协程以免告警
+        close = getattr(awaitable, "close", None)
+        if callable(close):
+            close()
+        raise asyncio.TimeoutError()
+    return await asyncio.wait_for(awaitable, timeout=remaining)
@@ -0,0 +1,506 @@
+"""
+[INPUT]: Agents SDK 的模型请求（system_instructions, input, tools, handoffs, output_schema）；AGENTIC_FAKE_* 环境变量
+[OUTPUT]: FakeModelConfig, FakeRequest, FakeModel, FakeModelProvider, FakeModelError, parse_latency
+[POS]: agentic/utils 的离线假模型，无需 OpenAI 端点即可端到端运行 pipeline（基准测试、并发与缓存测试）
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 utils/.folder.md 的描述是否仍然准确。
+
+按请求形态生成确定性的响应:
+    output_schema 且无 tools/handoffs   segmentation: 按标题/空行切分段落，输出 ArticleSegmentation JSON
+    有 handoffs                         template_selector: 按关键词规则选 category，调用对应 transfer_to_* handoff
+    有 tools                            category agent: 选子类型 tool，按 data_json 结构生成合法数据；条目不足时调用 skip tool
+
+环境变量（AGENTIC_MODEL_PROVIDER=fake 时生效）:
+    AGENTIC_FAKE_LATENCY      每次调用的延迟分布: fixed:S | uniform:A,B | normal:MEAN,STD | lognormal:MEDIAN,SIGMA（秒，默认 fixed:0）
+    AGENTIC_FAKE_ERROR_RATE   抛出 FakeModelError 的概率（默认 0）
+    AGENTIC_FAKE_HANG_RATE    挂起 AGENTIC_FAKE_HANG_SECONDS（默认 300s）的概率，用于触发 deadline（默认 0）
+    AGENTIC_FAKE_SEED         随机种子（默认 0）
+
+stream_response 不产生增量事件，只产出一个由 get_response 结果构造的 response.completed 事件。
+
+token 用量按字符数估算（CJK 约 1 token/字，其余约 4 字符/token）；同一静态前缀
+（instructions + tools + handoffs）第二次出现起按 128 token 粒度计为 cached_tokens，模拟 provider 的 prompt cache。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import itertools
+import json
+import math
+import random
+import re
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from agents import Handoff, Model, ModelProvider, ModelResponse, Tool, Usage
+from openai.types.responses import (
+    ResponseFunctionToolCall,
+    ResponseOutputMessage,
+    ResponseOutputText,
+)
+from openai.types.responses.response_usage import InputTokensDetails, OutputTokensDetails
+
+from ..config import TEMPLATE_CATEGORIES
+from .client import _get_env_value, _parse_float, _parse_int
+from .model_replay import as_completed_event
+
+# provider prompt cache 的最小前缀与计费粒度
+CACHE_MIN_TOKENS = 1024
+CACHE_BLOCK_TOKENS = 128
+
+# 标签长度上限，低于各模板 maxLabelLength
+MAX_LABEL_LENGTH = 10
+
+# template_selector 的关键词规则，按顺序匹配
+_CATEGORY_RULES: List[Tuple[str, re.Pattern]] = [
+    ("chart", re.compile(r"\d+(?:\.\d+)?\s*(?:%|％|万元|亿元|万|亿|元|美元|倍)")),
+    ("quadrant", re.compile(r"象限|矩阵|两个维度|quadrant|matrix", re.I)),
+    ("comparison", re.compile(r"对比|相比|优势|劣势|优缺点|SWOT|\bvs\.?|versus|compared", re.I)),
+    ("sequence", re.compile(r"步骤|首先|然后|其次|最后|阶段|流程|\d{4}\s*年|\bstep|\bfirst\b|\bthen\b", re.I)),
+    ("hierarchy", re.compile(r"分为|包括以下|层级|架构|组成|下设|分类", re.I)),
+    ("relation", re.compile(r"依赖|导致|影响|关联|上下游|→|->", re.I)),
+    ("list", re.compile(r"^\s*(?:[-*•]|\d+[.、)])\s*\S|、", re.M)),
+]
+
+_HEADING = re.compile(r"^\s{0,3}#{1,6}\s+(.+?)\s*#*\s*$")
+_SENTENCE_SPLIT = re.compile(r"[。！？!?；;\n]+|(?<=[.])\s+")
+_ITEM_SPLIT = re.compile(r"[，,、：:。！？!?；;\n]+")
+_BULLET = re.compile(r"^\s*(?:[-*•]|\d+[.、)])\s*")
+_PAIR = re.compile(r"([^\s\d，,、：:。；;（）()]{1,12}?)\s*(?:占比?|为|达到?|约|是|:|：)?\s*(\d+(?:\.\d+)?)\s*(%|％)?")
+_PAGE_INTENT = re.compile(r"## 意图\s*\n(.*?)\n\s*## 段落内容\s*\n(.*)", re.S)
+
+
+class FakeModelError(RuntimeError):
+    """注入的模型调用失败"""
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """解析延迟分布描述，返回采样函数（秒，非负）"""
+    kind, _, params = (spec or "fixed:0").partition(":")
+    try:
+        values = [float(v) for v in params.split(",") if v.strip()]
+    except ValueError:
+        raise ValueError(f"Invalid latency spec: {spec!r}") from None
+    kind = kind.strip().lower()
+    if kind == "fixed" and len(values) == 1:
+        return lambda rng: max(values[0], 0.0)
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: max(rng.uniform(values[0], values[1]), 0.0)
+    if kind == "normal" and len(values) == 2:
+        return lambda rng: max(rng.gauss(values[0], values[1]), 0.0)
+    if kind == "lognormal" and len(values) == 2 and values[0] > 0:
+        mu = math.log(values[0])
+        return lambda rng: rng.lognormvariate(mu, values[1])
+    raise ValueError(f"Invalid latency spec: {spec!r}")
+
+
+@dataclass
+class FakeModelConfig:
+    """假模型的延迟、错误注入与随机种子"""
+
+    latency: str = "fixed:0"
+    error_rate: float = 0.0
+    hang_rate: float = 0.0
+    hang_seconds: float = 300.0
+    seed: int = 0
+
+    @classmethod
+    def from_env(cls) -> FakeModelConfig:
+        return cls(
+            latency=_get_env_value("AGENTIC_FAKE_LATENCY", "fixed:0"),
+            error_rate=_parse_float(_get_env_value("AGENTIC_FAKE_ERROR_RATE"), 0.0),
+            hang_rate=_parse_float(_get_env_value("AGENTIC_FAKE_HANG_RATE"), 0.0),
+            hang_seconds=_parse_float(_get_env_value("AGENTIC_FAKE_HANG_SECONDS"), 300.0),
+            seed=_parse_int(_get_env_value("AGENTIC_FAKE_SEED"), 0),
+        )
+
+
+@dataclass
+class FakeRequest:
+    """一次模型请求的可读视图，供脚本化 responder 判断"""
+
+    system_instructions: str
+    text: str
+    tools: List[Tool] = field(default_factory=list)
+    handoffs: List[Handoff] = field(default_factory=list)
+    output_schema: Any = None
+
+    @property
+    def intent(self) -> str:
+        match = _PAGE_INTENT.search(self.text)
+        return match.group(1).strip() if match else ""
+
+    @property
+    def paragraphs(self) -> List[str]:
+        match = _PAGE_INTENT.search(self.text)
+        body = match.group(2) if match else self.text
+        return [line.strip() for line in body.splitlines() if line.strip()]
+
+
+# 脚本化响应：返回 None 时回落到内置规则
+Responder = Callable[[FakeRequest], Optional[ModelResponse]]
+
+
+def _estimate_tokens(text: str) -> int:
+    cjk = sum(1 for ch in text if "一" <= ch <= "鿿")
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+def _stable_index(text: str, n: int) -> int:
+    """由内容决定的稳定选择，同一输入总是得到同一结果"""
+    return zlib.crc32(text.encode("utf-8")) % n if n else 0
+
+
+def _input_text(input: Any) -> str:
+    """取出用户消息文本；handoff 之后 input 是包含历史条目的列表"""
+    if isinstance(input, str):
+        return input
+    for item in input:
+        if not isinstance(item, dict) or item.get("role") != "user":
+            continue
+        content = item.get("content")
+        if isinstance(content, str):
+            return content
+        if isinstance(content, list):
+            return "\n".join(
+                part.get("text", "") for part in content if isinstance(part, dict)
+            )
+    return ""
+
+
+def _label(text: str) -> str:
+    text = _BULLET.sub("", text).strip(" 　\t\"'“”")
+    return text[:MAX_LABEL_LENGTH]
+
+
+def _items(paragraphs: List[str]) -> List[str]:
+    """把段落拆成去重的短条目"""
+    items: List[str] = []
+    seen: Set[str] = set()
+    for paragraph in paragraphs:
+        for part in _ITEM_SPLIT.split(paragraph):
+            label = _label(part)
+            if len(label) >= 2 and label not in seen:
+                seen.add(label)
+                items.append(label)
+    return items
+
+
+def _values(paragraphs: List[str]) -> List[Dict[str, Any]]:
+    values: List[Dict[str, Any]] = []
+    for match in _PAIR.finditer(" ".join(paragraphs)):
+        label = _label(match.group(1))
+        if label:
+            values.append({"label": label, "value": float(match.group(2))})
+    return values
+
+
+def _segment(article: str) -> Dict[str, Any]:
+    """按 Markdown 标题分组；没有标题时每个段落一个 intent"""
+    groups: List[Tuple[Optional[str], List[str]]] = []
+    has_heading = any(_HEADING.match(line) for line in article.splitlines())
+    for block in re.split(r"\n\s*\n", article):
+        block = block.strip()
+        if not block:
+            continue
+        heading = _HEADING.match(block.splitlines()[0])
+        if heading:
+            body = "\n".join(block.splitlines()[1:]).strip()
+            groups.append((heading.group(1), [body] if body else []))
+        elif has_heading and groups:
+            groups[-1][1].append(block)
+        else:
+            groups.append((None, [block]))
+
+    intents = []
+    for title, paragraphs in groups:
+        if not paragraphs:
+            continue
+        summary = title or _SENTENCE_SPLIT.split(paragraphs[0])[0]
+        intents.append({"intent": summary.strip()[:40], "paragraphs": paragraphs})
+    return {"intents": intents}
+
+
+def _choose_category(text: str) -> str:
+    for category, pattern in _CATEGORY_RULES:
+        if pattern.search(text):
+            return category
+    return "skip"
+
+
+def _sub_category_of(tool_name: str) -> Optional[Tuple[str, str]]:
+    sub_category = tool_name.replace("_", "-")
+    for category, meta in TEMPLATE_CATEGORIES.items():
+        if sub_category in meta["sub_categories"]:
+            return category, sub_category
+    return None
+
+
+def _template_for(tool: Tool, category: str, sub_category: str, key: str) -> str:
+    schema = getattr(tool, "params_json_schema", {}) or {}
+    prop = schema.get("properties", {}).get("template", {})
+    if "const" in prop:
+        return prop["const"]
+    templates = prop.get("enum") or TEMPLATE_CATEGORIES[category]["sub_categories"][sub_category].get(
+        "templates", []
+    )
+    return templates[_stable_index(key, len(templates))] if templates else sub_category
+
+
+def _chunks(items: List[str], n: int) -> List[List[str]]:
+    groups: List[List[str]] = [[] for _ in range(n)]
+    for i, item in enumerate(items):
+        groups[i % n].append(item)
+    return groups
+
+
+def _build_data(sub_category: str, intent: str, items: List[str], values: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """按子类型的 data_json 结构生成数据（结构与 tools/compact.COMPACT_TOOL_RULES 一致）"""
+    title = _label(intent) or (items[0] if items else "")
+    if sub_category == "chart-combo":
+        points = values or [{"label": item, "value": float(i + 1)} for i, item in enumerate(items)]
+        points = points[:8]
+        return {
+            "title": title,
+            "primaryValues": points,
+            "secondaryValues": [
+                {"label": p["label"], "value": round(p["value"] * 1.1, 2)} for p in points
+            ],
+        }
+    if sub_category.startswith("chart-"):
+        points = values or [
+            {"label": item, "value": float(len(items) - i)} for i, item in enumerate(items)
+        ]
+        return {"title": title, "values": points[:12]}
+    if sub_category.startswith("list-"):
+        return {"lists": [{"label": item} for item in items[:6]]}
+    if sub_category == "sequence-funnel":
+        steps = items[:6]
+        return {"sequences": [{"label": item, "value": (len(steps) - i) * 10} for i, item in enumerate(steps)]}
+    if sub_category.startswith("sequence-"):
+        return {"sequences": [{"label": item} for item in items[:8]]}
+    if sub_category in ("compare-quadrant", "quadrant-quarter", "quadrant-simple"):
+        quadrants = [
+            {"title": f"Q{i + 1}", "items": group[:4]} for i, group in enumerate(_chunks(items, 4))
+        ]
+        if sub_category == "quadrant-simple":
+            return {"quadrants": quadrants}
+        return {"xAxis": "X", "yAxis": "Y", "quadrants": quadrants}
+    if sub_category.startswith("compare-"):
+        n = 4 if sub_category == "compare-swot" else 2
+        labels = ["S", "W", "O", "T"] if n == 4 else items[:2]
+        rest = items if n == 4 else items[2:] or items
+        return {
+            "compares": [
+                {"label": label, "children": group[:5] or [label]}
+                for label, group in zip(labels, _chunks(rest, n))
+            ]
+        }
+    if sub_category.startswith("hierarchy-"):
+        children = [{"label": item} for item in items[:4]]
+        return {"root": {"label": title, "children": children}}
+    if sub_category.startswith("relation-"):
+        nodes = [{"id": f"n{i}", "label": item} for i, item in enumerate(items[:8])]
+        relations = [{"from": a["id"], "to": b["id"]} for a, b in zip(nodes, nodes[1:])]
+        return {"nodes": nodes, "relations": relations}
+    return {"items": [{"label": item} for item in items]}
+
+
+class FakeModel(Model):
+    """按规则或脚本生成响应的离线模型"""
+
+    def __init__(self, config: FakeModelConfig, responder: Optional[Responder] = None) -> None:
+        self.config = config
+        self.responder = responder
+        self._rng = random.Random(config.seed)
+        self._sample_latency = parse_latency(config.latency)
+        self._counter = itertools.count(1)
+        self._seen_prefixes: Set[str] = set()
+
+    # ---- 响应构造 ----
+
+    def _usage(self, request: FakeRequest, output_text: str) -> Usage:
+        tool_defs = json.dumps(
+            [
+                {"name": t.name, "description": getattr(t, "description", ""),
+                 "parameters": getattr(t, "params_json_schema", {})}
+                for t in request.tools
+            ]
+            + [{"name": h.tool_name, "description": h.tool_description} for h in request.handoffs],
+            ensure_ascii=False,
+        )
+        prefix = request.system_instructions + tool_defs
+        prefix_tokens = _estimate_tokens(prefix)
+        input_tokens = prefix_tokens + _estimate_tokens(request.text)
+        fingerprint = hashlib.sha256(prefix.encode("utf-8")).hexdigest()
+        cached = 0
+        if fingerprint in self._seen_prefixes and prefix_tokens >= CACHE_MIN_TOKENS:
+            cached = prefix_tokens // CACHE_BLOCK_TOKENS * CACHE_BLOCK_TOKENS
+        self._seen_prefixes.add(fingerprint)
+        output_tokens = _estimate_tokens(output_text) + 1
+        return Usage(
+            requests=1,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            total_tokens=input_tokens + output_tokens,
+            # cache_write_tokens 只在较新的 openai SDK 中是必填字段
+            input_tokens_details=InputTokensDetails(cached_tokens=cached, cache_write_tokens=0),
+            output_tokens_details=OutputTokensDetails(reasoning_tokens=0),
+        )
+
+    def _message(self, request: FakeRequest, text: str) -> ModelResponse:
+        n = next(self._counter)
+        output = ResponseOutputMessage(
+            id=f"msg_fake_{n}",
+            type="message",
+            role="assistant",
+            status="completed",
+            content=[ResponseOutputText(type="output_text", text=text, annotations=[])],
+        )
+        return ModelResponse(output=[output], usage=self._usage(request, text), response_id=f"resp_fake_{n}")
+
+    def _call(self, request: FakeRequest, name: str, arguments: Dict[str, Any]) -> ModelResponse:
+        n = next(self._counter)
+        payload = json.dumps(arguments, ensure_ascii=False)
+        output = ResponseFunctionToolCall(
+            id=f"fc_fake_{n}",
+            call_id=f"call_fake_{n}",
+            type="function_call",
+            name=name,
+            arguments=payload,
+        )
+        return ModelResponse(output=[output], usage=self._usage(request, payload), response_id=f"resp_fake_{n}")
+
+    # ---- 规则 ----
+
+    def _select_handoff(self, request: FakeRequest) -> ModelResponse:
+        category = _choose_category(request.text)
+        target = f"{category.title()} Agent"
+        handoff = next((h for h in request.handoffs if h.agent_name == target), None)
+        if handoff is None:
+            handoff = next((h for h in request.handoffs if h.agent_name == "Skip Agent"), request.handoffs[0])
+        return self._call(request, handoff.tool_name, {})
+
+    def _select_tool(self, request: FakeRequest) -> ModelResponse:
+        names = {tool.name: tool for tool in request.tools}
+        skip_tool = next((name for name in names if name.startswith("skip_")), None)
+        candidates = []
+        for tool in request.tools:
+            found = _sub_category_of(tool.name)
+            if found is not None:
+                candidates.append((tool, found))
+
+        paragraphs = request.paragraphs
+        items = _items(paragraphs)
+        if not candidates or len(items) < 2:
+            if skip_tool is None:
+                return self._message(request, "skip")
+            return self._call(request, skip_tool, {"reason": "内容不足以生成图表"})
+
+        values = _values(paragraphs)
+        by_sub = {sub: (tool, category) for tool, (category, sub) in candidates}
+        if values and "chart-pie" in by_sub and 95 <= sum(v["value"] for v in values) <= 105:
+            sub_category = "chart-pie"
+        elif values and "chart-column" in by_sub:
+            sub_category = "chart-column"
+        else:
+            key = request.text
+            sub_category = candidates[_stable_index(key, len(candidates))][1][1]
+        tool, category = by_sub[sub_category]
+        data = _build_data(sub_category, request.intent, items, values)
+        return self._call(
+            request,
+            tool.name,
+            {
+                "template": _template_for(tool, category, sub_category, request.text),
+                "data_json": json.dumps(data, ensure_ascii=False),
+                "rationale": f"fake model: {sub_category}",
+            },
+        )
+
+    def _respond(self, request: FakeRequest) -> ModelResponse:
+        if self.responder is not None:
+            scripted = self.responder(request)
+            if scripted is not None:
+                return scripted
+        if request.handoffs:
+            return self._select_handoff(request)
+        if request.tools:
+            return self._select_tool(request)
+        if request.output_schema is not None and not request.output_schema.is_plain_text():
+            return self._message(request, json.dumps(_segment(request.text), ensure_ascii=False))
+        return self._message(request, "ok")
+
+    async def get_response(
+        self,
+        system_instructions,
+        input,
+        model_settings,
+        tools,
+        output_schema,
+        handoffs,
+        tracing,
+        *,
+        previous_response_id=None,
+        conversation_id=None,
+        prompt=None,
+    ) -> ModelResponse:
+        request = FakeRequest(
+            system_instructions=system_instructions or "",
+            text=_input_text(input),
+            tools=list(tools),
+            handoffs=list(handoffs),
+            output_schema=output_schema,
+        )
+        roll = self._rng.random()
+        delay = self._sample_latency(self._rng)
+        if roll < self.config.hang_rate:
+            delay = self.config.hang_seconds
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if roll >= 1.0 - self.config.error_rate:
+            raise FakeModelError("Injected fake model failure")
+        return self._respond(request)
+
+    async def stream_response(
+        self,
+        system_instructions,
+        input,
+        model_settings,
+        tools,
+        output_schema,
+        handoffs,
+        tracing,
+        *,
+        previous_response_id=None,
+        conversation_id=None,
+        prompt=None,
+    ):
+        response = await self.get_response(
+            system_instructions,
+            input,
+            model_settings,
+            tools,
+            output_schema,
+            handoffs,
+            tracing,
+            previous_response_id=previous_response_id,
+            conversation_id=conversation_id,
+            prompt=prompt,
+        )
+        yield as_completed_event(response, "fake")
+
+
+class FakeModelProvider(ModelProvider):
+    """所有模型名都返回同一个 FakeModel（共享 prompt cache 状态与随机序列）"""
+
+    def __init__(self, config: Optional[FakeModelConfig] = None, responder: Optional[Responder] = None) -> None:
+        self.model = FakeModel(config or FakeModelConfig.from_env(), responder=responder)
+
+    def get_model(self, model_name: Optional[str]) -> Model:
+        return self.model
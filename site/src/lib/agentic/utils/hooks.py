@@ -0,0 +1,60 @@
+"""
+[INPUT]: 多个 RunHooks 实例（用量统计、时间线记录等）
+[OUTPUT]: CompositeHooks, combine_hooks
+[POS]: agentic/utils 的 RunHooks 组合工具，Runner.run 只接受一个 hooks 参数
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 utils/.folder.md 的描述是否仍然准确。
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from agents import RunHooks
+
+
+class CompositeHooks(RunHooks):
+    """按顺序把每个回调分发给全部子 hooks"""
+
+    def __init__(self, hooks: List[RunHooks]) -> None:
+        self.hooks = hooks
+
+    async def on_llm_start(self, context, agent, system_prompt, input_items) -> None:
+        for hook in self.hooks:
+            await hook.on_llm_start(context, agent, system_prompt, input_items)
+
+    async def on_llm_end(self, context, agent, response) -> None:
+        for hook in self.hooks:
+            await hook.on_llm_end(context, agent, response)
+
+    async def on_agent_start(self, context, agent) -> None:
+        for hook in self.hooks:
+            await hook.on_agent_start(context, agent)
+
+    async def on_agent_end(self, context, agent, output) -> None:
+        for hook in self.hooks:
+            await hook.on_agent_end(context, agent, output)
+
+    async def on_handoff(self, context, from_agent, to_agent) -> None:
+        for hook in self.hooks:
+            await hook.on_handoff(context, from_agent, to_agent)
+
+    async def on_tool_start(self, context, agent, tool) -> None:
+        for hook in self.hooks:
+            await hook.on_tool_start(context, agent, tool)
+
+    async def on_tool_end(self, context, agent, tool, result) -> None:
+        for hook in self.hooks:
+            await hook.on_tool_end(context, agent, tool, result)
+
+
+def combine_hooks(*hooks: Optional[RunHooks]) -> Optional[RunHooks]:
+    """合并多个 hooks，忽略 None；只有一个时原样返回"""
+    active = [hook for hook in hooks if hook is not None]
+    if not active:
+        return None
+    if len(active) == 1:
+        return active[0]
+    return CompositeHooks(active)
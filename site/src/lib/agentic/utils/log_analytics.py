@@ -0,0 +1,206 @@
+"""
+[INPUT]: iter_log_records 读取的 JSONL 日志记录（PipelineLogger 写入的 extra_data）
+[OUTPUT]: LatencyHistogram, GroupStats, LogAggregator, aggregate_logs
+[POS]: agentic/utils 的日志分析模块，单次遍历、常量内存地统计各 category / template 的延迟分位数与错误率
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 utils/.folder.md 的描述是否仍然准确。
+
+统计口径:
+    - selection: intent_complete / intent_skipped / intent_error / intent_timed_out 事件，
+      按 category 与 template 分组；错误与超时归入出错前已路由到的 category，以及最近一次 tool 调用的 template
+    - render: render_complete / render_error 事件，按 template 分组
+    延迟分位数来自对数分桶直方图（相对误差约 2.5%），内存与记录数无关。
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from .log_storage import iter_log_records
+
+UNKNOWN = "unknown"
+
+
+class LatencyHistogram:
+    """对数分桶的延迟直方图，固定内存、可合并"""
+
+    MIN_VALUE = 0.001  # 1ms
+    GROWTH = 1.05
+
+    def __init__(self) -> None:
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def _bucket(self, value: float) -> int:
+        if value <= self.MIN_VALUE:
+            return 0
+        return int(math.log(value / self.MIN_VALUE, self.GROWTH)) + 1
+
+    def add(self, value: float) -> None:
+        bucket = self._bucket(value)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        for bucket, n in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + n
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """估算分位数（取所在桶的几何中点，并限制在 [min, max] 内）"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                if bucket == 0:
+                    estimate = self.MIN_VALUE
+                else:
+                    estimate = self.MIN_VALUE * self.GROWTH ** (bucket - 0.5)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        def rounded(value: Optional[float]) -> Optional[float]:
+            return round(value, 4) if value is not None else None
+
+        return {
+            "count": self.count,
+            "mean": rounded(self.total / self.count) if self.count else None,
+            "p50": rounded(self.quantile(0.50)),
+            "p95": rounded(self.quantile(0.95)),
+            "p99": rounded(self.quantile(0.99)),
+            "max": rounded(self.max),
+        }
+
+
+@dataclass
+class GroupStats:
+    """一个分组（category / template）的计数、延迟与 token 累计"""
+
+    total: int = 0
+    success: int = 0
+    skipped: int = 0
+    errors: int = 0
+    timed_out: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def add(self, outcome: str, duration: Optional[float], tokens: Optional[Dict[str, int]]) -> None:
+        self.total += 1
+        if outcome == "success":
+            self.success += 1
+        elif outcome == "skipped":
+            self.skipped += 1
+        elif outcome == "timed_out":
+            self.timed_out += 1
+        else:
+            self.errors += 1
+        if duration is not None:
+            self.latency.add(duration)
+        if tokens:
+            self.input_tokens += tokens.get("input", 0)
+            self.output_tokens += tokens.get("output", 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        def rate(n: int) -> float:
+            return round(n / self.total, 4) if self.total else 0.0
+
+        return {
+            "total": self.total,
+            "success": self.success,
+            "skip_rate": rate(self.skipped),
+            "error_rate": rate(self.errors),
+            "timeout_rate": rate(self.timed_out),
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "latency": self.latency.to_dict(),
+        }
+
+
+_SELECTION_OUTCOMES = {
+    "intent_complete": "success",
+    "intent_skipped": "skipped",
+    "intent_error": "error",
+    "intent_timed_out": "timed_out",
+}
+_RENDER_OUTCOMES = {
+    "render_complete": "success",
+    "render_error": "error",
+}
+
+
+class LogAggregator:
+    """流式聚合日志记录；只保存分组统计，不保存记录本身"""
+
+    def __init__(self) -> None:
+        self.records = 0
+        self.by_category: Dict[str, GroupStats] = {}
+        self.by_template: Dict[str, GroupStats] = {}
+        self.render_by_template: Dict[str, GroupStats] = {}
+
+    def add(self, record: Dict[str, Any]) -> None:
+        self.records += 1
+        data = record.get("data")
+        if not isinstance(data, dict):
+            return
+        event = data.get("event")
+        duration = data.get("duration")
+        if event in _SELECTION_OUTCOMES:
+            outcome = _SELECTION_OUTCOMES[event]
+            tokens = data.get("tokens")
+            category = data.get("category") or UNKNOWN
+            self.by_category.setdefault(category, GroupStats()).add(outcome, duration, tokens)
+            if outcome == "success" or data.get("template"):
+                template = data.get("template") or UNKNOWN
+                self.by_template.setdefault(template, GroupStats()).add(outcome, duration, tokens)
+        elif event in _RENDER_OUTCOMES:
+            template = data.get("template") or UNKNOWN
+            self.render_by_template.setdefault(template, GroupStats()).add(
+                _RENDER_OUTCOMES[event], duration, None
+            )
+
+    def report(self) -> Dict[str, Any]:
+        def dump(groups: Dict[str, GroupStats]) -> Dict[str, Any]:
+            return {
+                name: stats.to_dict()
+                for name, stats in sorted(groups.items(), key=lambda kv: -kv[1].total)
+            }
+
+        return {
+            "records": self.records,
+            "by_category": dump(self.by_category),
+            "by_template": dump(self.by_template),
+            "render_by_template": dump(self.render_by_template),
+        }
+
+
+def aggregate_logs(
+    paths: Optional[Iterable[Path]] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+) -> Dict[str, Any]:
+    """单次遍历一个或多个日志文件/目录，返回按 category / template 聚合的统计"""
+    aggregator = LogAggregator()
+    for record in iter_log_records(paths, since=since, until=until):
+        aggregator.add(record)
+    return aggregator.report()
@@ -0,0 +1,375 @@
+"""
+[INPUT]: JSONFormatter 格式化后的日志行, AGENTIC_LOG_* 环境变量
+[OUTPUT]: RotatingJSONLHandler, get_file_handler, list_log_segments, iter_log_records, open_log_segment
+[POS]: agentic/utils 的日志存储层，负责 JSONL 日志的轮转、压缩、保留与跨分段读取
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 utils/.folder.md 的描述是否仍然准确。
+
+文件布局（LOG_DIR 下）:
+    2026-01-01.jsonl            当天正在写入的分段
+    2026-01-01.001.jsonl.gz     已轮转并压缩的分段（序号递增）
+
+轮转与保留:
+    - 当前分段超过 AGENTIC_LOG_MAX_BYTES（默认 100MB）或日期变化时轮转
+    - 轮转后的分段由后台线程压缩: AGENTIC_LOG_COMPRESSION=gzip（默认）| zstd | none
+      （zstd 需要安装 zstandard，未安装时回退为 gzip）
+    - 超过 AGENTIC_LOG_RETENTION_DAYS（默认 14）天或总大小超过
+      AGENTIC_LOG_MAX_TOTAL_BYTES（默认 2GB）的最旧分段被删除
+
+读取:
+    for record in iter_log_records():   # 按时间顺序透明读取 .jsonl / .gz / .zst
+        ...
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from queue import Queue
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .client import _get_env_value, _parse_int, _parse_literal
+
+try:
+    import zstandard
+except ImportError:  # 可选依赖
+    zstandard = None
+
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+DEFAULT_MAX_TOTAL_BYTES = 2 * 1024 * 1024 * 1024
+DEFAULT_RETENTION_DAYS = 14
+
+_SEGMENT_RE = re.compile(
+    r"^(?P<date>\d{4}-\d{2}-\d{2})(?:\.(?P<seq>\d{3,}))?\.jsonl(?P<ext>\.gz|\.zst)?$"
+)
+_COMPRESSED_EXT = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def _parse_segment(path: Path) -> Optional[Tuple[str, float]]:
+    """解析分段文件名为排序键 (日期, 序号)；当天正在写入的分段排在最后"""
+    match = _SEGMENT_RE.match(path.name)
+    if not match:
+        return None
+    seq = match.group("seq")
+    return match.group("date"), float(seq) if seq else float("inf")
+
+
+def list_log_segments(
+    log_dir: Path,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+) -> List[Path]:
+    """按时间顺序列出日志分段
+
+    Args:
+        log_dir: 日志目录
+        since: 可选，起始日期（含），格式 YYYY-MM-DD
+        until: 可选，结束日期（含），格式 YYYY-MM-DD
+    """
+    if not log_dir.exists():
+        return []
+    segments = []
+    for path in log_dir.iterdir():
+        key = _parse_segment(path)
+        if key is None:
+            continue
+        if since and key[0] < since:
+            continue
+        if until and key[0] > until:
+            continue
+        # 同一分段压缩完成前可能同时存在原文件与压缩文件，只取原文件
+        if path.suffix in (".gz", ".zst") and path.with_suffix("").exists():
+            continue
+        segments.append((key, path))
+    return [path for _, path in sorted(segments)]
+
+
+def open_log_segment(path: Path) -> IO[str]:
+    """以文本方式打开分段，按后缀透明解压"""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError(f"zstandard is required to read {path.name}")
+        reader = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def iter_log_records(
+    paths: Optional[Iterable[Path]] = None,
+    log_dir: Optional[Path] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """逐行读取日志记录（流式，常量内存）
+
+    Args:
+        paths: 可选，指定的分段文件或目录；默认读取 log_dir 下全部分段
+        log_dir: 可选，日志目录，默认为 logger 的 LOG_DIR
+        since / until: 可选，日期范围（仅对目录生效）
+
+    Yields:
+        每条 JSON 日志解析后的 dict；无法解析的行（如写入中断的末行）被跳过
+    """
+    if paths is None:
+        if log_dir is None:
+            from .logger import LOG_DIR
+
+            log_dir = LOG_DIR
+        paths = [log_dir]
+
+    for path in paths:
+        path = Path(path)
+        segments = list_log_segments(path, since, until) if path.is_dir() else [path]
+        for segment in segments:
+            try:
+                stream = open_log_segment(segment)
+            except FileNotFoundError:
+                # 读取期间被轮转或保留策略删除
+                continue
+            with stream:
+                for line in stream:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+
+
+def _compress(path: Path, method: str) -> Path:
+    """压缩分段并删除原文件，返回压缩后的路径"""
+    target = path.with_name(path.name + _COMPRESSED_EXT[method])
+    tmp = target.with_name(target.name + ".tmp")
+    with open(path, "rb") as src:
+        if method == "zstd":
+            with open(tmp, "wb") as raw:
+                with zstandard.ZstdCompressor(level=10).stream_writer(raw) as dst:
+                    shutil.copyfileobj(src, dst)
+        else:
+            with gzip.open(tmp, "wb", compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst)
+    os.replace(tmp, target)
+    path.unlink()
+    return target
+
+
+class _Compressor:
+    """后台压缩线程：轮转发生在日志写入线程中，压缩不能阻塞写入"""
+
+    def __init__(self, method: str, on_done) -> None:
+        self.method = method
+        self.on_done = on_done
+        self._queue: Queue[Optional[Path]] = Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, path: Path) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="agentic-log-compressor", daemon=True
+            )
+            self._thread.start()
+        self._queue.put(path)
+
+    def _run(self) -> None:
+        while True:
+            path = self._queue.get()
+            if path is None:
+                return
+            try:
+                _compress(path, self.method)
+            except OSError as e:
+                # 压缩失败时保留未压缩分段，读取端同样支持
+                logging.getLogger("agentic.logstore").debug(f"Compress failed: {path}: {e}")
+            self.on_done()
+
+    def close(self, timeout: float = 30.0) -> None:
+        """等待已提交的压缩完成"""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+
+class RotatingJSONLHandler(logging.Handler):
+    """按大小和日期轮转的 JSONL 文件 handler
+
+    写入始终发生在 QueueListener 线程中，handler 锁保证多个 listener 共享同一实例时
+    轮转与写入互斥。
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        compression: str = "gzip",
+        retention_days: int = DEFAULT_RETENTION_DAYS,
+        max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES,
+    ) -> None:
+        super().__init__()
+        if compression == "zstd" and zstandard is None:
+            compression = "gzip"
+        self.log_dir = log_dir
+        self.max_bytes = max_bytes
+        self.compression = compression
+        self.retention_days = retention_days
+        self.max_total_bytes = max_total_bytes
+        self._date: Optional[str] = None
+        self._stream: Optional[IO[str]] = None
+        self._size = 0
+        self._compressor = (
+            _Compressor(compression, self._apply_retention) if compression != "none" else None
+        )
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def current_file(self) -> Path:
+        date = self._date or datetime.now().strftime("%Y-%m-%d")
+        return self.log_dir / f"{date}.jsonl"
+
+    def _open(self, date: str) -> None:
+        self._date = date
+        path = self.current_file
+        self._stream = open(path, "a", encoding="utf-8")
+        self._size = path.stat().st_size
+
+    def _next_segment_path(self, date: str) -> Path:
+        seqs = [
+            int(m.group("seq"))
+            for m in (_SEGMENT_RE.match(p.name) for p in self.log_dir.glob(f"{date}.*"))
+            if m and m.group("seq")
+        ]
+        return self.log_dir / f"{date}.{max(seqs, default=0) + 1:03d}.jsonl"
+
+    def _rotate(self) -> None:
+        """关闭当前分段，重命名为带序号的分段并交给后台压缩"""
+        if self._stream is None or self._date is None:
+            return
+        self._stream.close()
+        self._stream = None
+        current = self.current_file
+        if current.exists() and current.stat().st_size > 0:
+            rotated = self._next_segment_path(self._date)
+            os.replace(current, rotated)
+            if self._compressor is not None:
+                self._compressor.submit(rotated)
+            else:
+                self._apply_retention()
+
+    def _rotate_stale(self, today: str) -> None:
+        """首次写入时处理之前进程遗留的、未轮转的往日分段"""
+        for path in self.log_dir.glob("*.jsonl"):
+            key = _parse_segment(path)
+            if key is None or key[1] != float("inf") or key[0] >= today:
+                continue
+            rotated = self._next_segment_path(key[0])
+            os.replace(path, rotated)
+            if self._compressor is not None:
+                self._compressor.submit(rotated)
+        self._apply_retention()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = self.format(record) + "\n"
+            # max_bytes 按 UTF-8 字节计，中文日志按字符数比较会超出上限数倍
+            size = len(line.encode("utf-8"))
+            date = time.strftime("%Y-%m-%d", time.localtime(record.created))
+            if self._stream is None or date != self._date:
+                if self._stream is not None:
+                    self._rotate()
+                elif self._date is None:
+                    self._rotate_stale(date)
+                self._open(date)
+            elif self._size + size > self.max_bytes and self._size > 0:
+                self._rotate()
+                self._open(date)
+            self._stream.write(line)
+            self._size += size
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        with self.lock:
+            if self._stream is not None:
+                self._stream.flush()
+
+    def close(self) -> None:
+        with self.lock:
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+        if self._compressor is not None:
+            self._compressor.close()
+        super().close()
+
+    def _apply_retention(self) -> None:
+        """删除超过保留天数或超出总大小上限的最旧分段（当天正在写入的分段除外）"""
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).strftime("%Y-%m-%d")
+        segments = list_log_segments(self.log_dir)
+        active = self.current_file
+        sizes = {}
+        for path in segments:
+            try:
+                sizes[path] = path.stat().st_size
+            except FileNotFoundError:
+                continue
+        total = sum(sizes.values())
+        for path, size in sizes.items():
+            if path == active:
+                continue
+            date = _parse_segment(path)[0]
+            if date < cutoff or total > self.max_total_bytes:
+                try:
+                    path.unlink()
+                    total -= size
+                except FileNotFoundError:
+                    pass
+
+
+_FILE_HANDLER: Optional[RotatingJSONLHandler] = None
+_FILE_HANDLER_LOCK = threading.Lock()
+
+
+def get_file_handler(log_dir: Path, level: int) -> RotatingJSONLHandler:
+    """进程内共享的文件 handler：多个 logger 写同一文件时只能有一个实例负责轮转"""
+    global _FILE_HANDLER
+    with _FILE_HANDLER_LOCK:
+        if _FILE_HANDLER is None:
+            _FILE_HANDLER = RotatingJSONLHandler(
+                log_dir,
+                max_bytes=_parse_int(_get_env_value("AGENTIC_LOG_MAX_BYTES"), DEFAULT_MAX_BYTES),
+                compression=_parse_literal(
+                    _get_env_value("AGENTIC_LOG_COMPRESSION"), ("gzip", "zstd", "none"), "gzip"
+                ),
+                retention_days=_parse_int(
+                    _get_env_value("AGENTIC_LOG_RETENTION_DAYS"), DEFAULT_RETENTION_DAYS
+                ),
+                max_total_bytes=_parse_int(
+                    _get_env_value("AGENTIC_LOG_MAX_TOTAL_BYTES"), DEFAULT_MAX_TOTAL_BYTES
+                ),
+            )
+            _FILE_HANDLER.setLevel(level)
+        return _FILE_HANDLER
+
+
+def reset_file_handler() -> None:
+    """关闭共享文件 handler（shutdown_logging 调用）"""
+    global _FILE_HANDLER
+    with _FILE_HANDLER_LOCK:
+        handler, _FILE_HANDLER = _FILE_HANDLER, None
+    if handler is not None:
+        handler.close()
@@ -1,8 +1,13 @@
 """
-[INPUT]: 无
-[OUTPUT]: logger 实例，日志配置函数
+[INPUT]: AGENTIC_LOG_QUEUE_SIZE, AGENTIC_LOG_OVERFLOW 环境变量；log_storage 的轮转文件 handler
+[OUTPUT]: logger 实例，日志配置函数，shutdown_logging, get_log_queue_stats
 [POS]: agentic/utils 的日志模块，提供结构化日志记录
 
+日志调用只在调用线程求值消息（msg % args），再把 LogRecord 放入有界队列（QueueHandler），
+格式化与 stdout/文件 I/O 由后台 QueueListener 线程完成，事件循环中的 pipeline_logger.* 不会阻塞。
+队列满时按 AGENTIC_LOG_OVERFLOW 处理: drop（默认，丢弃并计数）| block（等待写入）。
+进程退出时 shutdown_logging 停止 listener 并写完队列中的剩余记录。
+
 [PROTOCOL]:
 1. 一旦本文件逻辑变更，必须同步更新此 Header。
 2. 更新后必须上浮检查 utils/.folder.md 的描述是否仍然准确。
@@ -10,16 +15,27 @@
 
 from __future__ import annotations
 
+import atexit
+import copy
 import json
 import logging
+import queue
 import sys
-from datetime import datetime
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from .client import _get_env_value, _parse_int, _parse_literal
+from .log_storage import get_file_handler, reset_file_handler
 
 # 日志目录
 LOG_DIR = Path(__file__).parent.parent.parent.parent.parent / "logs" / "agentic"
 
+# 日志队列默认容量
+DEFAULT_LOG_QUEUE_SIZE = 10000
+
 
 class ColoredFormatter(logging.Formatter):
     """带颜色的控制台日志格式化器"""
@@ -34,6 +50,8 @@ class ColoredFormatter(logging.Formatter):
     }
 
     def format(self, record: logging.LogRecord) -> str:
+        # 同一条 record 还会交给文件 handler，着色只作用于副本
+        record = copy.copy(record)
         color = self.COLORS.get(record.levelname, self.COLORS["RESET"])
         reset = self.COLORS["RESET"]
         record.levelname = f"{color}{record.levelname}{reset}"
@@ -45,7 +63,9 @@ class JSONFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc)
+            .replace(tzinfo=None)
+            .isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -58,6 +78,86 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_data, ensure_ascii=False, default=str)
 
 
+class BoundedQueueHandler(QueueHandler):
+    """写入有界队列的 handler，队列满时按 overflow 策略丢弃或阻塞"""
+
+    def __init__(self, log_queue: queue.Queue, overflow: str = "drop") -> None:
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """在调用线程固化消息与异常信息，格式化（JSON / 控制台）留给 listener 线程
+
+        msg % args 必须在这里求值：参数可能是调用方之后还会修改的可变对象，
+        延迟到 listener 线程会记录到修改后的值（与标准库 QueueHandler.prepare 一致）。
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.overflow == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+# logger 名称 -> (队列 handler, 后台 listener)
+_QUEUE_LOGGING: Dict[str, Tuple[BoundedQueueHandler, QueueListener]] = {}
+_QUEUE_LOCK = threading.Lock()
+
+
+def _get_queue_size() -> int:
+    size = _parse_int(_get_env_value("AGENTIC_LOG_QUEUE_SIZE"), DEFAULT_LOG_QUEUE_SIZE)
+    return max(1, size)
+
+
+def _get_overflow_policy() -> str:
+    return _parse_literal(_get_env_value("AGENTIC_LOG_OVERFLOW"), ("drop", "block"), "drop")
+
+
+def shutdown_logging() -> None:
+    """停止所有 listener，写完队列中剩余的日志并 flush（进程退出时自动调用）"""
+    with _QUEUE_LOCK:
+        entries = list(_QUEUE_LOGGING.items())
+        _QUEUE_LOGGING.clear()
+    # 先停止全部 listener，再关闭 handler：文件 handler 由多个 listener 共享
+    handlers: Dict[int, logging.Handler] = {}
+    for name, (queue_handler, listener) in entries:
+        listener.stop()
+        logging.getLogger(name).removeHandler(queue_handler)
+        for handler in listener.handlers:
+            handlers[id(handler)] = handler
+    for handler in handlers.values():
+        handler.flush()
+        handler.close()
+    reset_file_handler()
+
+
+atexit.register(shutdown_logging)
+
+
+def get_log_queue_stats() -> Dict[str, Dict[str, Any]]:
+    """各 logger 的队列状态: 积压数量、容量、丢弃数量、溢出策略"""
+    with _QUEUE_LOCK:
+        return {
+            name: {
+                "pending": handler.queue.qsize(),
+                "capacity": handler.queue.maxsize,
+                "dropped": handler.dropped,
+                "overflow": handler.overflow,
+            }
+            for name, (handler, _) in _QUEUE_LOGGING.items()
+        }
+
+
 def setup_logger(
     name: str = "agentic",
     level: int = logging.INFO,
@@ -85,6 +185,7 @@ def setup_logger(
     logger.setLevel(level)
     logger.propagate = False
 
+    handlers: List[logging.Handler] = []
     if log_to_console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
@@ -93,15 +194,26 @@ def setup_logger(
             datefmt="%H:%M:%S",
         )
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     if log_to_file:
-        LOG_DIR.mkdir(parents=True, exist_ok=True)
-        log_file = LOG_DIR / f"{datetime.now().strftime('%Y-%m-%d')}.jsonl"
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
-        file_handler.setLevel(level)
+        # 所有 logger 共享同一个按大小/日期轮转的文件 handler
+        file_handler = get_file_handler(LOG_DIR, level)
         file_handler.setFormatter(JSONFormatter())
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if not handlers:
+        return logger
+
+    # 调用方只入队；格式化与 I/O 在 listener 线程中完成
+    queue_handler = BoundedQueueHandler(
+        queue.Queue(maxsize=_get_queue_size()), overflow=_get_overflow_policy()
+    )
+    listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    listener.start()
+    with _QUEUE_LOCK:
+        _QUEUE_LOGGING[name] = (queue_handler, listener)
+    logger.addHandler(queue_handler)
 
     return logger
 
@@ -115,76 +227,344 @@ def get_logger(name: str = "agentic") -> logging.Logger:
 
 
 class PipelineLogger:
-    """Pipeline 专用日志记录器，提供结构化的日志方法"""
+    """Pipeline 专用日志记录器，提供结构化的日志方法
+
+    每条日志的 extra_data 都带 event 字段及该事件的结构化数据
+    （stage, index, category, template, duration, tokens 等），
+    JSONL 中的 data 可直接聚合，无需解析 message 文本。
+    """
 
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or get_logger("agentic.pipeline")
 
+    def _log(self, level: int, message: str, event: str, **fields: Any) -> None:
+        if not self.logger.isEnabledFor(level):
+            return
+        data = {"event": event}
+        data.update((k, v) for k, v in fields.items() if v is not None)
+        self.logger.log(level, message, extra={"extra_data": data})
+
     def start_pipeline(self, article_length: int) -> None:
         """记录 pipeline 开始"""
-        self.logger.info(f"🚀 Pipeline started | Article length: {article_length} chars")
+        self._log(
+            logging.INFO,
+            f"🚀 Pipeline started | Article length: {article_length} chars",
+            "pipeline_start",
+            stage="pipeline",
+            article_length=article_length,
+        )
 
     def end_pipeline(self, intent_count: int, success_count: int, duration: float) -> None:
         """记录 pipeline 结束"""
-        self.logger.info(
+        self._log(
+            logging.INFO,
             f"✅ Pipeline completed | Intents: {intent_count} | "
-            f"Success: {success_count} | Duration: {duration:.2f}s"
+            f"Success: {success_count} | Duration: {duration:.2f}s",
+            "pipeline_complete",
+            stage="pipeline",
+            intents=intent_count,
+            success=success_count,
+            duration=duration,
         )
 
     def segmentation_start(self) -> None:
         """记录切分开始"""
-        self.logger.info("📝 Segmentation started")
+        self._log(logging.INFO, "📝 Segmentation started", "segmentation_start", stage="segmentation")
 
     def segmentation_complete(self, intent_count: int, duration: float) -> None:
         """记录切分完成"""
-        self.logger.info(
-            f"📝 Segmentation complete | Intents: {intent_count} | Duration: {duration:.2f}s"
+        self._log(
+            logging.INFO,
+            f"📝 Segmentation complete | Intents: {intent_count} | Duration: {duration:.2f}s",
+            "segmentation_complete",
+            stage="segmentation",
+            intents=intent_count,
+            duration=duration,
+        )
+
+    def segmentation_timed_out(self, elapsed: float) -> None:
+        """记录切分在截止时间前未完成"""
+        self._log(
+            logging.WARNING,
+            f"⏰ Segmentation timed out after {elapsed:.2f}s",
+            "segmentation_timed_out",
+            stage="segmentation",
+            duration=elapsed,
         )
 
     def intent_processing_start(self, index: int, intent: str) -> None:
         """记录单个 intent 处理开始"""
         short_intent = intent[:50] + "..." if len(intent) > 50 else intent
-        self.logger.info(f"🔄 [{index}] Processing intent: {short_intent}")
+        self._log(
+            logging.INFO,
+            f"🔄 [{index}] Processing intent: {short_intent}",
+            "intent_start",
+            stage="selection",
+            index=index,
+        )
 
     def intent_processing_complete(
-        self, index: int, category: str, template: str, duration: float
+        self,
+        index: int,
+        category: str,
+        template: str,
+        duration: float,
+        tokens: Optional[Dict[str, int]] = None,
     ) -> None:
         """记录单个 intent 处理完成"""
-        self.logger.info(
-            f"✓  [{index}] Selected: {category}/{template} | Duration: {duration:.2f}s"
+        self._log(
+            logging.INFO,
+            f"✓  [{index}] Selected: {category}/{template} | Duration: {duration:.2f}s",
+            "intent_complete",
+            stage="selection",
+            index=index,
+            category=category,
+            template=template,
+            duration=duration,
+            tokens=tokens,
+        )
+
+    def intent_extracted_locally(
+        self, index: int, sub_category: str, template: str, duration: float
+    ) -> None:
+        """记录 intent 由本地规则提取完成（未调用 LLM）"""
+        self._log(
+            logging.INFO,
+            f"⚡ [{index}] Extracted locally: chart/{template} ({sub_category}) | "
+            f"Duration: {duration:.3f}s",
+            "intent_complete",
+            stage="selection",
+            index=index,
+            category="chart",
+            sub_category=sub_category,
+            template=template,
+            duration=duration,
+            source="local",
         )
 
-    def intent_skipped(self, index: int, reason: str) -> None:
+    def intent_skipped(
+        self,
+        index: int,
+        reason: str,
+        category: Optional[str] = None,
+        duration: Optional[float] = None,
+        tokens: Optional[Dict[str, int]] = None,
+    ) -> None:
         """记录 intent 被跳过"""
-        self.logger.info(f"⏭  [{index}] Skipped: {reason}")
+        self._log(
+            logging.INFO,
+            f"⏭  [{index}] Skipped: {reason}",
+            "intent_skipped",
+            stage="selection",
+            index=index,
+            category=category,
+            duration=duration,
+            tokens=tokens,
+            reason=reason,
+        )
 
-    def intent_error(self, index: int, error: str) -> None:
-        """记录 intent 处理错误"""
-        self.logger.error(f"❌ [{index}] Error: {error}")
+    def intent_timed_out(
+        self,
+        index: int,
+        elapsed: float,
+        category: Optional[str] = None,
+        template: Optional[str] = None,
+    ) -> None:
+        """记录 intent 在截止时间前未完成（category / template 为超时前已路由到的）"""
+        self._log(
+            logging.WARNING,
+            f"⏰ [{index}] Timed out after {elapsed:.2f}s",
+            "intent_timed_out",
+            stage="selection",
+            index=index,
+            category=category,
+            template=template,
+            duration=elapsed,
+        )
+
+    def intent_error(
+        self,
+        index: int,
+        error: str,
+        duration: Optional[float] = None,
+        tokens: Optional[Dict[str, int]] = None,
+        category: Optional[str] = None,
+        template: Optional[str] = None,
+    ) -> None:
+        """记录 intent 处理错误（category / template 为出错前已路由到的）"""
+        self._log(
+            logging.ERROR,
+            f"❌ [{index}] Error: {error}",
+            "intent_error",
+            stage="selection",
+            index=index,
+            category=category,
+            template=template,
+            duration=duration,
+            tokens=tokens,
+            error=error,
+        )
 
     def handoff(self, from_agent: str, to_agent: str) -> None:
         """记录 agent handoff"""
-        self.logger.debug(f"🔀 Handoff: {from_agent} → {to_agent}")
+        self._log(
+            logging.DEBUG,
+            f"🔀 Handoff: {from_agent} → {to_agent}",
+            "handoff",
+            from_agent=from_agent,
+            to_agent=to_agent,
+        )
 
     def tool_call(self, agent: str, tool: str, result_preview: str) -> None:
         """记录 tool 调用"""
-        self.logger.debug(f"🔧 [{agent}] Called {tool}: {result_preview[:100]}")
+        self._log(
+            logging.DEBUG,
+            f"🔧 [{agent}] Called {tool}: {result_preview[:100]}",
+            "tool_call",
+            agent=agent,
+            tool=tool,
+        )
+
+    def model_call(self, record: Any) -> None:
+        """记录单次模型调用的 token 与延迟（record 为 usage.ModelCallRecord）"""
+        index = f"[{record.index}] " if record.index is not None else ""
+        self._log(
+            logging.DEBUG,
+            f"🧮 {index}{record.agent} | In: {record.input_tokens} "
+            f"(cached {record.cached_tokens}) | Out: {record.output_tokens} | "
+            f"Latency: {record.latency:.2f}s",
+            "model_call",
+            **vars(record),
+        )
+
+    def usage_summary(self, summary: Dict[str, Any]) -> None:
+        """记录单篇文章的用量汇总（按 agent / category 聚合）"""
+        total = summary["total"]
+        self._log(
+            logging.INFO,
+            f"🧮 Usage | Calls: {total['calls']} | In: {total['input_tokens']} "
+            f"(cached {total['cached_tokens']}) | Out: {total['output_tokens']} | "
+            f"Model time: {total['latency']:.2f}s",
+            "usage_summary",
+            stage="pipeline",
+            **summary,
+        )
+
+    def prompt_cache_summary(self, by_agent: Dict[str, Dict[str, Any]]) -> None:
+        """记录各 agent 的 prompt cache 命中率（cached_tokens / input_tokens）"""
+        parts = [
+            f"{name} {totals['cached_ratio']:.0%}"
+            for name, totals in by_agent.items()
+            if totals["input_tokens"]
+        ]
+        if not parts:
+            return
+        self._log(
+            logging.INFO,
+            f"🗄️ Prompt cache | {' | '.join(parts)}",
+            "prompt_cache_summary",
+            stage="pipeline",
+            by_agent=by_agent,
+        )
+
+    def trace_saved(self, path: str) -> None:
+        """记录时间线 trace 文件已写出"""
+        self._log(
+            logging.INFO,
+            f"🧭 Trace saved: {path}",
+            "trace_saved",
+            stage="pipeline",
+            path=path,
+        )
+
+    def profile_saved(self, entry: str, mode: str, paths: List[str]) -> None:
+        """记录剖析报告已写出"""
+        self._log(
+            logging.INFO,
+            f"🔬 Profile ({mode}) {entry}: {', '.join(paths)}",
+            "profile_saved",
+            stage="pipeline",
+            entry=entry,
+            mode=mode,
+            paths=paths,
+        )
+
+    def profile_error(self, entry: str, mode: str, error: str) -> None:
+        """记录剖析报告写出失败"""
+        self._log(
+            logging.WARNING,
+            f"⚠️ Profile ({mode}) {entry} failed: {error}",
+            "profile_error",
+            stage="pipeline",
+            entry=entry,
+            mode=mode,
+            error=error,
+        )
 
     def render_start(self, index: int, template: str) -> None:
         """记录渲染开始"""
-        self.logger.info(f"🎨 [{index}] Rendering: {template}")
+        self._log(
+            logging.INFO,
+            f"🎨 [{index}] Rendering: {template}",
+            "render_start",
+            stage="render",
+            index=index,
+            template=template,
+        )
 
-    def render_complete(self, index: int, output_path: str, duration: float) -> None:
+    def render_complete(
+        self,
+        index: int,
+        output_path: str,
+        duration: float,
+        template: Optional[str] = None,
+    ) -> None:
         """记录渲染完成"""
-        self.logger.info(f"✅ [{index}] Saved: {output_path} | Duration: {duration:.2f}s")
+        self._log(
+            logging.INFO,
+            f"✅ [{index}] Saved: {output_path} | Duration: {duration:.2f}s",
+            "render_complete",
+            stage="render",
+            index=index,
+            template=template,
+            duration=duration,
+            output_path=output_path,
+        )
 
-    def render_error(self, index: int, error: str) -> None:
+    def render_error(self, index: int, error: str, template: Optional[str] = None) -> None:
         """记录渲染错误"""
-        self.logger.error(f"❌ [{index}] Render failed: {error}")
+        self._log(
+            logging.ERROR,
+            f"❌ [{index}] Render failed: {error}",
+            "render_error",
+            stage="render",
+            index=index,
+            template=template,
+            error=error,
+        )
+
+    def render_fitted(self, index: int, template: str, notes: List[str]) -> None:
+        """记录渲染前按模板上限规整了数据"""
+        self._log(
+            logging.WARNING,
+            f"📐 [{index}] Fitted to {template}: {'; '.join(notes)}",
+            "render_fitted",
+            stage="render",
+            index=index,
+            template=template,
+            notes=notes,
+        )
 
     def render_skipped(self, index: int, reason: str) -> None:
         """记录跳过渲染"""
-        self.logger.info(f"⏭  [{index}] Render skipped: {reason}")
+        self._log(
+            logging.INFO,
+            f"⏭  [{index}] Render skipped: {reason}",
+            "render_skipped",
+            stage="render",
+            index=index,
+            reason=reason,
+        )
 
 
 def get_log_dir() -> Path:
@@ -194,7 +574,7 @@ def get_log_dir() -> Path:
 
 
 def get_current_log_file() -> Path:
-    """获取当前日志文件路径"""
+    """获取当前正在写入的日志分段路径（已轮转的分段见 log_storage.list_log_segments）"""
     LOG_DIR.mkdir(parents=True, exist_ok=True)
     return LOG_DIR / f"{datetime.now().strftime('%Y-%m-%d')}.jsonl"
 
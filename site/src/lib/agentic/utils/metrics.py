@@ -0,0 +1,244 @@
+"""
+[INPUT]: pipeline / node_bridge 在各阶段的观测值
+[OUTPUT]: Counter, Histogram, MetricsRegistry, metrics, render_metrics, start_metrics_server
+[POS]: agentic/utils 的指标模块，以 Prometheus 文本格式暴露 pipeline 的计数与延迟分布
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 utils/.folder.md 的描述是否仍然准确。
+
+不依赖 prometheus_client：热路径上每次观测只是一次 bisect + 加锁自增。
+
+使用方式:
+    from agentic.utils import render_metrics, start_metrics_server
+    print(render_metrics())              # text exposition format (version 0.0.4)
+    start_metrics_server(9464)           # 可选: http://127.0.0.1:9464/metrics
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 秒级延迟的默认分桶，覆盖本地提取（毫秒级）到 LLM 多轮调用（数十秒）
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+
+class Counter(_Metric):
+    """单调递增计数器"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        lines = self.header()
+        for key, value in items:
+            lines.append(f"{self.name}_total{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    """固定分桶直方图"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [各桶计数..., +Inf 计数, sum]
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            slot = self._values.get(key)
+            if slot is None:
+                slot = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            slot[index] += 1
+            slot[-1] += value
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            slot = self._values.get(self._key(labels))
+            return int(sum(slot[:-1])) if slot else 0
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(slot)) for key, slot in self._values.items())
+        lines = self.header()
+        for key, slot in items:
+            cumulative = 0.0
+            for bound, n in zip(self.buckets + (math.inf,), slot[:-1]):
+                cumulative += n
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} "
+                    f"{_format_value(cumulative)}"
+                )
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(slot[-1])}")
+            lines.append(f"{self.name}_count{labels} {_format_value(cumulative)}")
+        return lines
+
+
+class MetricsRegistry:
+    """pipeline 的全部指标"""
+
+    def __init__(self) -> None:
+        self.segmentation_seconds = Histogram(
+            "agentic_segmentation_seconds",
+            "Article segmentation latency.",
+            ("outcome",),
+        )
+        self.selection_seconds = Histogram(
+            "agentic_selection_seconds",
+            "Per-intent template selection latency.",
+            ("category", "template", "outcome", "source"),
+        )
+        self.render_seconds = Histogram(
+            "agentic_render_seconds",
+            "Per-selection render latency including DSL generation.",
+            ("template", "outcome"),
+        )
+        self.node_render_seconds = Histogram(
+            "agentic_node_render_seconds",
+            "Node.js SSR subprocess latency.",
+            ("outcome",),
+        )
+        self.queue_wait_seconds = Histogram(
+            "agentic_queue_wait_seconds",
+            "Time between a unit of work being scheduled and starting.",
+            ("stage",),
+        )
+        self.intents = Counter(
+            "agentic_intents",
+            "Intents processed, by outcome (success | skipped | error | timed_out).",
+            ("category", "template", "outcome"),
+        )
+        self.retries = Counter(
+            "agentic_retries",
+            "Retried model HTTP requests (counted when AGENTIC_RETRY_METRICS is enabled).",
+            ("stage",),
+        )
+        self.cache_requests = Counter(
+            "agentic_cache_requests",
+            "Cache lookups by cache name and result (hit | miss).",
+            ("cache", "result"),
+        )
+        self.json_repairs = Counter(
+            "agentic_json_repairs",
+            "Local data_json repairs applied by tools, by repair kind and outcome (repaired | failed).",
+            ("repair", "outcome"),
+        )
+        self.prompt_cache_tokens = Counter(
+            "agentic_prompt_cache_tokens",
+            "Model input tokens served from the provider prompt cache (hit) or not (miss).",
+            ("agent", "result"),
+        )
+
+    def all(self) -> List[_Metric]:
+        return [value for value in vars(self).values() if isinstance(value, _Metric)]
+
+
+# 进程级默认注册表
+metrics = MetricsRegistry()
+
+
+def render_metrics(registry: Optional[MetricsRegistry] = None) -> str:
+    """以 Prometheus text exposition format 输出全部指标"""
+    registry = registry or metrics
+    lines: List[str] = []
+    for metric in registry.all():
+        lines.extend(metric.collect())
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = render_metrics().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        # 抓取请求不写访问日志
+        pass
+
+
+def start_metrics_server(port: int, addr: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """在后台线程启动 /metrics HTTP 端点，返回 server（调用 shutdown() 停止）"""
+    server = ThreadingHTTPServer((addr, port), _MetricsHandler)
+    thread = threading.Thread(
+        target=server.serve_forever, name="agentic-metrics-server", daemon=True
+    )
+    thread.start()
+    return server
@@ -0,0 +1,400 @@
+"""
+[INPUT]: 任意 Agents SDK ModelProvider 的请求/响应；AGENTIC_RECORD_PATH, AGENTIC_REPLAY_PATH, AGENTIC_REPLAY_TIME_SCALE 环境变量
+[OUTPUT]: RecordingModelProvider, ReplayModelProvider, ReplayMissError, ReplayedModelError, request_fingerprint, load_recordings, as_completed_event
+[POS]: agentic/utils 的模型调用录制与回放，用同一份录制在相同语料上确定性地重跑 pipeline，隔离测量调度、缓存与渲染改动
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 utils/.folder.md 的描述是否仍然准确。
+
+录制（AGENTIC_RECORD_PATH=archive.jsonl.gz）:
+    包裹当前 provider（openai 或 fake），每次 get_response 结束后追加一行:
+        {"key": 请求指纹, "model": 模型名, "latency": 秒, "response": {"output": [...], "usage": {...}, "response_id": ...}}
+    失败的调用记录 {"error": "异常类型: 信息"}。以 .gz 结尾时使用 gzip（每次追加一个 gzip member）。
+    stream_response 透传被包裹模型的事件流，收到 response.completed 时按同样格式录制。
+    写入在线程中执行（asyncio.to_thread），同一 provider 的写入由锁串行，不阻塞事件循环。
+
+回放（AGENTIC_MODEL_PROVIDER=replay, AGENTIC_REPLAY_PATH=archive.jsonl.gz）:
+    按请求指纹返回录制的响应，并等待 latency × AGENTIC_REPLAY_TIME_SCALE 秒（默认 1.0，0 表示不等待）。
+    同一指纹的多条录制按顺序轮流返回；找不到录制时抛出 ReplayMissError。
+    录制时失败的调用在回放时抛出 ReplayedModelError，保证重试 / 降级路径同样可复现。
+    stream_response 不回放增量事件，只产出一个由录制响应构造的 response.completed 事件。
+
+请求指纹: system_instructions + input + tool/handoff 名称 + output schema 名称的 sha256，
+input 中的 id / call_id 不参与计算（真实模型每次返回的 id 不同，回放时这些 id 来自录制本身）。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import json
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, Union
+
+from agents import Model, ModelProvider, ModelResponse, Usage
+from openai.types.responses import Response, ResponseCompletedEvent, ResponseOutputItem
+from openai.types.responses.response_usage import (
+    InputTokensDetails,
+    OutputTokensDetails,
+    ResponseUsage,
+)
+from pydantic import BaseModel, TypeAdapter
+
+# 不参与指纹计算的字段（每次调用都会变化的标识）
+_VOLATILE_KEYS = frozenset({"id", "call_id"})
+
+_output_item_adapter: TypeAdapter = TypeAdapter(ResponseOutputItem)
+
+
+class ReplayMissError(LookupError):
+    """回放时没有与请求指纹匹配的录制"""
+
+
+class ReplayedModelError(RuntimeError):
+    """录制时该调用失败，回放时原样抛出"""
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _normalize(value: Any) -> Any:
+    """转成可稳定序列化的结构，并去掉易变的标识字段"""
+    if isinstance(value, BaseModel):
+        value = value.model_dump(exclude_none=True)
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items() if k not in _VOLATILE_KEYS and v is not None}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def request_fingerprint(
+    system_instructions: Optional[str],
+    input: Any,
+    tools: List[Any],
+    handoffs: List[Any],
+    output_schema: Any,
+) -> str:
+    """模型请求的稳定指纹（录制与回放共用）"""
+    payload = {
+        "instructions": system_instructions or "",
+        "input": _normalize(input),
+        "tools": sorted(tool.name for tool in tools),
+        "handoffs": sorted(handoff.tool_name for handoff in handoffs),
+        "output_schema": output_schema.name() if output_schema is not None else None,
+    }
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _dump_usage(usage: Usage) -> Dict[str, int]:
+    return {
+        "requests": usage.requests,
+        "input_tokens": usage.input_tokens,
+        "output_tokens": usage.output_tokens,
+        "total_tokens": usage.total_tokens,
+        "cached_tokens": usage.input_tokens_details.cached_tokens or 0,
+        "reasoning_tokens": usage.output_tokens_details.reasoning_tokens or 0,
+    }
+
+
+def _load_usage(data: Dict[str, int]) -> Usage:
+    return Usage(
+        requests=data.get("requests", 1),
+        input_tokens=data.get("input_tokens", 0),
+        output_tokens=data.get("output_tokens", 0),
+        total_tokens=data.get("total_tokens", 0),
+        input_tokens_details=InputTokensDetails(
+            cached_tokens=data.get("cached_tokens", 0), cache_write_tokens=0
+        ),
+        output_tokens_details=OutputTokensDetails(reasoning_tokens=data.get("reasoning_tokens", 0)),
+    )
+
+
+def _dump_response(response: ModelResponse) -> Dict[str, Any]:
+    return {
+        "output": [item.model_dump(mode="json", exclude_none=True) for item in response.output],
+        "usage": _dump_usage(response.usage),
+        "response_id": response.response_id,
+    }
+
+
+def _dump_completed(response: Response) -> Dict[str, Any]:
+    """流式调用的 response.completed 事件，录制格式与 _dump_response 相同"""
+    usage = response.usage
+    return {
+        "output": [item.model_dump(mode="json", exclude_none=True) for item in response.output],
+        "usage": {
+            "requests": 1,
+            "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens,
+            "total_tokens": usage.total_tokens,
+            "cached_tokens": usage.input_tokens_details.cached_tokens or 0,
+            "reasoning_tokens": usage.output_tokens_details.reasoning_tokens or 0,
+        }
+        if usage is not None
+        else {},
+        "response_id": response.id,
+    }
+
+
+def _load_response(data: Dict[str, Any]) -> ModelResponse:
+    return ModelResponse(
+        output=[_output_item_adapter.validate_python(item) for item in data["output"]],
+        usage=_load_usage(data.get("usage", {})),
+        response_id=data.get("response_id"),
+    )
+
+
+def as_completed_event(response: ModelResponse, model_name: Optional[str] = None) -> ResponseCompletedEvent:
+    """把完整的 ModelResponse 包装成 response.completed 事件，供不产生增量的模型实现 stream_response"""
+    usage = response.usage
+    return ResponseCompletedEvent(
+        type="response.completed",
+        sequence_number=0,
+        response=Response(
+            id=response.response_id or "",
+            object="response",
+            created_at=time.time(),
+            model=model_name or "",
+            output=list(response.output),
+            parallel_tool_calls=False,
+            tool_choice="auto",
+            tools=[],
+            usage=ResponseUsage(
+                input_tokens=usage.input_tokens,
+                input_tokens_details=usage.input_tokens_details,
+                output_tokens=usage.output_tokens,
+                output_tokens_details=usage.output_tokens_details,
+                total_tokens=usage.total_tokens,
+            ),
+        ),
+    )
+
+
+def load_recordings(path: Union[str, Path]) -> Dict[str, List[Dict[str, Any]]]:
+    """读取录制文件，按请求指纹分组（保持录制顺序）"""
+    grouped: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    with _open(Path(path), "r") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                record = json.loads(line)
+                grouped[record["key"]].append(record)
+    return dict(grouped)
+
+
+# ============================================================
+# 录制
+# ============================================================
+
+
+class RecordingModel(Model):
+    """透传给被包裹的模型，并把每次调用写入录制文件"""
+
+    def __init__(
+        self, inner: Model, model_name: Optional[str], path: Path, lock: threading.Lock
+    ) -> None:
+        self.inner = inner
+        self.model_name = model_name
+        self.path = path
+        self._lock = lock
+
+    def _write(self, line: str) -> None:
+        # 并发写入同一文件会交错 gzip member，由 provider 级的锁串行
+        with self._lock, _open(self.path, "a") as f:
+            f.write(line)
+
+    async def _append(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        await asyncio.to_thread(self._write, line)
+
+    async def get_response(
+        self,
+        system_instructions,
+        input,
+        model_settings,
+        tools,
+        output_schema,
+        handoffs,
+        tracing,
+        *,
+        previous_response_id=None,
+        conversation_id=None,
+        prompt=None,
+    ) -> ModelResponse:
+        key = request_fingerprint(system_instructions, input, tools, handoffs, output_schema)
+        record: Dict[str, Any] = {"key": key, "model": self.model_name}
+        started = time.perf_counter()
+        try:
+            response = await self.inner.get_response(
+                system_instructions,
+                input,
+                model_settings,
+                tools,
+                output_schema,
+                handoffs,
+                tracing,
+                previous_response_id=previous_response_id,
+                conversation_id=conversation_id,
+                prompt=prompt,
+            )
+        except asyncio.CancelledError:
+            # 被 deadline 取消的调用没有完整响应，不录制
+            raise
+        except Exception as e:
+            record["latency"] = round(time.perf_counter() - started, 4)
+            record["error"] = f"{type(e).__name__}: {e}"
+            await self._append(record)
+            raise
+        record["latency"] = round(time.perf_counter() - started, 4)
+        record["response"] = _dump_response(response)
+        await self._append(record)
+        return response
+
+    async def stream_response(
+        self,
+        system_instructions,
+        input,
+        model_settings,
+        tools,
+        output_schema,
+        handoffs,
+        tracing,
+        *,
+        previous_response_id=None,
+        conversation_id=None,
+        prompt=None,
+    ):
+        key = request_fingerprint(system_instructions, input, tools, handoffs, output_schema)
+        record: Dict[str, Any] = {"key": key, "model": self.model_name}
+        started = time.perf_counter()
+        try:
+            async for event in self.inner.stream_response(
+                system_instructions,
+                input,
+                model_settings,
+                tools,
+                output_schema,
+                handoffs,
+                tracing,
+                previous_response_id=previous_response_id,
+                conversation_id=conversation_id,
+                prompt=prompt,
+            ):
+                if isinstance(event, ResponseCompletedEvent):
+                    record["latency"] = round(time.perf_counter() - started, 4)
+                    record["response"] = _dump_completed(event.response)
+                    await self._append(record)
+                yield event
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if "response" not in record:
+                record["latency"] = round(time.perf_counter() - started, 4)
+                record["error"] = f"{type(e).__name__}: {e}"
+                await self._append(record)
+            raise
+
+
+class RecordingModelProvider(ModelProvider):
+    """包裹任意 provider，录制经过它的全部模型调用"""
+
+    def __init__(self, inner: ModelProvider, path: Union[str, Path]) -> None:
+        self.inner = inner
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def get_model(self, model_name: Optional[str]) -> Model:
+        return RecordingModel(self.inner.get_model(model_name), model_name, self.path, self._lock)
+
+
+# ============================================================
+# 回放
+# ============================================================
+
+
+class ReplayModel(Model):
+    """按请求指纹返回录制的响应"""
+
+    def __init__(self, recordings: Dict[str, List[Dict[str, Any]]], time_scale: float = 1.0) -> None:
+        self.recordings = recordings
+        self.time_scale = time_scale
+        self._cursor: Dict[str, int] = defaultdict(int)
+
+    async def get_response(
+        self,
+        system_instructions,
+        input,
+        model_settings,
+        tools,
+        output_schema,
+        handoffs,
+        tracing,
+        *,
+        previous_response_id=None,
+        conversation_id=None,
+        prompt=None,
+    ) -> ModelResponse:
+        key = request_fingerprint(system_instructions, input, tools, handoffs, output_schema)
+        candidates = self.recordings.get(key)
+        if not candidates:
+            raise ReplayMissError(f"No recorded response for request {key[:12]}")
+        index = self._cursor[key]
+        self._cursor[key] = index + 1
+        record = candidates[index % len(candidates)]
+
+        delay = record.get("latency", 0.0) * self.time_scale
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if "error" in record:
+            raise ReplayedModelError(record["error"])
+        return _load_response(record["response"])
+
+    async def stream_response(
+        self,
+        system_instructions,
+        input,
+        model_settings,
+        tools,
+        output_schema,
+        handoffs,
+        tracing,
+        *,
+        previous_response_id=None,
+        conversation_id=None,
+        prompt=None,
+    ):
+        response = await self.get_response(
+            system_instructions,
+            input,
+            model_settings,
+            tools,
+            output_schema,
+            handoffs,
+            tracing,
+            previous_response_id=previous_response_id,
+            conversation_id=conversation_id,
+            prompt=prompt,
+        )
+        yield as_completed_event(response)
+
+
+class ReplayModelProvider(ModelProvider):
+    """所有模型名共享同一份录制与轮转游标"""
+
+    def __init__(self, path: Union[str, Path], time_scale: float = 1.0) -> None:
+        self.path = Path(path)
+        self.model = ReplayModel(load_recordings(self.path), time_scale)
+
+    def get_model(self, model_name: Optional[str]) -> Model:
+        return self.model
@@ -0,0 +1,199 @@
+"""
+[INPUT]: AGENTIC_PROFILE (off | cpu | alloc), AGENTIC_PROFILE_DIR 环境变量
+[OUTPUT]: get_profile_mode, profiled, profile_stage
+[POS]: agentic/utils 的性能剖析开关，包裹 process_article / render_selections 等入口，输出 pstats 与内存分配报告
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 utils/.folder.md 的描述是否仍然准确。
+
+模式:
+    cpu     cProfile 记录整个入口调用，写出 <entry>-<ts>.pstats（可用 snakeviz / pstats 打开）
+            与按累计耗时排序的 <entry>-<ts>.cpu.txt
+    alloc   tracemalloc 记录整个入口调用，每个 profile_stage 结束时对比快照，
+            写出 <entry>-<ts>.alloc.txt（各阶段新增分配 Top N + 入口整体 Top N）
+
+只有最外层入口开启会话：嵌套入口（process_article_sync → process_article）与并发调用
+直接执行，不重复开启 profiler。报告写入入口的输出目录（render_selections 的 output_dir），
+没有输出目录的入口写入 AGENTIC_PROFILE_DIR（默认 logs/agentic/profiles）。
+
+未启用时（默认）profiled / profile_stage 只做一次缓存值比较。
+"""
+
+from __future__ import annotations
+
+import cProfile
+import functools
+import inspect
+import io
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterator, List, Optional, TypeVar
+
+from .client import _get_env_value, _parse_literal
+from .logger import LOG_DIR, pipeline_logger
+
+PROFILE_MODES = ("off", "cpu", "alloc")
+
+# 报告中列出的函数 / 分配位置数量
+TOP_N = 40
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=1)
+def get_profile_mode() -> str:
+    """读取 AGENTIC_PROFILE（off | cpu | alloc，默认 off）；进程内只读取一次"""
+    return _parse_literal(_get_env_value("AGENTIC_PROFILE").lower(), PROFILE_MODES, "off")
+
+
+def get_profile_dir() -> Path:
+    """没有输出目录的入口写报告的位置"""
+    value = _get_env_value("AGENTIC_PROFILE_DIR")
+    return Path(value) if value else LOG_DIR / "profiles"
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    """当前分配快照（排除 tracemalloc 自身的记录）"""
+    return tracemalloc.take_snapshot().filter_traces(
+        (tracemalloc.Filter(False, tracemalloc.__file__),)
+    )
+
+
+def _format_alloc(title: str, stats: List[Any]) -> str:
+    lines = [f"== {title} =="]
+    for stat in stats[:TOP_N]:
+        lines.append(str(stat))
+    return "\n".join(lines)
+
+
+class _ProfileSession:
+    """一次最外层入口调用的剖析会话"""
+
+    def __init__(self, entry: str, mode: str, output_dir: Path) -> None:
+        self.entry = entry
+        self.mode = mode
+        self.output_dir = output_dir
+        self.stem = f"{entry}-{time.strftime('%Y%m%d-%H%M%S')}"
+        self.sections: List[str] = []
+        self._profiler: Optional[cProfile.Profile] = None
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        if self.mode == "cpu":
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        else:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            self._baseline = _snapshot()
+
+    def record_stage(self, stage: str, before: tracemalloc.Snapshot, duration: float) -> None:
+        after = _snapshot()
+        stats = after.compare_to(before, "lineno")
+        self.sections.append(_format_alloc(f"stage {stage} ({duration:.3f}s)", stats))
+
+    def stop(self) -> List[Path]:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        written: List[Path] = []
+        if self._profiler is not None:
+            self._profiler.disable()
+            pstats_path = self.output_dir / f"{self.stem}.pstats"
+            self._profiler.dump_stats(str(pstats_path))
+            buffer = io.StringIO()
+            pstats.Stats(self._profiler, stream=buffer).sort_stats("cumulative").print_stats(TOP_N)
+            text_path = self.output_dir / f"{self.stem}.cpu.txt"
+            text_path.write_text(buffer.getvalue(), encoding="utf-8")
+            written += [pstats_path, text_path]
+        if self._baseline is not None:
+            snapshot = _snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            self.sections.append(
+                _format_alloc(
+                    f"{self.entry} total (current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB)",
+                    snapshot.compare_to(self._baseline, "lineno"),
+                )
+            )
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+            alloc_path = self.output_dir / f"{self.stem}.alloc.txt"
+            alloc_path.write_text("\n\n".join(self.sections) + "\n", encoding="utf-8")
+            written.append(alloc_path)
+        return written
+
+
+# 当前进程中正在进行的会话（cProfile 不支持同一线程内嵌套启用）
+_active_session: Optional[_ProfileSession] = None
+
+
+@contextmanager
+def _session(entry: str, output_dir: Optional[Path]) -> Iterator[None]:
+    global _active_session
+    mode = get_profile_mode()
+    if mode == "off" or _active_session is not None:
+        yield
+        return
+
+    session = _ProfileSession(entry, mode, Path(output_dir) if output_dir else get_profile_dir())
+    _active_session = session
+    session.start()
+    try:
+        yield
+    finally:
+        _active_session = None
+        try:
+            paths = session.stop()
+            pipeline_logger.profile_saved(entry, mode, [str(p) for p in paths])
+        except Exception as e:
+            pipeline_logger.profile_error(entry, mode, str(e))
+
+
+def profiled(
+    entry: str,
+    output_dir_arg: Optional[str] = None,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    为异步入口函数开启剖析会话（AGENTIC_PROFILE 未设置时直接调用原函数）
+
+    Args:
+        entry: 报告文件名前缀
+        output_dir_arg: 可选，入口函数中输出目录参数的名称，报告写在该目录下
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            if get_profile_mode() == "off" or _active_session is not None:
+                return await func(*args, **kwargs)
+            output_dir = None
+            if output_dir_arg is not None:
+                output_dir = signature.bind_partial(*args, **kwargs).arguments.get(output_dir_arg)
+            with _session(entry, output_dir):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def profile_stage(stage: str) -> Iterator[None]:
+    """在 alloc 会话中记录一个阶段的新增内存分配；其他情况下不做任何事"""
+    session = _active_session
+    if session is None or session.mode != "alloc":
+        yield
+        return
+    before = _snapshot()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        session.record_stage(stage, before, time.perf_counter() - start)
@@ -0,0 +1,118 @@
+"""
+[INPUT]: Agent 实例 (instructions, tools, handoffs, output_type)
+[OUTPUT]: static_prefix, prefix_fingerprint, prompt_cache_key, with_prompt_cache_key, get_prefix_versions
+[POS]: agentic/utils 的 prompt 前缀缓存工具，保证每个 agent 的静态前缀稳定、可版本化
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 utils/.folder.md 的描述是否仍然准确。
+
+背景:
+    Provider 的 prompt caching 只对「字节完全一致且位于最前面」的前缀生效。
+    每个 agent 的请求布局约定为:
+        [instructions + tools + handoffs + output schema]  ← 静态前缀，按 agent 固定
+        [本次请求的可变内容]                                ← 只出现在 user input 中
+    本模块对静态前缀做规范化序列化并计算指纹，作为 prompt_cache_key 传给模型，
+    使同一 agent 的所有请求路由到同一缓存；前缀一旦变化，key 随之变化。
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import re
+from typing import Any, Dict
+
+from .client import _get_env_value, _parse_bool
+
+# 请求布局版本：调整「静态前缀 / 可变内容」的划分方式时递增
+PREFIX_LAYOUT_VERSION = "1"
+
+# agent 名称 -> prompt_cache_key
+_PREFIX_VERSIONS: Dict[str, str] = {}
+
+
+def _schema_of(obj: Any) -> Any:
+    """提取 output_type 的 JSON Schema（无法获取时返回名称）"""
+    if obj is None:
+        return None
+    json_schema = getattr(obj, "json_schema", None)
+    if callable(json_schema):
+        try:
+            return json_schema()
+        except Exception:
+            pass
+    model_json_schema = getattr(obj, "model_json_schema", None)
+    if callable(model_json_schema):
+        return model_json_schema()
+    return getattr(obj, "__name__", repr(obj))
+
+
+def static_prefix(agent: Any) -> str:
+    """将 agent 的静态前缀规范化为字符串
+
+    Raises:
+        ValueError: instructions 为动态函数时（无法保证前缀稳定）
+    """
+    if not isinstance(agent.instructions, str):
+        raise ValueError(
+            f"Agent '{agent.name}' uses dynamic instructions; "
+            "per-request content must go into the input, not the instructions."
+        )
+
+    tools = [
+        {
+            "name": tool.name,
+            "description": getattr(tool, "description", ""),
+            "parameters": getattr(tool, "params_json_schema", None),
+        }
+        for tool in agent.tools
+    ]
+    handoffs = [
+        {
+            "name": getattr(h, "name", None) or getattr(h, "agent_name", ""),
+            "description": getattr(h, "handoff_description", None)
+            or getattr(h, "tool_description", ""),
+        }
+        for h in agent.handoffs
+    ]
+    payload = {
+        "instructions": agent.instructions,
+        "tools": tools,
+        "handoffs": handoffs,
+        "output_schema": _schema_of(agent.output_type),
+    }
+    return json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+
+
+def prefix_fingerprint(agent: Any) -> str:
+    """静态前缀的短指纹"""
+    return hashlib.sha256(static_prefix(agent).encode("utf-8")).hexdigest()[:12]
+
+
+def prompt_cache_key(agent: Any) -> str:
+    """agent 的 prompt_cache_key，格式: agentic:<agent>:v<layout>:<fingerprint>"""
+    slug = re.sub(r"[^a-z0-9]+", "-", agent.name.lower()).strip("-")
+    return f"agentic:{slug}:v{PREFIX_LAYOUT_VERSION}:{prefix_fingerprint(agent)}"
+
+
+def with_prompt_cache_key(agent: Any) -> Any:
+    """返回带 prompt_cache_key 的 agent 副本
+
+    AGENTIC_PROMPT_CACHE_KEY=false 时原样返回（如 provider 不支持该参数）。
+    """
+    key = prompt_cache_key(agent)
+    _PREFIX_VERSIONS[agent.name] = key
+
+    if not _parse_bool(_get_env_value("AGENTIC_PROMPT_CACHE_KEY"), True):
+        return agent
+
+    settings = agent.model_settings
+    extra_args = {**(settings.extra_args or {}), "prompt_cache_key": key}
+    return agent.clone(model_settings=dataclasses.replace(settings, extra_args=extra_args))
+
+
+def get_prefix_versions() -> Dict[str, str]:
+    """获取各 agent 当前静态前缀的版本（prompt_cache_key）"""
+    return dict(_PREFIX_VERSIONS)
@@ -0,0 +1,33 @@
+"""
+[INPUT]: prompts/ 目录下的 Markdown 文件
+[OUTPUT]: load_prompt(name) -> str
+[POS]: agentic/utils 的 prompt 加载工具，让 agent 指令与代码逻辑分离
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 utils/.folder.md 的描述是否仍然准确。
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+
+# prompt 目录
+PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
+
+
+@lru_cache(maxsize=None)
+def load_prompt(name: str) -> str:
+    """读取 prompts/<name>.md 的内容
+
+    Args:
+        name: prompt 名称，与 agent 模块名对应（如 "chart_agent"）
+
+    Returns:
+        prompt 文本
+    """
+    path = PROMPTS_DIR / f"{name}.md"
+    if not path.exists():
+        raise FileNotFoundError(f"Prompt not found: {path}")
+    return path.read_text(encoding="utf-8")
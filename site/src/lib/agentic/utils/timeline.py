@@ -0,0 +1,223 @@
+"""
+[INPUT]: pipeline 各阶段的开始/结束时刻，Runner.run 的 agent / llm / tool / handoff 回调
+[OUTPUT]: TimelineRecorder, TimelineHooks, trace_span, record_span, set_track, intent_track, timeline_hooks, get_recorder, get_trace_dir
+[POS]: agentic/utils 的时间线记录器，导出 Chrome Trace Event JSON（可在 Perfetto / chrome://tracing 打开）
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 utils/.folder.md 的描述是否仍然准确。
+
+轨道布局:
+    tid 0        pipeline: process_article, segmentation
+    tid i + 1    intent i: queued, select_template, Runner.run, agent / llm / tool, handoff, DSL, render
+
+使用方式:
+    with TimelineRecorder() as recorder:
+        segmentation, results = await process_article_with_segmentation(text)
+        await render_selections(results, out_dir)
+    recorder.save("trace.json")
+
+    # 或设置 AGENTIC_TRACE_DIR，process_article 会自动为每篇文章写一个 trace 文件
+
+未启用记录器时 trace_span 只做一次 ContextVar 读取。
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from agents import RunHooks
+
+from .client import _get_env_value
+
+PIPELINE_TRACK = 0
+
+_recorder: ContextVar[Optional["TimelineRecorder"]] = ContextVar("agentic_timeline", default=None)
+_track: ContextVar[int] = ContextVar("agentic_timeline_track", default=PIPELINE_TRACK)
+
+
+def _now_us() -> float:
+    return time.time() * 1_000_000
+
+
+class TimelineRecorder:
+    """收集 Chrome Trace Event；进入 with 块后对当前上下文及其派生的 asyncio 任务生效"""
+
+    def __init__(self, name: str = "agentic pipeline") -> None:
+        self.name = name
+        self.events: List[Dict[str, Any]] = []
+        self._tracks: Dict[int, str] = {PIPELINE_TRACK: "pipeline"}
+        self._token: Optional[Token] = None
+
+    def __enter__(self) -> TimelineRecorder:
+        self._token = _recorder.set(self)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._token is not None:
+            _recorder.reset(self._token)
+            self._token = None
+
+    def name_track(self, tid: int, name: str) -> None:
+        self._tracks[tid] = name
+
+    def complete(
+        self,
+        name: str,
+        start_us: float,
+        end_us: float,
+        cat: str,
+        tid: int,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": start_us,
+            "dur": max(end_us - start_us, 0.0),
+            "pid": 1,
+            "tid": tid,
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def instant(self, name: str, cat: str, tid: int, args: Optional[Dict[str, Any]] = None) -> None:
+        event = {"name": name, "cat": cat, "ph": "i", "s": "t", "ts": _now_us(), "pid": 1, "tid": tid}
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def to_dict(self) -> Dict[str, Any]:
+        metadata = [{"name": "process_name", "ph": "M", "pid": 1, "args": {"name": self.name}}]
+        for tid, name in sorted(self._tracks.items()):
+            metadata.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": name}})
+            metadata.append(
+                {"name": "thread_sort_index", "ph": "M", "pid": 1, "tid": tid, "args": {"sort_index": tid}}
+            )
+        return {"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}
+
+    def save(self, path: Union[str, os.PathLike]) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), ensure_ascii=False, default=str), encoding="utf-8")
+        return path
+
+
+def intent_track(index: int) -> int:
+    """intent i 所在的轨道 id"""
+    return index + 1
+
+
+def get_recorder() -> Optional[TimelineRecorder]:
+    """当前上下文中启用的记录器"""
+    return _recorder.get()
+
+
+def set_track(tid: int, name: str) -> None:
+    """把当前上下文（通常是一个 intent 的 asyncio 任务）切换到指定轨道"""
+    recorder = _recorder.get()
+    if recorder is None:
+        return
+    recorder.name_track(tid, name)
+    _track.set(tid)
+
+
+@contextmanager
+def trace_span(
+    name: str,
+    cat: str = "pipeline",
+    track: Optional[int] = None,
+    **args: Any,
+) -> Iterator[Dict[str, Any]]:
+    """
+    记录一个 span；yield 的 dict 可在块内补充 args（如结果 category）
+
+    track 为空时写入当前上下文的轨道；串行循环（如 render_selections）可显式指定。
+    """
+    recorder = _recorder.get()
+    if recorder is None:
+        yield args
+        return
+    tid = _track.get() if track is None else track
+    start = _now_us()
+    try:
+        yield args
+    finally:
+        recorder.complete(name, start, _now_us(), cat, tid, args)
+
+
+def record_span(name: str, start: float, end: float, cat: str = "pipeline", **args: Any) -> None:
+    """记录已知起止时刻（time.time() 秒）的 span，如排队等待"""
+    recorder = _recorder.get()
+    if recorder is not None:
+        recorder.complete(name, start * 1_000_000, end * 1_000_000, cat, _track.get(), args)
+
+
+class TimelineHooks(RunHooks):
+    """把 Runner.run 内部的 agent / llm / tool / handoff 事件写入当前轨道"""
+
+    def __init__(self, recorder: TimelineRecorder, tid: int) -> None:
+        self.recorder = recorder
+        self.tid = tid
+        self._open: Dict[Tuple[str, str], float] = {}
+
+    def _begin(self, cat: str, name: str) -> None:
+        self._open[(cat, name)] = _now_us()
+
+    def _end(self, cat: str, name: str, label: str, args: Optional[Dict[str, Any]] = None) -> None:
+        start = self._open.pop((cat, name), None)
+        if start is not None:
+            self.recorder.complete(label, start, _now_us(), cat, self.tid, args)
+
+    async def on_agent_start(self, context, agent) -> None:
+        self._begin("agent", agent.name)
+
+    async def on_agent_end(self, context, agent, output) -> None:
+        self._end("agent", agent.name, agent.name)
+
+    async def on_llm_start(self, context, agent, system_prompt, input_items) -> None:
+        self._begin("llm", agent.name)
+
+    async def on_llm_end(self, context, agent, response) -> None:
+        usage = response.usage
+        self._end(
+            "llm",
+            agent.name,
+            f"llm: {agent.name}",
+            {"input_tokens": usage.input_tokens, "output_tokens": usage.output_tokens},
+        )
+
+    async def on_tool_start(self, context, agent, tool) -> None:
+        self._begin("tool", tool.name)
+
+    async def on_tool_end(self, context, agent, tool, result) -> None:
+        self._end("tool", tool.name, f"tool: {tool.name}")
+
+    async def on_handoff(self, context, from_agent, to_agent) -> None:
+        # handoff 之后不会再有 from_agent 的 on_agent_end，在此收尾
+        self._end("agent", from_agent.name, from_agent.name)
+        self.recorder.instant(
+            f"handoff → {to_agent.name}", "handoff", self.tid, {"from": from_agent.name}
+        )
+
+
+def timeline_hooks() -> Optional[TimelineHooks]:
+    """未启用记录器时返回 None，供 combine_hooks 过滤"""
+    recorder = _recorder.get()
+    if recorder is None:
+        return None
+    return TimelineHooks(recorder, _track.get())
+
+
+def get_trace_dir() -> Optional[Path]:
+    """AGENTIC_TRACE_DIR 设置时，process_article 自动为每篇文章写 trace 文件"""
+    value = _get_env_value("AGENTIC_TRACE_DIR")
+    return Path(value) if value else None
@@ -0,0 +1,251 @@
+"""
+[INPUT]: Runner.run 的生命周期回调 (on_llm_start / on_llm_end / on_handoff / on_tool_end)
+[OUTPUT]: ModelCallRecord, UsageTotals, ArticleUsage, UsageHooks, usage_stats, get_usage_stats
+[POS]: agentic/utils 的用量统计模块，按 agent / category / 文章聚合 token、prompt cache 命中率与模型调用延迟
+
+[PROTOCOL]:
+1. 一旦本文件逻辑变更，必须同步更新此 Header。
+2. 更新后必须上浮检查 utils/.folder.md 的描述是否仍然准确。
+
+使用方式:
+    usage = ArticleUsage()
+    await Runner.run(agent, text, hooks=UsageHooks(usage, stage="selection", index=0))
+    usage.summary()      # 单篇文章的明细
+    get_usage_stats()    # 进程级累计（metrics API）
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from agents import RunHooks
+
+from .logger import pipeline_logger
+from .metrics import metrics
+from .prompt_cache import get_prefix_versions
+
+
+@dataclass
+class ModelCallRecord:
+    """单次模型调用的用量记录"""
+
+    stage: str  # "segmentation" | "selection"
+    agent: str
+    input_tokens: int
+    output_tokens: int
+    cached_tokens: int
+    latency: float
+    index: Optional[int] = None
+    category: Optional[str] = None
+
+
+@dataclass
+class UsageTotals:
+    """一组模型调用的累计用量"""
+
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_tokens: int = 0
+    latency: float = 0.0
+
+    def add(self, record: ModelCallRecord) -> None:
+        self.calls += 1
+        self.input_tokens += record.input_tokens
+        self.output_tokens += record.output_tokens
+        self.cached_tokens += record.cached_tokens
+        self.latency += record.latency
+
+    def merge(self, other: UsageTotals) -> None:
+        self.calls += other.calls
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.cached_tokens += other.cached_tokens
+        self.latency += other.latency
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["latency"] = round(self.latency, 4)
+        data["cached_ratio"] = (
+            round(self.cached_tokens / self.input_tokens, 3) if self.input_tokens else 0.0
+        )
+        return data
+
+
+def _group(records: List[ModelCallRecord], key: str) -> Dict[Any, UsageTotals]:
+    groups: Dict[Any, UsageTotals] = {}
+    for record in records:
+        name = getattr(record, key)
+        if name is None:
+            name = "unknown"
+        groups.setdefault(name, UsageTotals()).add(record)
+    return groups
+
+
+class ArticleUsage:
+    """单篇文章的模型调用明细，由 pipeline 在各阶段写入"""
+
+    def __init__(self) -> None:
+        self.records: List[ModelCallRecord] = []
+
+    def add(self, record: ModelCallRecord) -> None:
+        self.records.append(record)
+
+    def assign_category(self, index: int, category: str) -> None:
+        """intent 完成后回填其 category（模型调用发生时 category 尚未确定）"""
+        for record in self.records:
+            if record.index == index:
+                record.category = category
+
+    def total(self) -> UsageTotals:
+        totals = UsageTotals()
+        for record in self.records:
+            totals.add(record)
+        return totals
+
+    def for_intent(self, index: int) -> UsageTotals:
+        totals = UsageTotals()
+        for record in self.records:
+            if record.index == index:
+                totals.add(record)
+        return totals
+
+    def by_agent(self) -> Dict[str, UsageTotals]:
+        return _group(self.records, "agent")
+
+    def by_category(self) -> Dict[str, UsageTotals]:
+        """按 category 聚合；segmentation 阶段的调用归入 "segmentation" """
+        groups: Dict[str, UsageTotals] = {}
+        for record in self.records:
+            if record.stage == "segmentation":
+                name = "segmentation"
+            else:
+                name = record.category or "unknown"
+            groups.setdefault(name, UsageTotals()).add(record)
+        return groups
+
+    def by_intent(self) -> Dict[int, UsageTotals]:
+        return {
+            index: totals
+            for index, totals in _group(
+                [r for r in self.records if r.index is not None], "index"
+            ).items()
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "total": self.total().to_dict(),
+            "by_agent": {k: v.to_dict() for k, v in self.by_agent().items()},
+            "by_category": {k: v.to_dict() for k, v in self.by_category().items()},
+            "by_intent": {k: v.to_dict() for k, v in self.by_intent().items()},
+        }
+
+
+class UsageHooks(RunHooks):
+    """Runner.run 的回调，为每次模型调用记录 token 与延迟
+
+    每个 Runner.run 使用独立的实例：同一次 run 内的模型调用是串行的，
+    因此一个开始时间槽即可计算单次调用延迟。
+    """
+
+    def __init__(
+        self,
+        usage: ArticleUsage,
+        stage: str,
+        index: Optional[int] = None,
+    ) -> None:
+        self.usage = usage
+        self.stage = stage
+        self.index = index
+        self._llm_started: Optional[float] = None
+
+    async def on_llm_start(self, context, agent, system_prompt, input_items) -> None:
+        self._llm_started = time.perf_counter()
+
+    async def on_llm_end(self, context, agent, response) -> None:
+        latency = 0.0
+        if self._llm_started is not None:
+            latency = time.perf_counter() - self._llm_started
+            self._llm_started = None
+
+        usage = response.usage
+        details = getattr(usage, "input_tokens_details", None)
+        record = ModelCallRecord(
+            stage=self.stage,
+            agent=agent.name,
+            input_tokens=usage.input_tokens or 0,
+            output_tokens=usage.output_tokens or 0,
+            cached_tokens=getattr(details, "cached_tokens", 0) or 0,
+            latency=latency,
+            index=self.index,
+        )
+        self.usage.add(record)
+        pipeline_logger.model_call(record)
+        metrics.prompt_cache_tokens.inc(record.cached_tokens, agent=record.agent, result="hit")
+        metrics.prompt_cache_tokens.inc(
+            max(record.input_tokens - record.cached_tokens, 0), agent=record.agent, result="miss"
+        )
+
+    async def on_handoff(self, context, from_agent, to_agent) -> None:
+        pipeline_logger.handoff(from_agent.name, to_agent.name)
+
+    async def on_tool_end(self, context, agent, tool, result) -> None:
+        pipeline_logger.tool_call(agent.name, tool.name, str(result))
+
+
+@dataclass
+class _StatsState:
+    articles: int = 0
+    total: UsageTotals = field(default_factory=UsageTotals)
+    by_agent: Dict[str, UsageTotals] = field(default_factory=dict)
+    by_category: Dict[str, UsageTotals] = field(default_factory=dict)
+
+
+class UsageStats:
+    """进程级用量累计，供监控或 API 读取"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._state = _StatsState()
+        self._last_article: Optional[Dict[str, Any]] = None
+
+    def record_article(self, usage: ArticleUsage) -> None:
+        summary = usage.summary()
+        with self._lock:
+            state = self._state
+            state.articles += 1
+            state.total.merge(usage.total())
+            for name, totals in usage.by_agent().items():
+                state.by_agent.setdefault(name, UsageTotals()).merge(totals)
+            for name, totals in usage.by_category().items():
+                state.by_category.setdefault(name, UsageTotals()).merge(totals)
+            self._last_article = summary
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            state = self._state
+            return {
+                "articles": state.articles,
+                "total": state.total.to_dict(),
+                "by_agent": {k: v.to_dict() for k, v in state.by_agent.items()},
+                "by_category": {k: v.to_dict() for k, v in state.by_category.items()},
+                "last_article": self._last_article,
+                "prefix_versions": get_prefix_versions(),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._state = _StatsState()
+            self._last_article = None
+
+
+# 默认累计实例
+usage_stats = UsageStats()
+
+
+def get_usage_stats() -> Dict[str, Any]:
+    """获取进程级用量累计快照（按 agent / category 聚合）"""
+    return usage_stats.snapshot()